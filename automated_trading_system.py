@@ -24,6 +24,11 @@ Features:
 import time
 import sys
 import os
+import heapq
+import itertools
+import logging
+import numpy as np
+from collections import deque
 from datetime import datetime, timedelta
 from colorama import Fore, Style, init
 
@@ -46,6 +51,13 @@ except ImportError as e:
     print("Make sure all modules are in the src/ directory")
     sys.exit(1)
 
+# Contrarian flip: BUY signals become SELL trades and vice versa
+_REVERSE = {"BUY": "SELL", "SELL": "BUY"}
+
+# _process_symbol default meaning "no batch result, generate the signal here"
+# (a batched None is a final "no signal")
+_NOT_BATCHED = object()
+
 
 class ContriarianTradingSystem:
     """
@@ -64,7 +76,7 @@ class ContriarianTradingSystem:
         self.config = TradingConfig()
         self.mt5 = MT5Connector()
         self.signal_generator = SignalGenerator(self.mt5, self.config)
-        self.telegram = TelegramNotifier()
+        self.telegram = TelegramNotifier(blocking=False)  # Notifications never stall the loop
         
         # Initialize AI enhancement modules
         print(f"{Fore.MAGENTA}🤖 Initializing AI Enhancement Systems...{Style.RESET_ALL}")
@@ -82,7 +94,8 @@ class ContriarianTradingSystem:
         self.symbol_daily_trades = {}  # Track daily trades per symbol
         self.running = False
         self.last_check_time = datetime.now()
-        self.signal_queue = []  # Queue for signal prioritization (professional risk management)
+        self.signal_queue = []  # Heap of (-strength, seq, signal) for signal prioritization (professional risk management)
+        self._signal_seq = itertools.count()  # FIFO tiebreaker for equal strengths
         self.last_reversal_check = {}  # Track last reversal check time per symbol
         
         # Session management for day trading
@@ -93,7 +106,7 @@ class ContriarianTradingSystem:
         # AI-specific tracking
         self.ai_enhancement_stats = {}
         self.correlation_conflicts = {}
-        self.portfolio_heat_history = []
+        self.portfolio_heat_history = deque(maxlen=100)
         
         # Display configuration
         self._display_config()
@@ -139,8 +152,9 @@ class ContriarianTradingSystem:
         self.running = False
         print(f"{Fore.YELLOW}🛑 Contrarian Trading System Stopped{Style.RESET_ALL}")
         
-        # Send shutdown notification
+        # Send shutdown notification (and let queued notifications go out before exit)
         self.telegram.send_system_status("SYSTEM STOPPED", "Contrarian trading system has been shut down")
+        self.telegram.flush()
         
     def _reset_daily_trades(self):
         """Reset daily trade counters at midnight."""
@@ -255,12 +269,7 @@ class ContriarianTradingSystem:
         Returns:
             str: Reversed signal ('SELL' for BUY, 'BUY' for SELL)
         """
-        if signal == "BUY":
-            return "SELL"
-        elif signal == "SELL":
-            return "BUY"
-        else:
-            return signal
+        return _REVERSE.get(signal, signal)
             
     def _calculate_volume_based_levels(self, symbol, action, entry_price, atr_value, signal_strength=7.0, volume_score=8.0):
         """
@@ -338,7 +347,8 @@ class ContriarianTradingSystem:
             'final_multiplier': volume_multiplier * strength_multiplier
         }
 
-    def _calculate_contrarian_levels(self, symbol, reversed_action, entry_price, atr_value, signal_strength=7.0):
+    def _calculate_contrarian_levels(self, symbol, reversed_action, entry_price, atr_value, signal_strength=7.0,
+                                     session_multiplier=None):
         """
         Calculate optimized TP/SL levels for day trading contrarian trades.
         
@@ -353,12 +363,15 @@ class ContriarianTradingSystem:
             entry_price (float): Entry price
             atr_value (float): ATR value
             signal_strength (float): Signal strength (affects target distances)
+            session_multiplier (float): Session multiplier (current session when None)
             
         Returns:
             dict: Optimized TP/SL levels for day trading
         """
         # Get pip value for the symbol
         pip_value = self._get_pip_value(symbol)
+        if session_multiplier is None:
+            session_multiplier = self._get_session_multiplier()
         
         if self.config.USE_FIXED_PIPS:
             # Use fixed pip targets for day trading
@@ -368,7 +381,6 @@ class ContriarianTradingSystem:
             tp3_distance = (self.config.FIXED_TP_PIPS * 3) * pip_value  # 30 pips
             
             # Adjust based on signal strength
-            session_multiplier = self._get_session_multiplier()
             strength_multiplier = self._get_strength_multiplier(signal_strength)
             final_multiplier = session_multiplier * strength_multiplier
             
@@ -379,7 +391,6 @@ class ContriarianTradingSystem:
             
         else:
             # Fallback to ATR-based system
-            session_multiplier = self._get_session_multiplier()
             strength_multiplier = self._get_strength_multiplier(signal_strength)
             
             base_sl_distance = atr_value * self.config.SL_ATR_MULTIPLIER
@@ -421,6 +432,65 @@ class ContriarianTradingSystem:
             'final_multiplier': final_multiplier
         }
     
+    def _calculate_contrarian_levels_batch(self, symbol, sides, entry_price, atr_value, signal_strengths,
+                                           session_multiplier=None):
+        """
+        Vectorized _calculate_contrarian_levels over many cases at once.
+        
+        Args:
+            symbol (str): Trading symbol
+            sides (array-like): +1 for contrarian BUY, -1 for SELL
+            entry_price (float or array-like): Entry price(s)
+            atr_value (float or array-like): ATR value(s)
+            signal_strengths (array-like): Signal strengths
+            session_multiplier (float): Session multiplier (current session when None)
+            
+        All array arguments broadcast against each other (e.g. strengths[:, None]
+        with sides[None, :] gives a strength x side grid).
+            
+        Returns:
+            dict: Same keys as _calculate_contrarian_levels, each an ndarray
+        """
+        sides = np.asarray(sides, dtype=np.float64)
+        entry_price = np.asarray(entry_price, dtype=np.float64)
+        atr_value = np.asarray(atr_value, dtype=np.float64)
+        signal_strengths = np.asarray(signal_strengths, dtype=np.float64)
+        pip_value = self._get_pip_value(symbol)
+        
+        if session_multiplier is None:
+            session_multiplier = self._get_session_multiplier()
+        strength_multiplier = self.config.STRENGTH_MULTIPLIER_LUT[
+            np.clip((signal_strengths * 10).astype(np.int64), 0, 100)]
+        final_multiplier = session_multiplier * strength_multiplier
+        
+        if self.config.USE_FIXED_PIPS:
+            # Fixed pip targets scaled by signal strength only, SL kept fixed
+            sl_distance = np.broadcast_to(self.config.FIXED_SL_PIPS * pip_value, atr_value.shape)
+            tp1_distance = self.config.FIXED_TP_PIPS * pip_value * strength_multiplier
+            tp2_distance = (self.config.FIXED_TP_PIPS * 2) * pip_value * strength_multiplier
+            tp3_distance = (self.config.FIXED_TP_PIPS * 3) * pip_value * strength_multiplier
+        else:
+            # ATR-based targets scaled by session and strength
+            sl_distance = atr_value * self.config.SL_ATR_MULTIPLIER
+            tp1_distance = atr_value * self.config.TP1_ATR_MULTIPLIER * final_multiplier
+            tp2_distance = atr_value * self.config.TP2_ATR_MULTIPLIER * final_multiplier
+            tp3_distance = atr_value * self.config.TP3_ATR_MULTIPLIER * final_multiplier
+        
+        # SL against the trade direction, TPs with it
+        return {
+            'sl_price': np.round(entry_price - sides * sl_distance, 5),
+            'tp1_price': np.round(entry_price + sides * tp1_distance, 5),
+            'tp2_price': np.round(entry_price + sides * tp2_distance, 5),
+            'tp3_price': np.round(entry_price + sides * tp3_distance, 5),
+            'sl_distance_pips': np.round(sl_distance / pip_value, 1),
+            'tp1_distance_pips': np.round(tp1_distance / pip_value, 1),
+            'tp2_distance_pips': np.round(tp2_distance / pip_value, 1),
+            'tp3_distance_pips': np.round(tp3_distance / pip_value, 1),
+            'session_multiplier': session_multiplier,
+            'strength_multiplier': strength_multiplier,
+            'final_multiplier': final_multiplier
+        }
+    
     def _get_pip_value(self, symbol):
         """Get pip value for symbol (0.0001 for most pairs, 0.01 for JPY pairs)."""
         if 'JPY' in symbol:
@@ -443,17 +513,7 @@ class ContriarianTradingSystem:
     def _get_session_multiplier(self):
         """Get multiplier based on current trading session."""
         session, _ = self.config.get_trading_session_info()
-        
-        multipliers = {
-            'ASIAN_SESSION': self.config.ASIAN_SESSION_MULTIPLIER,
-            'LONDON_PRE_MARKET': self.config.LONDON_SESSION_MULTIPLIER,
-            'LONDON_SESSION': self.config.LONDON_SESSION_MULTIPLIER,
-            'LONDON_NY_OVERLAP': self.config.OVERLAP_SESSION_MULTIPLIER,
-            'NY_SESSION': self.config.NY_SESSION_MULTIPLIER,
-            'QUIET_HOURS': self.config.ASIAN_SESSION_MULTIPLIER
-        }
-        
-        return multipliers.get(session, 1.0)
+        return self.config.SESSION_MULTIPLIERS.get(session, 1.0)
         
     def _calculate_lot_size(self, symbol, sl_distance_pips):
         """
@@ -479,16 +539,13 @@ class ContriarianTradingSystem:
             return 0.03  # Fallback to 0.03
             
     def _get_strength_multiplier(self, signal_strength):
-        """Get multiplier based on signal strength."""
-        if signal_strength >= 9.0:
-            return self.config.ULTRA_SIGNAL_MULTIPLIER
-        elif signal_strength >= 8.0:
-            return self.config.STRONG_SIGNAL_MULTIPLIER
-        elif signal_strength < 7.0:
-            return self.config.WEAK_SIGNAL_MULTIPLIER
-        else:
-            return 1.0  # Standard multiplier for 7.0-7.9 signals
+        """Get multiplier based on signal strength (1.0 for standard 7.0-7.9 signals)."""
+        return self.config.STRENGTH_MULTIPLIER_LUT.item(min(max(int(signal_strength * 10), 0), 100))
             
+    def _count_open_trades(self):
+        """Number of tracked trades that are still open."""
+        return sum(1 for t in self.active_trades.values() if t.get('status', 'open') == 'open')
+        
     def _can_open_new_trade(self):
         """Check if we can open a new trade based on professional limits."""
         # Check if daily profit target reached
@@ -500,7 +557,7 @@ class ContriarianTradingSystem:
             return False, f"Daily loss limit reached: ${self.daily_pnl:.2f}"
             
         # Check concurrent trades limit
-        current_trades = len([t for t in self.active_trades.values() if t.get('status', 'open') == 'open'])
+        current_trades = self._count_open_trades()
         if current_trades >= self.config.MAX_CONCURRENT_TRADES:
             return False, f"Max concurrent trades reached: {current_trades}/{self.config.MAX_CONCURRENT_TRADES}"
             
@@ -522,14 +579,32 @@ class ContriarianTradingSystem:
             'timestamp': datetime.now()
         }
         
-        # Add to queue
-        self.signal_queue.append(signal_entry)
-        
-        # Sort by strength (highest first) then by timestamp (earliest first)
-        self.signal_queue.sort(key=lambda x: (-x['strength'], x['timestamp']))
+        # Add to queue: strongest first, then earliest queued first
+        heapq.heappush(self.signal_queue, (-signal_strength, next(self._signal_seq), signal_entry))
         
         print(f"📊 Signal queued: {symbol} - {signal_strength:.1f}/10 (Queue size: {len(self.signal_queue)})")
         
+    def _add_signals_bulk(self, signals):
+        """Add several signals (each carrying its 'symbol') to the priority queue at once."""
+        now = datetime.now()
+        seq = self._signal_seq
+        self.signal_queue.extend(
+            (-signal.get('strength', 0), next(seq),
+             {'symbol': signal['symbol'], 'data': signal, 'strength': signal.get('strength', 0), 'timestamp': now})
+            for signal in signals
+        )
+        heapq.heapify(self.signal_queue)
+        
+        print(f"📊 Signals queued: {len(signals)} (Queue size: {len(self.signal_queue)})")
+        
+    def pop_best(self):
+        """Remove and return the highest priority queued signal."""
+        return heapq.heappop(self.signal_queue)[2]
+        
+    def peek_best(self):
+        """Return the highest priority queued signal without removing it."""
+        return self.signal_queue[0][2]
+        
     def _process_best_signal(self):
         """Process the highest priority signal from queue."""
         if not self.signal_queue:
@@ -542,7 +617,7 @@ class ContriarianTradingSystem:
             return
             
         # Get the best signal
-        best_signal = self.signal_queue.pop(0)
+        best_signal = self.pop_best()
         symbol = best_signal['symbol']
         signal_data = best_signal['data']
         signal_strength = best_signal['strength']
@@ -748,7 +823,8 @@ class ContriarianTradingSystem:
             return False
             
         volume_analysis = signal_data['volume_analysis']
-        volume_score = volume_analysis.get('combined_analysis', {}).get('score', 0)
+        combined_volume = volume_analysis.get('combined_analysis') or {}
+        volume_score = combined_volume.get('score', 0)
         
         # ONLY TRADE ON HIGH VOLUME CONFIRMATION
         if volume_score < 8.0:
@@ -765,19 +841,10 @@ class ContriarianTradingSystem:
         print(f"🎯 Direct Action: {Fore.GREEN if action == 'BUY' else Fore.RED}{action}{Style.RESET_ALL}")
         print(f"⭐ Signal Strength: {signal_strength}/10")
         
-        # Display volume patterns detected
-        if 'timeframe_analysis' in volume_analysis:
-            patterns = []
-            for tf, data in volume_analysis['timeframe_analysis'].items():
-                if data.get('price_volume_divergence', {}).get('detected', False):
-                    div_type = data['price_volume_divergence']['type']
-                    patterns.append(f"{tf} {div_type}")
-                if data.get('exhaustion_signal', {}).get('detected', False):
-                    exh_type = data['exhaustion_signal']['type']
-                    patterns.append(f"{tf} {exh_type}")
-            
-            if patterns:
-                print(f"📋 Volume Patterns: {', '.join(patterns)}")
+        # Display volume patterns detected (collected across timeframes by the volume analyzer)
+        patterns = combined_volume['patterns']
+        if patterns:
+            print(f"📋 Volume Patterns: {', '.join(patterns)}")
         
         # Get current market price
         tick = self.mt5.get_tick(symbol)
@@ -941,25 +1008,18 @@ class ContriarianTradingSystem:
             if rates is None or len(rates) < period + 1:
                 return None
                 
-            # Calculate True Range
-            high = rates['high']
-            low = rates['low']
-            close = rates['close']
-            
-            tr_list = []
-            for i in range(1, len(rates)):
-                tr1 = high[i] - low[i]
-                tr2 = abs(high[i] - close[i-1])
-                tr3 = abs(low[i] - close[i-1])
-                tr = max(tr1, tr2, tr3)
-                tr_list.append(tr)
+            # Calculate True Range (only the last `period` bars are needed)
+            high = rates['high'][-period:]
+            low = rates['low'][-period:]
+            prev_close = rates['close'][-period - 1:-1]
+            
+            tr = np.maximum(
+                high - low,
+                np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+            )
                 
             # Calculate ATR as simple moving average of True Range
-            if len(tr_list) >= period:
-                atr = sum(tr_list[-period:]) / period
-                return atr
-            else:
-                return None
+            return float(tr.sum()) / period
                 
         except Exception as e:
             print(f"❌ Error calculating ATR for {symbol}: {e}")
@@ -1027,12 +1087,13 @@ class ContriarianTradingSystem:
             print(f"❌ Error placing order: {e}")
             return False
             
-    def _process_symbol(self, symbol):
+    def _process_symbol(self, symbol, signal_data=_NOT_BATCHED):
         """Process a single symbol for contrarian trading signals with AI enhancement."""
         try:
             # Check if we can open new trades (global limit)
-            if not self._can_open_new_trade():
-                print(f"⚠️ Cannot open new trade - limit reached or daily drawdown exceeded")
+            can_open, reason = self._can_open_new_trade()
+            if not can_open:
+                print(f"⚠️ Cannot open new trade - {reason}")
                 return
                 
             # Check if we can trade this symbol today
@@ -1042,8 +1103,9 @@ class ContriarianTradingSystem:
                 
             print(f"🔍 Analyzing {symbol} with AI Enhancement...")
             
-            # Generate initial signal
-            signal_data = self.signal_generator.generate_live_day_trading_signal(symbol)
+            # Generate initial signal (unless it came from the batch)
+            if signal_data is _NOT_BATCHED:
+                signal_data = self.signal_generator.generate_live_day_trading_signal(symbol)
             
             if not signal_data:
                 print(f"❌ {symbol}: No signal data received")
@@ -1108,7 +1170,7 @@ class ContriarianTradingSystem:
         
         # Process up to 2 best signals if we can open trades
         trades_to_execute = min(len(self.signal_queue), self.config.MAX_CONCURRENT_TRADES)
-        current_trades = len([t for t in self.active_trades.values() if t.get('status', 'open') == 'open'])
+        current_trades = self._count_open_trades()
         available_slots = self.config.MAX_CONCURRENT_TRADES - current_trades
         
         if available_slots <= 0:
@@ -1138,28 +1200,14 @@ class ContriarianTradingSystem:
         if not self.active_trades:
             return
             
-        # Update portfolio heat with current positions
-        active_positions = []
-        for symbol, trade_info in self.active_trades.items():
-            active_positions.append({
-                'symbol': symbol,
-                'volume': trade_info.get('volume', 0.01),
-                'risk_amount': trade_info.get('risk_amount', self.config.FIXED_RISK_AMOUNT),
-                'type': 'buy' if trade_info.get('action') == 'BUY' else 'sell'
-            })
-        
-        # Update portfolio heat analysis (simplified)
-        if active_positions:
-            heat_analysis = {
-                'total_positions': len(active_positions),
-                'total_risk': len(active_positions) * self.config.FIXED_RISK_AMOUNT,
-                'heat_level': 'Cold' if len(active_positions) < 2 else 'Warm'
-            }
-            self.portfolio_heat_history.append(heat_analysis)
-            
-            # Keep only recent heat history
-            if len(self.portfolio_heat_history) > 100:
-                self.portfolio_heat_history = self.portfolio_heat_history[-100:]
+        # Update portfolio heat analysis (simplified: positions x fixed risk;
+        # the history deque keeps only the 100 most recent snapshots)
+        position_count = len(self.active_trades)
+        self.portfolio_heat_history.append({
+            'total_positions': position_count,
+            'total_risk': position_count * self.config.FIXED_RISK_AMOUNT,
+            'heat_level': 'Cold' if position_count < 2 else 'Warm'
+        })
         
         trades_to_remove = []
         
@@ -1402,6 +1450,16 @@ class ContriarianTradingSystem:
                 if self.active_trades:
                     print(f"📊 Active trades: {len(self.active_trades)}")
                 
+                # Generate signals for all tradeable symbols in one batch (rates prefetched)
+                batch_signals = {}
+                can_open, _ = self._can_open_new_trade()
+                if can_open:
+                    tradeable = [s for s in self.config.DEFAULT_SYMBOLS if self._can_trade_symbol(s)]
+                    try:
+                        batch_signals = self.signal_generator.generate_live_signals_batch(tradeable)
+                    except Exception as e:
+                        print(f"❌ Batch signal generation error: {e}")
+                
                 # Process each symbol and build priority queue
                 symbols_processed = 0
                 for symbol in self.config.DEFAULT_SYMBOLS:
@@ -1409,7 +1467,7 @@ class ContriarianTradingSystem:
                         break
                         
                     try:
-                        self._process_symbol(symbol)
+                        self._process_symbol(symbol, batch_signals.get(symbol, _NOT_BATCHED))
                         symbols_processed += 1
                     except Exception as e:
                         print(f"❌ Error with {symbol}: {e}")
@@ -1508,6 +1566,12 @@ def main():
     print(f"{Fore.MAGENTA}🔥 Features Portfolio Heat Tracking{Style.RESET_ALL}")
     print(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}\n")
     
+    # Signal generator details are logged at DEBUG (set DEBUG_SIGNALS=true to see them)
+    logging.basicConfig(
+        level=logging.DEBUG if TradingConfig.DEBUG_SIGNALS else logging.INFO,
+        format='%(message)s'
+    )
+    
     # Create and run the system
     system = ContriarianTradingSystem()
     system.run()
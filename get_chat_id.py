@@ -30,8 +30,11 @@ def get_chat_id():
     # Get updates from Telegram
     url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
     
+    # One session so the test notification below reuses the TLS connection
+    session = requests.Session()
+    
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         data = response.json()
         
         if data.get('ok') and data.get('result'):
@@ -74,7 +77,7 @@ def get_chat_id():
                             'parse_mode': 'HTML'
                         }
                         
-                        test_response = requests.post(test_url, json=test_data, timeout=10)
+                        test_response = session.post(test_url, json=test_data, timeout=10)
                         if test_response.json().get('ok'):
                             print(f"✅ Test notification sent successfully!")
                             print(f"📱 Check your Telegram for the test message")
@@ -93,6 +96,8 @@ def get_chat_id():
             
     except Exception as e:
         print(f"❌ Connection error: {e}")
+    finally:
+        session.close()
 
 if __name__ == "__main__":
     get_chat_id()
@@ -0,0 +1,24 @@
+"""
+Console output helpers shared by the standalone test scripts.
+"""
+
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+
+@contextmanager
+def batched_stdout():
+    """
+    Buffer everything printed inside the block and write it to stdout in one go.
+    
+    Only for scripts that finish quickly - output is hidden until the block ends,
+    so scripts waiting on MT5 or the network should print directly.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
@@ -5,8 +5,11 @@ Trading Configuration for Contrarian System
 Central configuration with the EXACT settings that worked successfully.
 """
 
+import functools
 import os
 from datetime import datetime
+
+import numpy as np
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -16,6 +19,10 @@ load_dotenv()
 class TradingConfig:
     """Trading Configuration Class - Exact working settings"""
     
+    # Settings are class attributes; instances carry no __dict__, so they are
+    # read-only views that resolve every setting straight from the class
+    __slots__ = ()
+    
     # ===== MT5 CONNECTION SETTINGS =====
     @staticmethod
     def _get_mt5_login():
@@ -134,6 +141,24 @@ class TradingConfig:
     NY_SESSION_MULTIPLIER = 1.1     # Slight extension during NY session
     OVERLAP_SESSION_MULTIPLIER = 1.3 # Maximum extension during overlaps
     
+    # Multiplier lookup tables (built once from the values above)
+    # Strength multiplier per tenth of a point: index = int(strength * 10), clamped to 0..100
+    STRENGTH_MULTIPLIER_LUT = np.concatenate((
+        np.full(70, WEAK_SIGNAL_MULTIPLIER),    # Below 7.0
+        np.full(10, 1.0),                       # 7.0-7.9: standard
+        np.full(10, STRONG_SIGNAL_MULTIPLIER),  # 8.0-8.9
+        np.full(11, ULTRA_SIGNAL_MULTIPLIER),   # 9.0-10.0
+    ))
+    # Target multiplier per get_trading_session_info() session name
+    SESSION_MULTIPLIERS = {
+        'ASIAN_SESSION': ASIAN_SESSION_MULTIPLIER,
+        'LONDON_PRE_MARKET': LONDON_SESSION_MULTIPLIER,
+        'LONDON_SESSION': LONDON_SESSION_MULTIPLIER,
+        'LONDON_NY_OVERLAP': OVERLAP_SESSION_MULTIPLIER,
+        'NY_SESSION': NY_SESSION_MULTIPLIER,
+        'QUIET_HOURS': ASIAN_SESSION_MULTIPLIER,
+    }
+    
     # ===== TIME MANAGEMENT =====
     
     # Trading Sessions (UTC Times)
@@ -172,6 +197,10 @@ class TradingConfig:
     NOTIFY_DAILY_SUMMARY = True     # Send daily summary
     NOTIFY_PROFIT_TARGETS = True    # Notify when TP/SL hit
     
+    # ===== LOGGING =====
+    
+    DEBUG_SIGNALS = os.getenv('DEBUG_SIGNALS', 'False').lower() == 'true'  # Per-timeframe signal details
+    
     @classmethod
     def display_config(cls):
         """Display current configuration."""
@@ -218,3 +247,9 @@ class TradingConfig:
 # Legacy compatibility for any old imports
 Config = TradingConfig
 DayTradingConfig = TradingConfig
+
+
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """Shared configuration instance (built once per process)."""
+    return Config()
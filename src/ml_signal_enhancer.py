@@ -6,6 +6,8 @@ continuous learning, and sophisticated feature engineering.
 """
 
 import os
+import math
+import time
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -45,6 +47,13 @@ class MLSignalEnhancer:
         self.ml_available = ML_AVAILABLE
         self.model_path = "models/"
         
+        # Tick cache shared across symbols (refreshed in one batch)
+        self.tick_cache = {}
+        self.tick_cache_time = 0.0
+        self.tick_cache_ttl = 10.0  # Seconds before ticks are re-fetched
+        self.tick_symbols = set()
+        self.spread_history = {}
+        
         # Ensure models directory exists
         os.makedirs(self.model_path, exist_ok=True)
         
@@ -175,7 +184,8 @@ class MLSignalEnhancer:
             features.extend(self._extract_time_features())
             
             # 4. Volatility and momentum features (4 features)
-            features.extend(self._extract_volatility_features(symbol))
+            h1_bars = market_data.get('H1', []) if market_data else []
+            features.extend(self._extract_volatility_features(symbol, h1_bars))
             
             # 5. Inter-market features (2 features)
             features.extend(self._extract_intermarket_features(symbol))
@@ -276,25 +286,53 @@ class MLSignalEnhancer:
             np.sin(2 * np.pi * now.hour / 24),  # Cyclical hour
         ]
     
-    def _extract_volatility_features(self, symbol):
+    def _get_cached_tick(self, symbol):
+        """Get tick from the shared cache, refreshing all known symbols in one batch."""
+        self.tick_symbols.add(symbol)
+        now = time.monotonic()
+        
+        if symbol not in self.tick_cache or now - self.tick_cache_time > self.tick_cache_ttl:
+            self.tick_cache = self.mt5.get_ticks_batch(self.tick_symbols)
+            self.tick_cache_time = now
+        
+        return self.tick_cache.get(symbol)
+    
+    def _extract_volatility_features(self, symbol, h1_bars=None):
         """Extract volatility and momentum features."""
         try:
             if not self.mt5:
                 return [0] * 4
             
-            # Get recent tick data for volatility analysis
-            tick = self.mt5.get_tick(symbol)
-            if not tick:
+            # Spread from batched tick data, falling back to last known spread
+            tick = self._get_cached_tick(symbol)
+            history = self.spread_history.setdefault(symbol, [])
+            if tick and tick.bid > 0:
+                spread = abs(tick.ask - tick.bid) / tick.bid
+                history.append(spread)
+                if len(history) > 100:
+                    del history[:-100]
+            elif history:
+                spread = history[-1]
+            else:
                 return [0] * 4
             
-            # Simple volatility proxies
-            spread = abs(tick.ask - tick.bid) / tick.bid if tick.bid > 0 else 0
+            # ATR and momentum from the H1 bars already fetched for market features
+            atr = 0
+            momentum = 0
+            if h1_bars is not None and len(h1_bars) > 15:
+                high = h1_bars['high']
+                low = h1_bars['low']
+                close = h1_bars['close']
+                tr = np.maximum(high[1:] - low[1:],
+                                np.maximum(np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])))
+                atr = tr[-14:].mean() / close[-1] * 10000  # Relative ATR in pips
+                momentum = (close[-1] - close[-15]) / close[-15]
             
             return [
                 spread * 10000,  # Spread in pips
-                tick.volume if hasattr(tick, 'volume') else 0,  # Volume
-                0,  # Placeholder for ATR
-                0,  # Placeholder for momentum
+                tick.volume if tick is not None and hasattr(tick, 'volume') else 0,  # Volume
+                atr,
+                momentum,
             ]
             
         except Exception:
@@ -319,14 +357,19 @@ class MLSignalEnhancer:
             # If trained models exist for this symbol
             if symbol in self.models:
                 ensemble = self.models[symbol]
+                features_row = np.asarray(features, dtype=np.float64).reshape(1, -1)
+                scaled_by_scaler = {}  # Models sharing a scaler reuse one transform
                 
                 for model_name, model_data in ensemble.items():
                     if 'model' in model_data and 'scaler' in model_data:
                         scaler = model_data['scaler']
                         model = model_data['model']
                         
-                        # Scale features and predict
-                        scaled_features = scaler.transform([features])
+                        # Scale features once per distinct scaler and predict
+                        scaled_features = scaled_by_scaler.get(id(scaler))
+                        if scaled_features is None:
+                            scaled_features = scaler.transform(features_row)
+                            scaled_by_scaler[id(scaler)] = scaled_features
                         pred = model.predict(scaled_features)[0]
                         predictions[model_name] = max(0, min(10, pred))
             
@@ -412,7 +455,7 @@ class MLSignalEnhancer:
                 return original
             
             # Calculate weighted average of ML predictions
-            ml_avg = np.mean(list(ml_scores.values()))
+            ml_avg, _ = self._mean_std_small(ml_scores.values())
             
             # Combine: 50% original, 50% ML average
             combined = (original * 0.5) + (ml_avg * 0.5)
@@ -422,6 +465,23 @@ class MLSignalEnhancer:
         except Exception:
             return original
     
+    def _mean_std_small(self, values):
+        """Mean and population std of a handful of scores without numpy dispatch."""
+        total = 0.0
+        total_sq = 0.0
+        count = 0
+        for value in values:
+            total += value
+            total_sq += value * value
+            count += 1
+        
+        if count == 0:
+            return 0.0, 0.0
+        
+        mean = total / count
+        variance = max(0.0, total_sq / count - mean * mean)
+        return mean, math.sqrt(variance)
+    
     def _calculate_ml_confidence(self, ml_scores, features):
         """Calculate confidence level for ML predictions."""
         try:
@@ -429,8 +489,7 @@ class MLSignalEnhancer:
             
             # Higher confidence with more models agreeing
             if len(ml_scores) > 1:
-                scores = list(ml_scores.values())
-                std_dev = np.std(scores)
+                _, std_dev = self._mean_std_small(ml_scores.values())
                 agreement_bonus = max(0, 20 - std_dev * 4)
                 base_confidence += agreement_bonus
             
@@ -517,13 +576,13 @@ class MLSignalEnhancer:
             # Initialize ensemble for this symbol
             self.models[symbol] = {}
             
+            # One scaler shared by every model so inference scales features once
+            scaler = StandardScaler()
+            X_scaled = scaler.fit_transform(X)
+            
             # Train each model in ensemble
             for model_name, model_template in self.model_templates.items():
                 try:
-                    # Initialize scaler and model
-                    scaler = StandardScaler()
-                    X_scaled = scaler.fit_transform(X)
-                    
                     # Create fresh model instance
                     model = model_template.__class__(**model_template.get_params())
                     
@@ -534,6 +593,9 @@ class MLSignalEnhancer:
                     # Train on full dataset
                     model.fit(X_scaled, y)
                     
+                    # Shrink fitted parameters for faster inference
+                    self._downcast_model(model, scaler)
+                    
                     # Store model and scaler
                     self.models[symbol][model_name] = {
                         'model': model,
@@ -556,6 +618,30 @@ class MLSignalEnhancer:
             print(f"❌ Training error for {symbol}: {e}")
             return False
     
+    def _downcast_model(self, model, scaler):
+        """Downcast fitted model and scaler parameters to float32."""
+        try:
+            # Scaler statistics
+            if hasattr(scaler, 'mean_'):
+                scaler.mean_ = scaler.mean_.astype(np.float32)
+            if hasattr(scaler, 'scale_'):
+                scaler.scale_ = scaler.scale_.astype(np.float32)
+            
+            # MLP weights and biases
+            if hasattr(model, 'coefs_'):
+                model.coefs_ = [c.astype(np.float32) for c in model.coefs_]
+                model.intercepts_ = [b.astype(np.float32) for b in model.intercepts_]
+            
+            # Linear coefficients
+            elif hasattr(model, 'coef_'):
+                model.coef_ = np.asarray(model.coef_, dtype=np.float32)
+                model.intercept_ = np.float32(model.intercept_)
+            
+            # Tree ensembles keep float64 nodes (required by sklearn's Tree)
+            
+        except Exception as e:
+            print(f"⚠️ Model downcast skipped: {e}")
+    
     def _save_models(self, symbol):
         """Save trained models to disk."""
         try:
@@ -5,6 +5,8 @@ MetaTrader 5 Connector
 Simple, reliable MT5 connection handler for the contrarian trading system.
 """
 
+import threading
+import time
 import MetaTrader5 as mt5
 from colorama import Fore, Style
 
@@ -20,10 +22,31 @@ class MT5Connector:
         """Initialize MT5 connector."""
         self.connected = False
         
+        # The MetaTrader5 package is not safe for concurrent calls, so terminal
+        # requests made from worker threads run one at a time under this lock
+        self._lock = threading.Lock()
+        
+        # Terminal probe cache for is_connected()
+        self.connection_check_ttl = 1.0  # Seconds between terminal probes
+        self._last_check_ts = 0.0
+        self._last_check_result = False
+        
+        # Short-lived market data caches: key -> (monotonic timestamp, value)
+        self.rates_cache_ttl = 1.0   # Seconds a rates array stays fresh
+        self.tick_cache_ttl = 0.2    # Seconds a tick stays fresh
+        self.max_cache_entries = 512
+        self._rates_cache = {}
+        self._tick_cache = {}
+        
+        # Symbol specifications (digits, point, contract/volume limits) do not change
+        # during a session, so each symbol's info is fetched once
+        self._symbol_info_cache = {}
+        
     def connect(self, login=None, password=None, server=None):
         """Connect to MT5."""
         try:
-            if not mt5.initialize():
+            # Reuse an already initialized terminal session instead of repeating the handshake
+            if mt5.terminal_info() is None and not mt5.initialize():
                 print(f"❌ MT5 initialization failed: {mt5.last_error()}")
                 return False
             
@@ -33,6 +56,7 @@ class MT5Connector:
                     return False
             
             self.connected = True
+            self._last_check_ts = 0.0
             print(f"{Fore.GREEN}✅ MT5 connected successfully{Style.RESET_ALL}")
             return True
             
@@ -45,28 +69,86 @@ class MT5Connector:
         try:
             mt5.shutdown()
             self.connected = False
+            self._last_check_ts = 0.0
             print(f"{Fore.YELLOW}🔌 MT5 disconnected{Style.RESET_ALL}")
         except Exception as e:
             print(f"❌ MT5 disconnect error: {str(e)}")
     
     def get_symbol_info(self, symbol):
-        """Get symbol information."""
+        """Get symbol information (fetched once per symbol - use get_tick for live prices)."""
+        info = self._symbol_info_cache.get(symbol)
+        if info is not None:
+            return info
+        
         try:
-            return mt5.symbol_info(symbol)
+            with self._lock:
+                info = mt5.symbol_info(symbol)
+            if info is not None:
+                self._symbol_info_cache[symbol] = info
+            return info
         except Exception as e:
             print(f"❌ Error getting symbol info for {symbol}: {str(e)}")
             return None
     
+    def select_symbols(self, symbols):
+        """
+        Add symbols to Market Watch and cache their info before the first data requests.
+        
+        Returns:
+            list: Symbols that could be selected
+        """
+        selected = []
+        for symbol in symbols:
+            try:
+                with self._lock:
+                    ok = mt5.symbol_select(symbol, True)
+            except Exception as e:
+                print(f"❌ Error selecting {symbol}: {str(e)}")
+                continue
+            if ok and self.get_symbol_info(symbol) is not None:
+                selected.append(symbol)
+            else:
+                print(f"❌ Failed to select symbol {symbol}")
+        return selected
+    
     def get_tick(self, symbol):
-        """Get current tick for symbol."""
+        """Get current tick for symbol (cached for tick_cache_ttl seconds)."""
+        now = time.monotonic()
+        cached = self._tick_cache.get(symbol)
+        if cached is not None and now - cached[0] < self.tick_cache_ttl:
+            return cached[1]
+        
         try:
-            return mt5.symbol_info_tick(symbol)
+            with self._lock:
+                tick = mt5.symbol_info_tick(symbol)
+            if tick is not None:
+                self._store(self._tick_cache, symbol, now, tick)
+            return tick
         except Exception as e:
             print(f"❌ Error getting tick for {symbol}: {str(e)}")
             return None
     
+    def get_ticks_batch(self, symbols):
+        """Get current ticks for several symbols in one pass."""
+        ticks = {}
+        for symbol in symbols:
+            try:
+                with self._lock:
+                    tick = mt5.symbol_info_tick(symbol)
+                if tick is not None:
+                    ticks[symbol] = tick
+            except Exception as e:
+                print(f"❌ Error getting tick for {symbol}: {str(e)}")
+        return ticks
+    
     def get_rates(self, symbol, timeframe, count):
-        """Get historical rates."""
+        """Get historical rates (cached for rates_cache_ttl seconds, returned as a copy)."""
+        key = (symbol, timeframe, count)
+        now = time.monotonic()
+        cached = self._rates_cache.get(key)
+        if cached is not None and now - cached[0] < self.rates_cache_ttl:
+            return cached[1].copy()
+        
         try:
             # Convert string timeframe to MT5 constant
             timeframe_map = {
@@ -86,14 +168,47 @@ class MT5Connector:
             else:
                 tf = timeframe
                 
-            return mt5.copy_rates_from_pos(symbol, tf, 0, count)
+            with self._lock:
+                rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
+            if rates is not None:
+                self._store(self._rates_cache, key, now, rates)
+                return rates.copy()
+            return rates
         except Exception as e:
             print(f"❌ Error getting rates for {symbol}: {str(e)}")
             return None
     
+    def fetch_rates_bundle(self, symbol, timeframes):
+        """
+        Fetch several timeframes of one symbol, once each, for analyses that share them.
+        
+        Args:
+            symbol (str): Trading symbol
+            timeframes: (timeframe, count) pairs
+            
+        Returns:
+            dict: timeframe -> rates (None where the fetch failed)
+        """
+        return {timeframe: self.get_rates(symbol, timeframe, count) for timeframe, count in timeframes}
+    
+    def _store(self, cache, key, now, value):
+        """Store a cache entry, dropping everything once the cache is full."""
+        if len(cache) >= self.max_cache_entries:
+            cache.clear()
+        cache[key] = (now, value)
+    
     def is_connected(self):
-        """Check if connected to MT5."""
-        return self.connected and mt5.terminal_info() is not None
+        """Check if connected to MT5 (terminal probed at most once per TTL)."""
+        if not self.connected:
+            return False
+        
+        now = time.monotonic()
+        if now - self._last_check_ts < self.connection_check_ttl:
+            return self._last_check_result
+        
+        self._last_check_result = mt5.terminal_info() is not None
+        self._last_check_ts = now
+        return self._last_check_result
 
 
 def main():
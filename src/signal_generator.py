@@ -6,10 +6,62 @@ Generates ultra-strict trading signals with multi-timeframe analysis.
 Signals are designed to be reversed for contrarian trading.
 """
 
+import logging
+import time
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from colorama import Fore, Style
 
+# TA-Lib C indicators with pure-numpy fallback
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+# Compiled scoring kernels (Numba optional)
+try:
+    from signal_kernels import (
+        NUMBA_AVAILABLE, TFIndex, N_TF_FIELDS, score_day_trading, confluence_names,
+        confluence_count, find_support_resistance, indicator_stack, warmup_kernels,
+    )
+except ImportError:
+    from src.signal_kernels import (
+        NUMBA_AVAILABLE, TFIndex, N_TF_FIELDS, score_day_trading, confluence_names,
+        confluence_count, find_support_resistance, indicator_stack, warmup_kernels,
+    )
+
+# Volume pattern types (the analyzer itself is attached per instance)
+try:
+    from volume_analyzer import VolSignal, rolling_mean, rolling_std
+except ImportError:
+    from src.volume_analyzer import VolSignal, rolling_mean, rolling_std
+
+logger = logging.getLogger(__name__)
+
+# Day trading timeframes and bar counts
+DAY_TRADING_TIMEFRAMES = (
+    ("M5", 288),   # 5min: 288 bars = 24 hours
+    ("M15", 96),   # 15min: 96 bars = 24 hours
+    ("H1", 100),   # 1H: 100 bars = ~4 days
+    ("H4", 48),    # 4H: 48 bars = 8 days
+)
+
+# M5 ATR below this means a dead market - such symbols are skipped before any analysis
+MIN_M5_ATR = 0.00005
+
+# Symbols whose rates could not be fetched are not re-queried for this many seconds
+NO_DATA_RETRY_SECONDS = 60
+
+# Batch prefetches run on one background thread: MT5Connector serializes terminal calls,
+# so more workers would only queue on its lock
+_RATES_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rates")
+
+# Shared read-only default for missing volume pattern entries
+_EMPTY_PATTERN = {}
+
 
 class SignalGenerator:
     """
@@ -22,6 +74,16 @@ class SignalGenerator:
         """Initialize the signal generator."""
         self.mt5 = mt5_connector
         self.config = config
+        
+        # Per-cycle memoization keyed by the state of the latest bar
+        self._analysis_cache = {}  # (symbol, timeframe) -> (bar key, analysis)
+        self._signal_cache = {}    # symbol -> (M5 bar key, signal data)
+        self._buffers = {}         # (symbol, timeframe) -> reusable float64 scratch arrays
+        self._no_data_until = {}   # symbol -> monotonic time before which missing data is assumed
+        
+        # Compile/load the Numba kernels now rather than on the first live signal
+        warmup_kernels()
+        
         # Initialize volume analyzer for enhanced signals
         try:
             from volume_analyzer import VolumeAnalyzer
@@ -33,7 +95,7 @@ class SignalGenerator:
             self.volume_enabled = False
             print(f"{Fore.YELLOW}⚠️ Volume analyzer not available{Style.RESET_ALL}")
         
-    def generate_live_day_trading_signal(self, symbol):
+    def generate_live_day_trading_signal(self, symbol, rates=None):
         """
         Generate optimized day trading signal for a symbol.
         
@@ -45,37 +107,62 @@ class SignalGenerator:
         
         Args:
             symbol (str): Trading symbol
+            rates (list): Prefetched M5/M15/H1/H4 rates (fetched here if None)
             
         Returns:
             dict: Signal data with type, strength, and confluences
         """
         try:
-            print(f"🔍 Getting optimized day trading data for {symbol}...")
-            
-            # Get optimized multi-timeframe data for day trading
-            m5_data = self.mt5.get_rates(symbol, "M5", 288)   # 5min: 288 bars = 24 hours
-            m15_data = self.mt5.get_rates(symbol, "M15", 96)  # 15min: 96 bars = 24 hours
-            h1_data = self.mt5.get_rates(symbol, "H1", 100)   # 1H: 100 bars = ~4 days
-            h4_data = self.mt5.get_rates(symbol, "H4", 48)    # 4H: 48 bars = 8 days
+            if rates is None:
+                if self.data_backoff_active(symbol):
+                    return None
+                
+                logger.debug("🔍 Getting optimized day trading data for %s...", symbol)
+                
+                # Get optimized multi-timeframe data for day trading
+                rates = self._fetch_day_trading_rates(symbol)
+            m5_data, m15_data, h1_data, h4_data = rates
             
-            print(f"📊 Day trading data received: 5M={len(m5_data) if m5_data is not None else 'None'}, "
-                  f"15M={len(m15_data) if m15_data is not None else 'None'}, "
-                  f"1H={len(h1_data) if h1_data is not None else 'None'}, "
-                  f"4H={len(h4_data) if h4_data is not None else 'None'}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📊 Day trading data received: 5M=%s, 15M=%s, 1H=%s, 4H=%s",
+                             *(len(data) if data is not None else 'None'
+                               for data in (m5_data, m15_data, h1_data, h4_data)))
             
             if not all([m5_data is not None, m15_data is not None, h1_data is not None, h4_data is not None]):
-                print(f"❌ Missing day trading data for {symbol}")
+                logger.warning("❌ Missing day trading data for %s", symbol)
+                self._no_data_until[symbol] = time.monotonic() + NO_DATA_RETRY_SECONDS
                 return None
+            self._no_data_until.pop(symbol, None)
+            
+            # Reuse the signal if no tick has arrived since the last evaluation
+            signal_key = self._bar_key(m5_data) + (int(m5_data['tick_volume'][-1]),)
+            cached = self._signal_cache.get(symbol)
+            if cached is not None and cached[0] == signal_key:
+                logger.debug("♻️ Reusing day trading signal for %s (no new ticks)", symbol)
+                return self._copy_signal(cached[1])
+            
+            # Cheap volatility preflight: skip dead markets before the full analysis
+            if len(m5_data) > 14:
+                m5_atr = self._last_atr(
+                    np.ascontiguousarray(m5_data['high'], dtype=np.float64),
+                    np.ascontiguousarray(m5_data['low'], dtype=np.float64),
+                    np.ascontiguousarray(m5_data['close'], dtype=np.float64)
+                )
+                if m5_atr < MIN_M5_ATR:
+                    logger.debug("💤 %s: M5 ATR %.6f below %.5f, skipping analysis", symbol, m5_atr, MIN_M5_ATR)
+                    self._signal_cache[symbol] = (signal_key, None)
+                    return None
                 
             # Analyze each timeframe for day trading
-            print(f"📈 Analyzing day trading timeframes...")
-            m5_analysis = self._analyze_timeframe(m5_data, "M5")
-            m15_analysis = self._analyze_timeframe(m15_data, "M15")
-            h1_analysis = self._analyze_timeframe(h1_data, "H1")
-            h4_analysis = self._analyze_timeframe(h4_data, "H4")
-            
-            if not all([m5_analysis, m15_analysis, h1_analysis, h4_analysis]):
-                print(f"❌ Day trading analysis failed for {symbol}")
+            logger.debug("📈 Analyzing day trading timeframes...")
+            m5_analysis = self._analyze_timeframe(m5_data, "M5", symbol)
+            m15_analysis = self._analyze_timeframe(m15_data, "M15", symbol)
+            h1_analysis = self._analyze_timeframe(h1_data, "H1", symbol)
+            h4_analysis = self._analyze_timeframe(h4_data, "H4", symbol)
+            
+            if any(analysis is None for analysis in (m5_analysis, m15_analysis, h1_analysis, h4_analysis)):
+                logger.warning("❌ Day trading analysis failed for %s", symbol)
+                self._signal_cache[symbol] = (signal_key, None)
                 return None
             
             # Combine analysis with day trading focus
@@ -83,21 +170,122 @@ class SignalGenerator:
             
             # Enhance with volume analysis if available
             if signal_data and self.volume_enabled:
-                signal_data = self._enhance_with_volume_analysis(symbol, signal_data)
+                signal_data = self._enhance_with_volume_analysis(symbol, signal_data, rates)
             
             if signal_data:
-                print(f"✅ Day trading signal generated for {symbol}: {signal_data['signal']} {signal_data['strength']:.1f}/10")
+                logger.info("✅ Day trading signal generated for %s: %s %.1f/10",
+                            symbol, signal_data['signal'], signal_data['strength'])
                 if 'volume_score' in signal_data:
-                    print(f"🔊 Volume Score: {signal_data['volume_score']:.1f}/10")
+                    logger.info("🔊 Volume Score: %.1f/10", signal_data['volume_score'])
             else:
-                print(f"⚠️ No qualifying day trading signal for {symbol}")
+                logger.debug("⚠️ No qualifying day trading signal for %s", symbol)
             
-            return signal_data
+            self._signal_cache[symbol] = (signal_key, signal_data)
+            return self._copy_signal(signal_data)
             
         except Exception as e:
-            print(f"❌ Day trading signal generation error for {symbol}: {e}")
+            logger.error("❌ Day trading signal generation error for %s: %s", symbol, e)
             return None
     
+    def data_backoff_active(self, symbol):
+        """
+        True while a symbol that recently had no data should not be re-queried.
+        
+        Callers that prefetch rates check this before fetching; the backoff is set
+        and cleared by generate_live_day_trading_signal from the data it receives.
+        """
+        if time.monotonic() < self._no_data_until.get(symbol, 0.0):
+            logger.debug("⏭️ %s: no data on the last attempt, not re-querying yet", symbol)
+            return True
+        return False
+    
+    def generate_from_bundle(self, symbol, bundle):
+        """
+        Generate the day trading signal from prefetched rates.
+        
+        Fetch the bundle only when data_backoff_active(symbol) is False.
+        
+        Args:
+            symbol (str): Trading symbol
+            bundle (dict): timeframe -> rates covering DAY_TRADING_TIMEFRAMES
+                (see MT5Connector.fetch_rates_bundle)
+            
+        Returns:
+            dict: Signal data (None when there is no signal)
+        """
+        return self.generate_live_day_trading_signal(
+            symbol, rates=[bundle.get(timeframe) for timeframe, _ in DAY_TRADING_TIMEFRAMES])
+    
+    def generate_live_signals_batch(self, symbols):
+        """
+        Generate day trading signals for several symbols.
+        
+        All symbols' rates are queued up front on a background thread, so later
+        symbols are fetched while earlier ones are evaluated. The fetches
+        themselves are serialized by MT5Connector.
+        
+        Args:
+            symbols (list): Trading symbols
+            
+        Returns:
+            dict: symbol -> signal data (None when there is no signal)
+        """
+        # Symbols in their no-data backoff get no signal and no fetches
+        signals = {symbol: None for symbol in symbols if self.data_backoff_active(symbol)}
+        pending = {
+            symbol: [
+                _RATES_POOL.submit(self.mt5.get_rates, symbol, timeframe, count)
+                for timeframe, count in DAY_TRADING_TIMEFRAMES
+            ]
+            for symbol in symbols
+            if symbol not in signals
+        }
+        
+        for symbol, futures in pending.items():
+            rates = [future.result() for future in futures]
+            signals[symbol] = self.generate_live_day_trading_signal(symbol, rates=rates)
+        return signals
+    
+    def _fetch_day_trading_rates(self, symbol):
+        """Fetch the M5/M15/H1/H4 rates, in DAY_TRADING_TIMEFRAMES order."""
+        return [self.mt5.get_rates(symbol, timeframe, count) for timeframe, count in DAY_TRADING_TIMEFRAMES]
+    
+    def _get_buffers(self, symbol, timeframe, size):
+        """Scratch float64 arrays for one (symbol, timeframe), reallocated only when the bar count changes."""
+        key = (symbol, timeframe)
+        buffers = self._buffers.get(key) if symbol is not None else None
+        if buffers is None or len(buffers['close']) != size:
+            buffers = {
+                'close': np.empty(size, dtype=np.float64),
+                'high': np.empty(size, dtype=np.float64),
+                'low': np.empty(size, dtype=np.float64),
+                'deltas': np.empty(size - 1, dtype=np.float64),
+                'gains': np.empty(size - 1, dtype=np.float64),
+                'losses': np.empty(size - 1, dtype=np.float64),
+                'rsi': np.empty(size, dtype=np.float64),
+            }
+            if symbol is not None:
+                self._buffers[key] = buffers
+        return buffers
+    
+    def _bar_key(self, rates):
+        """Identify a rates array by its length and the state of its latest bar."""
+        return (
+            len(rates),
+            int(rates['time'][-1]),
+            float(rates['close'][-1]),
+            float(rates['high'][-1]),
+            float(rates['low'][-1]),
+        )
+    
+    def _copy_signal(self, signal_data):
+        """Copy a cached signal so callers can modify it freely."""
+        if signal_data is None:
+            return None
+        signal_copy = dict(signal_data)
+        signal_copy['confluences'] = list(signal_data['confluences'])
+        return signal_copy
+    
     def _combine_day_trading_analysis(self, symbol, m5, m15, h1, h4):
         """
         Combine multi-timeframe analysis for optimized day trading signals.
@@ -108,113 +296,14 @@ class SignalGenerator:
         - H1: Trend confirmation and structure
         - H4: Market bias and major levels
         """
-        if not all([m5, m15, h1, h4]):
+        if m5 is None or m15 is None or h1 is None or h4 is None:
             return None
             
-        confluences = []
-        bullish_signals = 0
-        bearish_signals = 0
-        
-        # === M5 PRECISION ANALYSIS (Execution Level) ===
-        if m5['rsi'] > 75:  # Extreme overbought on M5
-            bearish_signals += 3
-            confluences.append("M5 RSI Extreme Overbought (75+)")
-            
-        if m5['rsi'] < 25:  # Extreme oversold on M5
-            bullish_signals += 3
-            confluences.append("M5 RSI Extreme Oversold (25-)")
-            
-        # M5 MACD momentum
-        if m5['macd'] > m5['macd_signal'] and m5['macd'] > 0:
-            bearish_signals += 1  # Strong bullish momentum - contrarian SELL
-            confluences.append("M5 MACD Strong Bullish")
-            
-        if m5['macd'] < m5['macd_signal'] and m5['macd'] < 0:
-            bullish_signals += 1  # Strong bearish momentum - contrarian BUY
-            confluences.append("M5 MACD Strong Bearish")
-            
-        # === M15 TIMING ANALYSIS (Entry Level) ===
-        if m15['rsi'] > 70:
-            bearish_signals += 2
-            confluences.append("M15 RSI Overbought (70+)")
-            
-        if m15['rsi'] < 30:
-            bullish_signals += 2
-            confluences.append("M15 RSI Oversold (30-)")
-            
-        # M15 Price position vs EMAs
-        if m15['price'] > m15['ema_20'] > m15['ema_50']:
-            bearish_signals += 2  # Strong uptrend - contrarian SELL opportunity
-            confluences.append("M15 Strong Uptrend")
-            
-        if m15['price'] < m15['ema_20'] < m15['ema_50']:
-            bullish_signals += 2  # Strong downtrend - contrarian BUY opportunity
-            confluences.append("M15 Strong Downtrend")
-            
-        # === H1 CONFIRMATION ANALYSIS ===
-        if h1['rsi'] > 65:
-            bearish_signals += 1
-            confluences.append("H1 RSI High")
-            
-        if h1['rsi'] < 35:
-            bullish_signals += 1
-            confluences.append("H1 RSI Low")
-            
-        # H1 Bollinger Bands (key for contrarian entries)
-        if h1['price'] > h1['bb_upper']:
-            bearish_signals += 3  # Price above upper band - strong contrarian SELL
-            confluences.append("H1 Price Above Bollinger Upper")
-            
-        if h1['price'] < h1['bb_lower']:
-            bullish_signals += 3  # Price below lower band - strong contrarian BUY
-            confluences.append("H1 Price Below Bollinger Lower")
-            
-        # === H4 BIAS ANALYSIS (Market Structure) ===
-        if h4['rsi'] > 60:
-            bearish_signals += 1
-            confluences.append("H4 RSI Overbought Bias")
-            
-        if h4['rsi'] < 40:
-            bullish_signals += 1
-            confluences.append("H4 RSI Oversold Bias")
-            
-        # === MULTI-TIMEFRAME ALIGNMENT ===
-        # RSI alignment across timeframes (stronger signal)
-        rsi_aligned_bearish = (m5['rsi'] > 70 and m15['rsi'] > 65 and h1['rsi'] > 60)
-        rsi_aligned_bullish = (m5['rsi'] < 30 and m15['rsi'] < 35 and h1['rsi'] < 40)
-        
-        if rsi_aligned_bearish:
-            bearish_signals += 2
-            confluences.append("Multi-TF RSI Overbought Alignment")
-            
-        if rsi_aligned_bullish:
-            bullish_signals += 2
-            confluences.append("Multi-TF RSI Oversold Alignment")
-            
-        # === SUPPORT/RESISTANCE ANALYSIS ===
-        current_price = m5['price']  # Use M5 for precision
-        
-        # Check proximity to H1 levels (most relevant for day trading)
-        if current_price >= h1['resistance'] * 0.9995:  # Very close to resistance
-            bearish_signals += 2
-            confluences.append("Near H1 Resistance Level")
-            
-        if current_price <= h1['support'] * 1.0005:  # Very close to support
-            bullish_signals += 2
-            confluences.append("Near H1 Support Level")
-            
-        # === DAY TRADING MOMENTUM ANALYSIS ===
-        # Check for momentum divergence (contrarian opportunity)
-        price_momentum_up = (m15['price'] > m15['ema_20'] and h1['price'] > h1['ema_20'])
-        price_momentum_down = (m15['price'] < m15['ema_20'] and h1['price'] < h1['ema_20'])
-        
-        if price_momentum_up and (m5['rsi'] > 70 or m15['rsi'] > 70):
-            bearish_signals += 2
-            confluences.append("Momentum Up + RSI Overbought")
-            
-        if price_momentum_down and (m5['rsi'] < 30 or m15['rsi'] < 30):
-            bullish_signals += 2
-            confluences.append("Momentum Down + RSI Oversold")
+        # Score all timeframes in one compiled pass
+        bullish_signals, bearish_signals, flags = score_day_trading(m5, m15, h1, h4)
+        bullish_signals = int(bullish_signals)
+        bearish_signals = int(bearish_signals)
+        flags = int(flags)
             
         # === SIGNAL DETERMINATION ===
         total_signals = bullish_signals + bearish_signals
@@ -235,7 +324,7 @@ class SignalGenerator:
             return None
             
         # Apply day trading specific filtering
-        strength = self._apply_day_trading_filtering(strength, confluences, m5, m15, h1, h4)
+        strength = self._apply_day_trading_filtering(strength, confluence_count(flags), m5, m15, h1, h4)
         
         if strength < 6.0:  # Minimum strength for day trading
             return None
@@ -244,7 +333,7 @@ class SignalGenerator:
             'symbol': symbol,
             'signal': signal_type,
             'strength': round(strength, 1),
-            'confluences': confluences,
+            'confluences': confluence_names(flags),
             'timeframes': {
                 'M5': m5,
                 'M15': m15,
@@ -253,12 +342,11 @@ class SignalGenerator:
             }
         }
     
-    def _apply_day_trading_filtering(self, base_strength, confluences, m5, m15, h1, h4):
+    def _apply_day_trading_filtering(self, base_strength, confluence_count, m5, m15, h1, h4):
         """Apply day trading specific filtering to signal strength."""
         strength = base_strength
         
         # Bonus for multiple confluences (day trading needs more confirmation)
-        confluence_count = len(confluences)
         if confluence_count >= 7:
             strength += 1.5
         elif confluence_count >= 5:
@@ -267,118 +355,129 @@ class SignalGenerator:
             strength += 0.5
             
         # M5 precision bonus (critical for day trading)
-        if m5['rsi'] > 80 or m5['rsi'] < 20:  # Extreme M5 RSI
+        if m5[TFIndex.RSI] > 80 or m5[TFIndex.RSI] < 20:  # Extreme M5 RSI
             strength += 1.0
-        elif m5['rsi'] > 75 or m5['rsi'] < 25:  # Very high/low M5 RSI
+        elif m5[TFIndex.RSI] > 75 or m5[TFIndex.RSI] < 25:  # Very high/low M5 RSI
             strength += 0.5
             
         # Multi-timeframe RSI alignment bonus
-        rsi_spread_m5_m15 = abs(m5['rsi'] - m15['rsi'])
-        rsi_spread_m15_h1 = abs(m15['rsi'] - h1['rsi'])
+        rsi_spread_m5_m15 = abs(m5[TFIndex.RSI] - m15[TFIndex.RSI])
+        rsi_spread_m15_h1 = abs(m15[TFIndex.RSI] - h1[TFIndex.RSI])
         
         if rsi_spread_m5_m15 < 10 and rsi_spread_m15_h1 < 15:  # Good alignment
             strength += 0.5
             
-        # Volatility check (critical for day trading)
-        if m5['atr'] < 0.00005:  # Too low volatility
-            strength -= 3.0
-        elif m5['atr'] < 0.0001:  # Low volatility
+        # Volatility check (dead markets, ATR < MIN_M5_ATR, never reach this point)
+        if m5[TFIndex.ATR] < 0.0001:  # Low volatility
             strength -= 1.0
             
         # Bollinger band extreme bonus (great for contrarian)
         bb_position_h1 = 0
-        if h1['price'] > h1['bb_upper']:
-            bb_position_h1 = (h1['price'] - h1['bb_upper']) / h1['bb_upper']
+        if h1[TFIndex.PRICE] > h1[TFIndex.BB_UPPER]:
+            bb_position_h1 = (h1[TFIndex.PRICE] - h1[TFIndex.BB_UPPER]) / h1[TFIndex.BB_UPPER]
             strength += min(1.0, bb_position_h1 * 1000)  # Bonus for distance above upper band
-        elif h1['price'] < h1['bb_lower']:
-            bb_position_h1 = (h1['bb_lower'] - h1['price']) / h1['bb_lower']
+        elif h1[TFIndex.PRICE] < h1[TFIndex.BB_LOWER]:
+            bb_position_h1 = (h1[TFIndex.BB_LOWER] - h1[TFIndex.PRICE]) / h1[TFIndex.BB_LOWER]
             strength += min(1.0, bb_position_h1 * 1000)  # Bonus for distance below lower band
             
         # Penalize signals in neutral zones
-        if 40 <= m15['rsi'] <= 60:  # M15 RSI in neutral zone
+        if 40 <= m15[TFIndex.RSI] <= 60:  # M15 RSI in neutral zone
             strength -= 1.5
             
-        if 45 <= h1['rsi'] <= 55:  # H1 RSI in neutral zone
+        if 45 <= h1[TFIndex.RSI] <= 55:  # H1 RSI in neutral zone
             strength -= 1.0
             
         return max(0, min(10, strength))
             
-    def _analyze_timeframe(self, rates, timeframe):
-        """Analyze a single timeframe."""
+    def _analyze_timeframe(self, rates, timeframe, symbol=None):
+        """Analyze a single timeframe into a TFIndex-ordered array (memoized per symbol on the latest bar)."""
         try:
             if rates is None or len(rates) < 30:  # Reduced from 50 to 30
-                print(f"❌ Insufficient data for {timeframe}: {len(rates) if rates is not None else 'None'} bars")
+                logger.warning("❌ Insufficient data for %s: %s bars", timeframe,
+                               len(rates) if rates is not None else 'None')
                 return None
-                
-            close = rates['close']
-            high = rates['high']
-            low = rates['low']
-            
-            print(f"📊 {timeframe}: Analyzing {len(close)} bars, Current price: {close[-1]:.5f}")
             
-            # Technical indicators
-            rsi = self._calculate_rsi(close)
-            ema_20 = self._calculate_ema(close, 20)
-            ema_50 = self._calculate_ema(close, 50)
-            macd_line, macd_signal = self._calculate_macd(close)
-            bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(close)
-            atr = self._calculate_atr(high, low, close)
+            # Closed bars never change, so an unchanged latest bar means identical results
+            if symbol is not None:
+                bar_key = self._bar_key(rates)
+                cached = self._analysis_cache.get((symbol, timeframe))
+                if cached is not None and cached[0] == bar_key:
+                    return cached[1]
+                
+            # Contiguous float64 copies shared by every indicator
+            buffers = self._get_buffers(symbol, timeframe, len(rates))
+            close, high, low = buffers['close'], buffers['high'], buffers['low']
+            np.copyto(close, rates['close'])
+            np.copyto(high, rates['high'])
+            np.copyto(low, rates['low'])
+            current_price = float(close[-1])
+            
+            logger.debug("📊 %s: Analyzing %d bars, Current price: %.5f", timeframe, len(close), current_price)
+            
+            # Technical indicators (last values only, one fused pass when compiled)
+            if NUMBA_AVAILABLE:
+                (current_rsi, ema_20, ema_50, current_macd, current_macd_signal,
+                 bb_upper, bb_lower, atr) = indicator_stack(close, high, low)
+            else:
+                current_rsi = self._last_rsi(close, buffers=buffers)
+                ema_20 = self._last_ema(close, 20, current_price)
+                ema_50 = self._last_ema(close, 50, current_price)
+                current_macd, current_macd_signal = self._last_macd(close)
+                bb_upper, bb_lower = self._last_bb(close, current_price)
+                atr = self._last_atr(high, low, close)
             
             # Support and resistance
             support, resistance = self._find_support_resistance(high, low, close)
             
-            # Current values
-            current_price = close[-1]
-            current_rsi = rsi[-1] if len(rsi) > 0 else 50
-            current_macd = macd_line[-1] if len(macd_line) > 0 else 0
-            current_macd_signal = macd_signal[-1] if len(macd_signal) > 0 else 0
-            
-            print(f"📈 {timeframe}: RSI={current_rsi:.1f}, EMA20={ema_20[-1] if len(ema_20) > 0 else 'N/A':.5f}")
-            
-            analysis = {
-                'timeframe': timeframe,
-                'price': current_price,
-                'rsi': current_rsi,
-                'ema_20': ema_20[-1] if len(ema_20) > 0 else current_price,
-                'ema_50': ema_50[-1] if len(ema_50) > 0 else current_price,
-                'macd': current_macd,
-                'macd_signal': current_macd_signal,
-                'bb_upper': bb_upper[-1] if len(bb_upper) > 0 else current_price,
-                'bb_lower': bb_lower[-1] if len(bb_lower) > 0 else current_price,
-                'support': support,
-                'resistance': resistance,
-                'atr': atr[-1] if len(atr) > 0 else 0.001
-            }
+            logger.debug("📈 %s: RSI=%.1f, EMA20=%.5f", timeframe, current_rsi, ema_20)
+            
+            analysis = np.empty(N_TF_FIELDS, dtype=np.float64)
+            analysis[TFIndex.PRICE] = current_price
+            analysis[TFIndex.RSI] = current_rsi
+            analysis[TFIndex.EMA20] = ema_20
+            analysis[TFIndex.EMA50] = ema_50
+            analysis[TFIndex.MACD] = current_macd
+            analysis[TFIndex.MACD_SIGNAL] = current_macd_signal
+            analysis[TFIndex.BB_UPPER] = bb_upper
+            analysis[TFIndex.BB_LOWER] = bb_lower
+            analysis[TFIndex.SUPPORT] = support
+            analysis[TFIndex.RESISTANCE] = resistance
+            analysis[TFIndex.ATR] = atr
+            
+            if symbol is not None:
+                self._analysis_cache[(symbol, timeframe)] = (bar_key, analysis)
             
             return analysis
             
         except Exception as e:
-            print(f"❌ Error analyzing {timeframe}: {e}")
+            logger.error("❌ Error analyzing %s: %s", timeframe, e)
             return None
         
-    def _combine_analysis(self, symbol, h1, h4, d1):
-        """Legacy method - redirects to day trading analysis for compatibility."""
+    def _combine_analysis(self, symbol, h1, h4, d1, m5=None, m15=None):
+        """
+        Legacy method - redirects to day trading analysis for compatibility.
+        
+        m5/m15 are M5/M15 rates the caller already holds; missing ones are fetched.
+        """
         # For backwards compatibility, convert to day trading format
-        # Get additional M5 and M15 data if needed
-        try:
-            m5_data = self.mt5.get_rates(symbol, "M5", 288)
-            m15_data = self.mt5.get_rates(symbol, "M15", 96)
+        if m5 is None:
+            m5 = self.mt5.get_rates(symbol, "M5", 288)
+        if m15 is None:
+            m15 = self.mt5.get_rates(symbol, "M15", 96)
+        
+        if m5 is not None and m15 is not None:
+            m5_analysis = self._analyze_timeframe(m5, "M5", symbol)
+            m15_analysis = self._analyze_timeframe(m15, "M15", symbol)
             
-            if m5_data is not None and m15_data is not None:
-                m5_analysis = self._analyze_timeframe(m5_data, "M5")
-                m15_analysis = self._analyze_timeframe(m15_data, "M15")
-                
-                if m5_analysis and m15_analysis:
-                    return self._combine_day_trading_analysis(symbol, m5_analysis, m15_analysis, h1, h4)
-        except:
-            pass
+            if m5_analysis is not None and m15_analysis is not None:
+                return self._combine_day_trading_analysis(symbol, m5_analysis, m15_analysis, h1, h4)
             
         # Fallback to original analysis if M5/M15 not available
         return self._combine_legacy_analysis(symbol, h1, h4, d1)
     
     def _combine_legacy_analysis(self, symbol, h1, h4, d1):
         """Combine multi-timeframe analysis into final signal."""
-        if not all([h1, h4, d1]):
+        if h1 is None or h4 is None or d1 is None:
             return None
             
         confluences = []
@@ -386,67 +485,67 @@ class SignalGenerator:
         bearish_signals = 0
         
         # RSI Analysis (for contrarian signals, we look for extremes)
-        if h1['rsi'] > 70:  # Overbought - potential contrarian SELL signal
+        if h1[TFIndex.RSI] > 70:  # Overbought - potential contrarian SELL signal
             bearish_signals += 2
             confluences.append("H1 RSI Overbought (70+)")
             
-        if h1['rsi'] < 30:  # Oversold - potential contrarian BUY signal
+        if h1[TFIndex.RSI] < 30:  # Oversold - potential contrarian BUY signal
             bullish_signals += 2
             confluences.append("H1 RSI Oversold (30-)")
             
         # H4 RSI confirmation
-        if h4['rsi'] > 65:
+        if h4[TFIndex.RSI] > 65:
             bearish_signals += 1
             confluences.append("H4 RSI High")
             
-        if h4['rsi'] < 35:
+        if h4[TFIndex.RSI] < 35:
             bullish_signals += 1
             confluences.append("H4 RSI Low")
             
         # Moving Average Analysis
-        if h1['price'] > h1['ema_20'] > h1['ema_50']:
+        if h1[TFIndex.PRICE] > h1[TFIndex.EMA20] > h1[TFIndex.EMA50]:
             bearish_signals += 1  # Strong uptrend - contrarian SELL opportunity
             confluences.append("H1 Strong Uptrend")
             
-        if h1['price'] < h1['ema_20'] < h1['ema_50']:
+        if h1[TFIndex.PRICE] < h1[TFIndex.EMA20] < h1[TFIndex.EMA50]:
             bullish_signals += 1  # Strong downtrend - contrarian BUY opportunity
             confluences.append("H1 Strong Downtrend")
             
         # MACD Analysis
-        if h1['macd'] > h1['macd_signal'] and h1['macd'] > 0:
+        if h1[TFIndex.MACD] > h1[TFIndex.MACD_SIGNAL] and h1[TFIndex.MACD] > 0:
             bearish_signals += 1  # Strong bullish momentum - contrarian SELL
             confluences.append("H1 MACD Bullish")
             
-        if h1['macd'] < h1['macd_signal'] and h1['macd'] < 0:
+        if h1[TFIndex.MACD] < h1[TFIndex.MACD_SIGNAL] and h1[TFIndex.MACD] < 0:
             bullish_signals += 1  # Strong bearish momentum - contrarian BUY
             confluences.append("H1 MACD Bearish")
             
         # Bollinger Bands (extremes for contrarian)
-        if h1['price'] > h1['bb_upper']:
+        if h1[TFIndex.PRICE] > h1[TFIndex.BB_UPPER]:
             bearish_signals += 2  # Price above upper band - contrarian SELL
             confluences.append("Price Above Bollinger Upper Band")
             
-        if h1['price'] < h1['bb_lower']:
+        if h1[TFIndex.PRICE] < h1[TFIndex.BB_LOWER]:
             bullish_signals += 2  # Price below lower band - contrarian BUY
             confluences.append("Price Below Bollinger Lower Band")
             
         # Support/Resistance Analysis
-        current_price = h1['price']
+        current_price = h1[TFIndex.PRICE]
         
-        if current_price >= h1['resistance'] * 0.998:  # Near resistance
+        if current_price >= h1[TFIndex.RESISTANCE] * 0.998:  # Near resistance
             bearish_signals += 1
             confluences.append("Near Resistance Level")
             
-        if current_price <= h1['support'] * 1.002:  # Near support
+        if current_price <= h1[TFIndex.SUPPORT] * 1.002:  # Near support
             bullish_signals += 1
             confluences.append("Near Support Level")
             
         # Higher timeframe confirmation
-        if h4['rsi'] > 60 and d1['rsi'] > 55:
+        if h4[TFIndex.RSI] > 60 and d1[TFIndex.RSI] > 55:
             bearish_signals += 1
             confluences.append("Multi-timeframe Overbought")
             
-        if h4['rsi'] < 40 and d1['rsi'] < 45:
+        if h4[TFIndex.RSI] < 40 and d1[TFIndex.RSI] < 45:
             bullish_signals += 1
             confluences.append("Multi-timeframe Oversold")
             
@@ -495,84 +594,119 @@ class SignalGenerator:
             strength += 0.5
             
         # Penalty for weak signals
-        if h1['rsi'] > 40 and h1['rsi'] < 60:  # RSI in neutral zone
+        if h1[TFIndex.RSI] > 40 and h1[TFIndex.RSI] < 60:  # RSI in neutral zone
             strength -= 1.0
             
         # Bonus for extreme RSI
-        if h1['rsi'] > 75 or h1['rsi'] < 25:
+        if h1[TFIndex.RSI] > 75 or h1[TFIndex.RSI] < 25:
             strength += 0.5
             
         # ATR volatility check
-        if h1['atr'] < 0.0001:  # Too low volatility
+        if h1[TFIndex.ATR] < 0.0001:  # Too low volatility
             strength -= 2.0
             
         # Multi-timeframe alignment bonus
-        rsi_alignment = abs(h1['rsi'] - h4['rsi']) < 10
+        rsi_alignment = abs(h1[TFIndex.RSI] - h4[TFIndex.RSI]) < 10
         if rsi_alignment:
             strength += 0.5
             
         return max(0, min(10, strength))
         
-    def _calculate_rsi(self, prices, period=14):
-        """Calculate RSI indicator."""
+    def _last_value(self, values, default):
+        """Return the last finite value of an indicator series, or a default."""
+        if len(values) == 0:
+            return default
+        last = float(values[-1])
+        return default if np.isnan(last) else last
+    
+    def _last_rsi(self, prices, period=14, buffers=None):
+        """Latest RSI value (50 when there is not enough data)."""
+        return self._last_value(self._calculate_rsi(prices, period, buffers), 50.0)
+    
+    def _last_ema(self, prices, period, default):
+        """Latest EMA value."""
+        return self._last_value(self._calculate_ema(prices, period), default)
+    
+    def _last_macd(self, prices):
+        """Latest MACD line and signal values."""
+        macd_line, macd_signal = self._calculate_macd(prices)
+        return self._last_value(macd_line, 0.0), self._last_value(macd_signal, 0.0)
+    
+    def _last_bb(self, prices, default):
+        """Latest upper and lower Bollinger Band values."""
+        upper_bands, _, lower_bands = self._calculate_bollinger_bands(prices)
+        return self._last_value(upper_bands, default), self._last_value(lower_bands, default)
+    
+    def _last_atr(self, high, low, close):
+        """Latest ATR value."""
+        return self._last_value(self._calculate_atr(high, low, close), 0.001)
+        
+    def _calculate_rsi(self, prices, period=14, buffers=None):
+        """
+        Calculate RSI indicator.
+        
+        With scratch buffers from _get_buffers the result is a view into them,
+        valid until the next analysis of the same symbol and timeframe.
+        """
         if len(prices) < period + 1:
             return []
-            
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
         
-        avg_gains = []
-        avg_losses = []
-        rsi_values = []
+        prices = np.asarray(prices, dtype=np.float64)
+        
+        if TALIB_AVAILABLE:
+            rsi_values = talib.RSI(prices, timeperiod=period)
+            return rsi_values[~np.isnan(rsi_values)]
+        
+        if buffers is None:
+            buffers = self._get_buffers(None, None, len(prices))
+        deltas, gains, losses = buffers['deltas'], buffers['gains'], buffers['losses']
+        rsi_values = buffers['rsi'][:len(prices) - period]
+        
+        np.subtract(prices[1:], prices[:-1], out=deltas)
+        np.maximum(deltas, 0.0, out=gains)
+        np.negative(deltas, out=losses)
+        np.maximum(losses, 0.0, out=losses)
         
         # First RSI calculation
         avg_gain = np.mean(gains[:period])
         avg_loss = np.mean(losses[:period])
         
-        if avg_loss == 0:
-            rsi_values.append(100)
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            rsi_values.append(rsi)
-            
-        avg_gains.append(avg_gain)
-        avg_losses.append(avg_loss)
-        
         # Subsequent RSI calculations
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gains[-1] * (period - 1) + gains[i]) / period
-            avg_loss = (avg_losses[-1] * (period - 1) + losses[i]) / period
-            
-            avg_gains.append(avg_gain)
-            avg_losses.append(avg_loss)
+        for i in range(len(rsi_values)):
+            if i > 0:
+                avg_gain = (avg_gain * (period - 1) + gains[period + i - 1]) / period
+                avg_loss = (avg_loss * (period - 1) + losses[period + i - 1]) / period
             
             if avg_loss == 0:
-                rsi_values.append(100)
+                rsi_values[i] = 100
             else:
                 rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-                rsi_values.append(rsi)
+                rsi_values[i] = 100 - (100 / (1 + rs))
                 
         return rsi_values
         
     def _calculate_ema(self, prices, period):
-        """Calculate Exponential Moving Average."""
+        """Calculate Exponential Moving Average (prices may be a list or ndarray)."""
         if len(prices) < period:
             return []
+        
+        prices = np.asarray(prices, dtype=np.float64)
+        
+        if TALIB_AVAILABLE:
+            ema_values = talib.EMA(prices, timeperiod=period)
+            return ema_values[~np.isnan(ema_values)]
             
-        ema_values = []
+        ema_values = np.empty(len(prices) - period + 1, dtype=np.float64)
         multiplier = 2 / (period + 1)
         
         # Start with SMA
-        sma = np.mean(prices[:period])
-        ema_values.append(sma)
+        ema = np.mean(prices[:period])
+        ema_values[0] = ema
         
         # Calculate EMA
         for i in range(period, len(prices)):
-            ema = (prices[i] * multiplier) + (ema_values[-1] * (1 - multiplier))
-            ema_values.append(ema)
+            ema = (prices[i] * multiplier) + (ema * (1 - multiplier))
+            ema_values[i - period + 1] = ema
             
         return ema_values
         
@@ -580,6 +714,16 @@ class SignalGenerator:
         """Calculate MACD indicator."""
         if len(prices) < slow:
             return [], []
+        
+        if TALIB_AVAILABLE:
+            # Built from talib.EMA (talib.MACD seeds the fast EMA differently)
+            arr = np.asarray(prices, dtype=np.float64)
+            macd_line = talib.EMA(arr, timeperiod=fast) - talib.EMA(arr, timeperiod=slow)
+            macd_line = macd_line[~np.isnan(macd_line)]
+            if len(macd_line) < signal:
+                return macd_line, []
+            macd_signal = talib.EMA(macd_line, timeperiod=signal)
+            return macd_line, macd_signal[~np.isnan(macd_signal)]
             
         ema_fast = self._calculate_ema(prices, fast)
         ema_slow = self._calculate_ema(prices, slow)
@@ -592,44 +736,54 @@ class SignalGenerator:
         ema_fast = ema_fast[-min_len:]
         ema_slow = ema_slow[-min_len:]
         
-        macd_line = np.array(ema_fast) - np.array(ema_slow)
-        macd_signal = self._calculate_ema(macd_line.tolist(), signal)
+        macd_line = ema_fast - ema_slow
+        macd_signal = self._calculate_ema(macd_line, signal)
         
-        return macd_line.tolist(), macd_signal
+        return macd_line, macd_signal
         
     def _calculate_bollinger_bands(self, prices, period=20, std_dev=2):
         """Calculate Bollinger Bands."""
         if len(prices) < period:
             return [], [], []
-            
-        upper_bands = []
-        middle_bands = []
-        lower_bands = []
         
-        for i in range(period - 1, len(prices)):
-            subset = prices[i - period + 1:i + 1]
-            mean = np.mean(subset)
-            std = np.std(subset)
-            
-            upper_bands.append(mean + (std * std_dev))
-            middle_bands.append(mean)
-            lower_bands.append(mean - (std * std_dev))
+        if TALIB_AVAILABLE:
+            upper_bands, middle_bands, lower_bands = talib.BBANDS(
+                np.asarray(prices, dtype=np.float64),
+                timeperiod=period, nbdevup=std_dev, nbdevdn=std_dev
+            )
+            valid = ~np.isnan(middle_bands)
+            return upper_bands[valid], middle_bands[valid], lower_bands[valid]
             
-        return upper_bands, middle_bands, lower_bands
+        # Every window's mean and std from cumulative sums (O(n) regardless of period)
+        middle_bands = rolling_mean(prices, period)
+        band_width = rolling_std(prices, period) * std_dev
+        
+        return middle_bands + band_width, middle_bands, middle_bands - band_width
         
     def _calculate_atr(self, high, low, close, period=14):
         """Calculate Average True Range."""
         if len(high) < period + 1:
             return []
+        
+        if TALIB_AVAILABLE:
+            atr_values = talib.ATR(
+                np.asarray(high, dtype=np.float64),
+                np.asarray(low, dtype=np.float64),
+                np.asarray(close, dtype=np.float64),
+                timeperiod=period
+            )
+            return atr_values[~np.isnan(atr_values)]
             
-        true_ranges = []
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
         
-        for i in range(1, len(high)):
-            tr1 = high[i] - low[i]
-            tr2 = abs(high[i] - close[i-1])
-            tr3 = abs(low[i] - close[i-1])
-            true_range = max(tr1, tr2, tr3)
-            true_ranges.append(true_range)
+        # True range of every bar against the previous close, in one pass
+        prev_close = close[:-1]
+        true_ranges = np.maximum(
+            high[1:] - low[1:],
+            np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close))
+        )
             
         atr_values = []
         
@@ -647,46 +801,46 @@ class SignalGenerator:
         
     def _find_support_resistance(self, high, low, close, window=5):
         """Find support and resistance levels."""
-        if len(high) < window * 2:
+        if len(high) < window * 2 + 1:
             current_price = close[-1]
             return current_price * 0.99, current_price * 1.01
-            
-        # Find local minima and maxima
-        support_levels = []
-        resistance_levels = []
         
-        for i in range(window, len(low) - window):
-            # Check for support (local minimum)
-            if all(low[i] <= low[j] for j in range(i - window, i + window + 1)):
-                support_levels.append(low[i])
-                
-        for i in range(window, len(high) - window):
-            # Check for resistance (local maximum)
-            if all(high[i] >= high[j] for j in range(i - window, i + window + 1)):
-                resistance_levels.append(high[i])
+        # Single allocation-free scan when compiled
+        if NUMBA_AVAILABLE:
+            current_price = float(close[-1])
+            support, resistance = find_support_resistance(high, low, current_price, int(window))
+            if np.isnan(support):
+                support = current_price * 0.99
+            if np.isnan(resistance):
+                resistance = current_price * 1.01
+            return support, resistance
+            
+        # Find local minima and maxima over each (2 * window + 1)-bar window
+        width = 2 * window + 1
+        center_low = low[window:len(low) - window]
+        center_high = high[window:len(high) - window]
+        support_levels = center_low[sliding_window_view(low, width).min(axis=1) == center_low]
+        resistance_levels = center_high[sliding_window_view(high, width).max(axis=1) == center_high]
                 
         # Get nearest levels
         current_price = close[-1]
         
-        if support_levels:
-            support = max([s for s in support_levels if s < current_price], default=current_price * 0.99)
-        else:
-            support = current_price * 0.99
+        below = support_levels[support_levels < current_price]
+        support = below.max() if below.size else current_price * 0.99
             
-        if resistance_levels:
-            resistance = min([r for r in resistance_levels if r > current_price], default=current_price * 1.01)
-        else:
-            resistance = current_price * 1.01
+        above = resistance_levels[resistance_levels > current_price]
+        resistance = above.min() if above.size else current_price * 1.01
             
         return support, resistance
     
-    def _enhance_with_volume_analysis(self, symbol, signal_data):
+    def _enhance_with_volume_analysis(self, symbol, signal_data, rates):
         """
         Enhance signal with volume analysis for contrarian confirmation.
         
         Args:
             symbol (str): Currency pair
             signal_data (dict): Original signal data
+            rates (list): The M5/M15/H1/H4 rates the signal was built from (reused, not re-fetched)
             
         Returns:
             dict: Enhanced signal data with volume analysis
@@ -697,10 +851,11 @@ class SignalGenerator:
             
             # Get volume analysis for multiple timeframes
             volume_analysis = self.volume_analyzer.get_volume_contrarian_signals(
-                symbol, ['M5', 'M15', 'H1']
+                symbol, ['M5', 'M15', 'H1'],
+                rates={timeframe: data for (timeframe, _), data in zip(DAY_TRADING_TIMEFRAMES, rates)}
             )
             
-            if not volume_analysis or 'combined_analysis' not in volume_analysis:
+            if not volume_analysis:
                 return signal_data
             
             combined_volume = volume_analysis['combined_analysis']
@@ -724,34 +879,39 @@ class SignalGenerator:
                 signal_data['confluences'].append("Volume Warning")
             
             # Check for specific volume patterns
-            for tf in ['M5', 'M15', 'H1']:
-                if tf in volume_analysis:
-                    tf_analysis = volume_analysis[tf]
-                    
-                    # Volume spike bonus (exhaustion signal)
-                    if tf_analysis.get('volume_spike', False):
-                        volume_boost += 0.5
-                        signal_data['confluences'].append(f"{tf} Volume Spike")
-                    
-                    # Price-volume divergence
-                    if tf_analysis.get('price_volume_divergence', {}).get('detected', False):
-                        divergence_type = tf_analysis['price_volume_divergence']['type']
-                        if 'bearish' in divergence_type and signal_data['signal'] == 'BUY':
-                            volume_boost += 1.0  # Bearish divergence supports contrarian BUY
-                            signal_data['confluences'].append(f"{tf} Bearish Volume Divergence")
-                        elif 'bullish' in divergence_type and signal_data['signal'] == 'SELL':
-                            volume_boost += 1.0  # Bullish divergence supports contrarian SELL
-                            signal_data['confluences'].append(f"{tf} Bullish Volume Divergence")
-                    
-                    # Exhaustion patterns
-                    if tf_analysis.get('exhaustion_signal', {}).get('detected', False):
-                        exhaustion_type = tf_analysis['exhaustion_signal']['type']
-                        if 'buying_exhaustion' in exhaustion_type and signal_data['signal'] == 'BUY':
-                            volume_boost += 1.5  # Buying exhaustion supports contrarian BUY (which becomes SELL)
-                            signal_data['confluences'].append(f"{tf} Buying Exhaustion")
-                        elif 'selling_exhaustion' in exhaustion_type and signal_data['signal'] == 'SELL':
-                            volume_boost += 1.5  # Selling exhaustion supports contrarian SELL (which becomes BUY)
-                            signal_data['confluences'].append(f"{tf} Selling Exhaustion")
+            sd_signal = signal_data['signal']
+            confluences = signal_data['confluences']
+            for tf in ('M5', 'M15', 'H1'):
+                tf_analysis = volume_analysis.get(tf)
+                if tf_analysis is None:
+                    continue
+                
+                # Volume spike bonus (exhaustion signal)
+                if tf_analysis.get('volume_spike', False):
+                    volume_boost += 0.5
+                    confluences.append(f"{tf} Volume Spike")
+                
+                # Price-volume divergence
+                divergence = tf_analysis.get('price_volume_divergence', _EMPTY_PATTERN)
+                if divergence.get('detected', False):
+                    divergence_type = divergence['type']
+                    if divergence_type == VolSignal.BEAR_DIV and sd_signal == 'BUY':
+                        volume_boost += 1.0  # Bearish divergence supports contrarian BUY
+                        confluences.append(f"{tf} Bearish Volume Divergence")
+                    elif divergence_type == VolSignal.BULL_DIV and sd_signal == 'SELL':
+                        volume_boost += 1.0  # Bullish divergence supports contrarian SELL
+                        confluences.append(f"{tf} Bullish Volume Divergence")
+                
+                # Exhaustion patterns
+                exhaustion = tf_analysis.get('exhaustion_signal', _EMPTY_PATTERN)
+                if exhaustion.get('detected', False):
+                    exhaustion_type = exhaustion['type']
+                    if exhaustion_type == VolSignal.BUY_EXH and sd_signal == 'BUY':
+                        volume_boost += 1.5  # Buying exhaustion supports contrarian BUY (which becomes SELL)
+                        confluences.append(f"{tf} Buying Exhaustion")
+                    elif exhaustion_type == VolSignal.SELL_EXH and sd_signal == 'SELL':
+                        volume_boost += 1.5  # Selling exhaustion supports contrarian SELL (which becomes BUY)
+                        confluences.append(f"{tf} Selling Exhaustion")
             
             # Apply volume enhancement
             enhanced_strength = min(10.0, original_strength + volume_boost)
@@ -766,15 +926,15 @@ class SignalGenerator:
             # Volume-based filtering
             if volume_score < 3.0 and enhanced_strength < 8.0:
                 # Poor volume pattern - downgrade signal significantly
-                print(f"⚠️ Volume analysis suggests avoiding {symbol} (Volume Score: {volume_score:.1f})")
+                logger.info("⚠️ Volume analysis suggests avoiding %s (Volume Score: %.1f)", symbol, volume_score)
                 return None
             
-            print(f"🔊 Volume enhancement: {original_strength:.1f} → {enhanced_strength:.1f} (+{volume_boost:.1f})")
+            logger.debug("🔊 Volume enhancement: %.1f → %.1f (%+.1f)", original_strength, enhanced_strength, volume_boost)
             
             return signal_data
             
         except Exception as e:
-            print(f"❌ Volume enhancement error for {symbol}: {e}")
+            logger.error("❌ Volume enhancement error for %s: %s", symbol, e)
             return signal_data
 
 
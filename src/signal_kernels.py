@@ -0,0 +1,454 @@
+"""
+Compiled kernels for the signal generator and volume analyzer hot paths.
+Numba is optional - without it the kernels run as plain Python.
+
+Kernels are declared with explicit signatures, so Numba compiles them (or
+loads them from its on-disk cache) at import instead of on the first call.
+They expect C-contiguous float64 arrays.
+"""
+
+import sys
+from enum import IntEnum
+
+import numpy as np
+
+# Scripts import this module as either 'signal_kernels' or 'src.signal_kernels'. Register it under
+# both so there is one module object, and Numba's on-disk cache (which records the
+# importing module name) loads from either spelling.
+sys.modules.setdefault('signal_kernels', sys.modules[__name__])
+sys.modules.setdefault('src.signal_kernels', sys.modules[__name__])
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+class TFIndex(IntEnum):
+    """Field positions in a timeframe analysis array."""
+    PRICE = 0
+    RSI = 1
+    EMA20 = 2
+    EMA50 = 3
+    MACD = 4
+    MACD_SIGNAL = 5
+    BB_UPPER = 6
+    BB_LOWER = 7
+    SUPPORT = 8
+    RESISTANCE = 9
+    ATR = 10
+
+
+N_TF_FIELDS = len(TFIndex)
+
+
+class Confluence(IntEnum):
+    """Bit positions of the day trading confluence flags."""
+    M5_RSI_EXTREME_OVERBOUGHT = 0
+    M5_RSI_EXTREME_OVERSOLD = 1
+    M5_MACD_STRONG_BULLISH = 2
+    M5_MACD_STRONG_BEARISH = 3
+    M15_RSI_OVERBOUGHT = 4
+    M15_RSI_OVERSOLD = 5
+    M15_STRONG_UPTREND = 6
+    M15_STRONG_DOWNTREND = 7
+    H1_RSI_HIGH = 8
+    H1_RSI_LOW = 9
+    H1_ABOVE_BB_UPPER = 10
+    H1_BELOW_BB_LOWER = 11
+    H4_RSI_OVERBOUGHT_BIAS = 12
+    H4_RSI_OVERSOLD_BIAS = 13
+    MTF_RSI_OVERBOUGHT = 14
+    MTF_RSI_OVERSOLD = 15
+    NEAR_H1_RESISTANCE = 16
+    NEAR_H1_SUPPORT = 17
+    MOMENTUM_UP_RSI_OVERBOUGHT = 18
+    MOMENTUM_DOWN_RSI_OVERSOLD = 19
+
+
+# Human-readable confluence names, materialized only for signals that are kept
+DAY_TRADING_CONFLUENCES = {
+    Confluence.M5_RSI_EXTREME_OVERBOUGHT: "M5 RSI Extreme Overbought (75+)",
+    Confluence.M5_RSI_EXTREME_OVERSOLD: "M5 RSI Extreme Oversold (25-)",
+    Confluence.M5_MACD_STRONG_BULLISH: "M5 MACD Strong Bullish",
+    Confluence.M5_MACD_STRONG_BEARISH: "M5 MACD Strong Bearish",
+    Confluence.M15_RSI_OVERBOUGHT: "M15 RSI Overbought (70+)",
+    Confluence.M15_RSI_OVERSOLD: "M15 RSI Oversold (30-)",
+    Confluence.M15_STRONG_UPTREND: "M15 Strong Uptrend",
+    Confluence.M15_STRONG_DOWNTREND: "M15 Strong Downtrend",
+    Confluence.H1_RSI_HIGH: "H1 RSI High",
+    Confluence.H1_RSI_LOW: "H1 RSI Low",
+    Confluence.H1_ABOVE_BB_UPPER: "H1 Price Above Bollinger Upper",
+    Confluence.H1_BELOW_BB_LOWER: "H1 Price Below Bollinger Lower",
+    Confluence.H4_RSI_OVERBOUGHT_BIAS: "H4 RSI Overbought Bias",
+    Confluence.H4_RSI_OVERSOLD_BIAS: "H4 RSI Oversold Bias",
+    Confluence.MTF_RSI_OVERBOUGHT: "Multi-TF RSI Overbought Alignment",
+    Confluence.MTF_RSI_OVERSOLD: "Multi-TF RSI Oversold Alignment",
+    Confluence.NEAR_H1_RESISTANCE: "Near H1 Resistance Level",
+    Confluence.NEAR_H1_SUPPORT: "Near H1 Support Level",
+    Confluence.MOMENTUM_UP_RSI_OVERBOUGHT: "Momentum Up + RSI Overbought",
+    Confluence.MOMENTUM_DOWN_RSI_OVERSOLD: "Momentum Down + RSI Oversold",
+}
+
+
+@njit('UniTuple(int64, 3)(float64[::1], float64[::1], float64[::1], float64[::1])',
+      nogil=True, cache=True)
+def score_day_trading(m5, m15, h1, h4):
+    """Score the M5/M15/H1/H4 analysis arrays. Returns (bullish, bearish, confluence flags)."""
+    bullish = 0
+    bearish = 0
+    flags = 0
+
+    m5_rsi = m5[TFIndex.RSI]
+    m5_macd = m5[TFIndex.MACD]
+    m5_macd_signal = m5[TFIndex.MACD_SIGNAL]
+    m15_rsi = m15[TFIndex.RSI]
+    m15_price = m15[TFIndex.PRICE]
+    m15_ema20 = m15[TFIndex.EMA20]
+    m15_ema50 = m15[TFIndex.EMA50]
+    h1_rsi = h1[TFIndex.RSI]
+    h1_price = h1[TFIndex.PRICE]
+    h4_rsi = h4[TFIndex.RSI]
+
+    # M5 precision
+    if m5_rsi > 75:
+        bearish += 3
+        flags |= 1 << Confluence.M5_RSI_EXTREME_OVERBOUGHT
+    if m5_rsi < 25:
+        bullish += 3
+        flags |= 1 << Confluence.M5_RSI_EXTREME_OVERSOLD
+    if m5_macd > m5_macd_signal and m5_macd > 0:
+        bearish += 1
+        flags |= 1 << Confluence.M5_MACD_STRONG_BULLISH
+    if m5_macd < m5_macd_signal and m5_macd < 0:
+        bullish += 1
+        flags |= 1 << Confluence.M5_MACD_STRONG_BEARISH
+
+    # M15 timing
+    if m15_rsi > 70:
+        bearish += 2
+        flags |= 1 << Confluence.M15_RSI_OVERBOUGHT
+    if m15_rsi < 30:
+        bullish += 2
+        flags |= 1 << Confluence.M15_RSI_OVERSOLD
+    if m15_price > m15_ema20 and m15_ema20 > m15_ema50:
+        bearish += 2
+        flags |= 1 << Confluence.M15_STRONG_UPTREND
+    if m15_price < m15_ema20 and m15_ema20 < m15_ema50:
+        bullish += 2
+        flags |= 1 << Confluence.M15_STRONG_DOWNTREND
+
+    # H1 confirmation
+    if h1_rsi > 65:
+        bearish += 1
+        flags |= 1 << Confluence.H1_RSI_HIGH
+    if h1_rsi < 35:
+        bullish += 1
+        flags |= 1 << Confluence.H1_RSI_LOW
+    if h1_price > h1[TFIndex.BB_UPPER]:
+        bearish += 3
+        flags |= 1 << Confluence.H1_ABOVE_BB_UPPER
+    if h1_price < h1[TFIndex.BB_LOWER]:
+        bullish += 3
+        flags |= 1 << Confluence.H1_BELOW_BB_LOWER
+
+    # H4 bias
+    if h4_rsi > 60:
+        bearish += 1
+        flags |= 1 << Confluence.H4_RSI_OVERBOUGHT_BIAS
+    if h4_rsi < 40:
+        bullish += 1
+        flags |= 1 << Confluence.H4_RSI_OVERSOLD_BIAS
+
+    # Multi-timeframe RSI alignment
+    if m5_rsi > 70 and m15_rsi > 65 and h1_rsi > 60:
+        bearish += 2
+        flags |= 1 << Confluence.MTF_RSI_OVERBOUGHT
+    if m5_rsi < 30 and m15_rsi < 35 and h1_rsi < 40:
+        bullish += 2
+        flags |= 1 << Confluence.MTF_RSI_OVERSOLD
+
+    # Proximity to H1 levels
+    current_price = m5[TFIndex.PRICE]
+    if current_price >= h1[TFIndex.RESISTANCE] * 0.9995:
+        bearish += 2
+        flags |= 1 << Confluence.NEAR_H1_RESISTANCE
+    if current_price <= h1[TFIndex.SUPPORT] * 1.0005:
+        bullish += 2
+        flags |= 1 << Confluence.NEAR_H1_SUPPORT
+
+    # Momentum vs RSI
+    h1_ema20 = h1[TFIndex.EMA20]
+    if (m15_price > m15_ema20 and h1_price > h1_ema20) and (m5_rsi > 70 or m15_rsi > 70):
+        bearish += 2
+        flags |= 1 << Confluence.MOMENTUM_UP_RSI_OVERBOUGHT
+    if (m15_price < m15_ema20 and h1_price < h1_ema20) and (m5_rsi < 30 or m15_rsi < 30):
+        bullish += 2
+        flags |= 1 << Confluence.MOMENTUM_DOWN_RSI_OVERSOLD
+
+    return bullish, bearish, flags
+
+
+def confluence_names(flags, names=DAY_TRADING_CONFLUENCES):
+    """Translate a confluence bitmask into its list of names (in Confluence order)."""
+    return [name for code, name in names.items() if flags & (1 << code)]
+
+
+def confluence_count(flags):
+    """Number of confluences set in a bitmask."""
+    return bin(flags).count("1")
+
+
+@njit('UniTuple(float64, 2)(float64[::1], float64[::1], float64, int64)', nogil=True, cache=True)
+def find_support_resistance(high, low, current_price, window):
+    """Nearest swing low below and swing high above the current price (NaN when none)."""
+    n = high.shape[0]
+    support = np.nan
+    resistance = np.nan
+
+    for i in range(window, n - window):
+        # Swing low: no bar in the window has a lower low
+        level = low[i]
+        if level < current_price and not (level <= support):
+            is_swing = True
+            for j in range(i - window, i + window + 1):
+                if low[j] < level:
+                    is_swing = False
+                    break
+            if is_swing:
+                support = level
+
+        # Swing high: no bar in the window has a higher high
+        level = high[i]
+        if level > current_price and not (level >= resistance):
+            is_swing = True
+            for j in range(i - window, i + window + 1):
+                if high[j] > level:
+                    is_swing = False
+                    break
+            if is_swing:
+                resistance = level
+
+    return support, resistance
+
+
+@njit('UniTuple(float64, 8)(float64[::1], float64[::1], float64[::1])', nogil=True, cache=True)
+def indicator_stack(close, high, low):
+    """
+    Latest RSI(14), EMA20, EMA50, MACD(12, 26, 9), Bollinger(20, 2) and ATR(14)
+    in one pass over the bars. Same definitions and defaults as the
+    SignalGenerator._calculate_* fallbacks.
+
+    Returns (rsi, ema_20, ema_50, macd, macd_signal, bb_upper, bb_lower, atr).
+    """
+    n = close.shape[0]
+    price = close[n - 1]
+
+    k12 = 2.0 / 13.0
+    k26 = 2.0 / 27.0
+    k20 = 2.0 / 21.0
+    k50 = 2.0 / 51.0
+    k9 = 2.0 / 10.0
+
+    ema12 = ema26 = ema20 = ema50 = 0.0
+    macd = macd_signal = 0.0
+    macd_count = 0
+    avg_gain = avg_loss = 0.0
+    atr = 0.0
+
+    for i in range(n):
+        x = close[i]
+
+        # EMAs seeded with the simple average of their first period
+        if i < 12:
+            ema12 += x
+            if i == 11:
+                ema12 /= 12.0
+        else:
+            ema12 = x * k12 + ema12 * (1.0 - k12)
+        if i < 20:
+            ema20 += x
+            if i == 19:
+                ema20 /= 20.0
+        else:
+            ema20 = x * k20 + ema20 * (1.0 - k20)
+        if i < 26:
+            ema26 += x
+            if i == 25:
+                ema26 /= 26.0
+        else:
+            ema26 = x * k26 + ema26 * (1.0 - k26)
+        if i < 50:
+            ema50 += x
+            if i == 49:
+                ema50 /= 50.0
+        else:
+            ema50 = x * k50 + ema50 * (1.0 - k50)
+
+        # MACD line from bar 26 on, signal EMA9 seeded from its first 9 values
+        if i >= 25:
+            macd = ema12 - ema26
+            if macd_count < 9:
+                macd_signal += macd
+                if macd_count == 8:
+                    macd_signal /= 9.0
+            else:
+                macd_signal = macd * k9 + macd_signal * (1.0 - k9)
+            macd_count += 1
+
+        if i == 0:
+            continue
+
+        # RSI with Wilder smoothing over close-to-close changes
+        delta = x - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= 14:
+            avg_gain += gain
+            avg_loss += loss
+            if i == 14:
+                avg_gain /= 14.0
+                avg_loss /= 14.0
+        else:
+            avg_gain = (avg_gain * 13.0 + gain) / 14.0
+            avg_loss = (avg_loss * 13.0 + loss) / 14.0
+
+        # ATR with Wilder smoothing over true ranges
+        true_range = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        if i <= 14:
+            atr += true_range
+            if i == 14:
+                atr /= 14.0
+        else:
+            atr = (atr * 13.0 + true_range) / 14.0
+
+    if n < 15:
+        rsi = 50.0
+        atr = 0.001
+    elif avg_loss == 0:
+        rsi = 100.0
+    else:
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    if n < 20:
+        ema20 = price
+    if n < 50:
+        ema50 = price
+    if n < 26:
+        macd = 0.0
+    if macd_count < 9:
+        macd_signal = 0.0
+
+    # Bollinger Bands over the last 20 closes (population std)
+    if n < 20:
+        bb_upper = bb_lower = price
+    else:
+        mean = 0.0
+        for i in range(n - 20, n):
+            mean += close[i]
+        mean /= 20.0
+        var = 0.0
+        for i in range(n - 20, n):
+            var += (close[i] - mean) ** 2
+        std = np.sqrt(var / 20.0)
+        bb_upper = mean + 2.0 * std
+        bb_lower = mean - 2.0 * std
+
+    return rsi, ema20, ema50, macd, macd_signal, bb_upper, bb_lower, atr
+
+
+@njit('float64(boolean, boolean, float64, float64, boolean, boolean, float64)', nogil=True, cache=True)
+def score_volume(volume_spike, volume_dry_up, divergence_strength, exhaustion_strength,
+                 ad_signal_present, volume_trend_decreasing, volume_trend_strength):
+    """Contrarian volume score (0-10); pass 0.0 strengths for undetected patterns."""
+    score = 5.0  # Base score
+    if volume_spike:
+        score += 2.0  # Potential exhaustion
+    if volume_dry_up:
+        score += 1.0  # Potential accumulation before reversal
+    score += divergence_strength / 10
+    score += min(3.0, exhaustion_strength / 10)
+    if ad_signal_present:
+        score += 1.0
+    if volume_trend_decreasing and volume_trend_strength > 0.2:
+        score += 1.0  # Decreasing volume can signal reversal
+    return min(10.0, max(0.0, score))
+
+
+@njit('Tuple((int64, float64, int64, float64, int64))(float64[::1], float64[::1], float64[::1], '
+      'float64[::1], float64)', nogil=True, cache=True, error_model='numpy')
+def classify_volume_patterns(prices, volumes, highs, lows, avg_volume):
+    """
+    Price-volume divergence and exhaustion checks of the volume analyzer.
+
+    Divergence compares the last 10 bars (price change vs first/last 3-bar
+    volume average); exhaustion looks for a climax volume on a wide-range bar
+    among the last 5. Types are VolSignal values (0 when not detected).
+    Returns (divergence_type, divergence_strength, exhaustion_type,
+    exhaustion_strength, exhaustion_bar).
+    """
+    n = volumes.shape[0]
+    divergence_type = 0
+    divergence_strength = 0.0
+    exhaustion_type = 0
+    exhaustion_strength = 0.0
+    exhaustion_bar = -1
+
+    # Divergence: price moving on declining volume
+    start = max(0, n - 10)
+    if n - start >= 5:
+        price_momentum = (prices[n - 1] - prices[start]) / prices[start]
+        first_mean = (volumes[start] + volumes[start + 1] + volumes[start + 2]) / 3.0
+        last_mean = (volumes[n - 3] + volumes[n - 2] + volumes[n - 1]) / 3.0
+        volume_momentum = (last_mean - first_mean) / first_mean
+        if volume_momentum < -0.2:
+            if price_momentum > 0.001:
+                divergence_type = 2  # BEAR_DIV
+                divergence_strength = abs(volume_momentum) * 100
+            elif price_momentum < -0.001:
+                divergence_type = 1  # BULL_DIV
+                divergence_strength = abs(volume_momentum) * 100
+
+    # Exhaustion: climax volume on one of the last 5 bars, not the first three, on a wide range
+    if n >= 10:
+        first = n - 5
+        max_bar = 0
+        range_sum = 0.0
+        for i in range(5):
+            if volumes[first + i] > volumes[first + max_bar]:
+                max_bar = i
+            range_sum += highs[first + i] - lows[first + i]
+        max_volume = volumes[first + max_bar]
+        if (max_bar >= 3 and max_volume > avg_volume * 2.0
+                and highs[first + max_bar] - lows[first + max_bar] > range_sum / 5.0 * 1.5):
+            exhaustion_strength = max_volume / avg_volume * 10
+            exhaustion_bar = max_bar
+            if prices[first + max_bar] > prices[first]:
+                exhaustion_type = 3  # BUY_EXH
+            else:
+                exhaustion_type = 4  # SELL_EXH
+
+    return divergence_type, divergence_strength, exhaustion_type, exhaustion_strength, exhaustion_bar
+
+
+def warmup_kernels():
+    """Run every kernel once on dummy data so no compile or cache load happens mid-cycle."""
+    if not NUMBA_AVAILABLE:
+        return
+    bars = np.linspace(1.0, 1.1, 64)
+    analysis = np.zeros(N_TF_FIELDS, dtype=np.float64)
+    indicator_stack(bars, bars + 0.001, bars - 0.001)
+    find_support_resistance(bars + 0.001, bars - 0.001, 1.05, 5)
+    score_day_trading(analysis, analysis, analysis, analysis)
+    score_volume(True, False, 1.0, 1.0, True, True, 1.0)
+    classify_volume_patterns(bars, bars, bars + 0.001, bars - 0.001, 1.0)
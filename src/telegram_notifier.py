@@ -6,9 +6,15 @@ Sends real-time trading notifications via Telegram.
 """
 
 import os
+import functools
+import queue
+import threading
+import time
 import requests
-from datetime import datetime
-from colorama import Fore, Style
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env file
 try:
@@ -25,6 +31,260 @@ except ImportError:
     except FileNotFoundError:
         pass
 
+# Shared keep-alive session so each message reuses pooled TLS connections.
+# sendMessage is not idempotent, so only a failed connect (request never sent) is
+# retried; read timeouts and error statuses are not, as Telegram may already have
+# accepted the message. Status codes are handled in _post_one.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=1,
+        connect=1,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=0.3,
+        raise_on_status=False
+    )
+))
+
+# (connect, read) timeouts for a single Bot API call. With the connect retry the worst
+# case is 2 x 3.05 + 0.3 backoff + 5 = 11.4 s, inside SEND_TIMEOUT.
+REQUEST_TIMEOUT = (3.05, 5)
+
+# Wall-clock budget for a blocking broadcast to all recipients
+SEND_TIMEOUT = 12
+
+# Telegram Bot API limits: ~30 messages/s overall (paced at 25 for headroom), ~1 message/s per chat
+GLOBAL_MESSAGES_PER_SECOND = 25
+CHAT_MESSAGES_PER_SECOND = 1
+
+# Background messages waiting beyond this are dropped rather than queued
+MAX_QUEUED_MESSAGES = 1000
+
+# Background messages for the same chat arriving within this window (seconds) are
+# joined into one Bot API message, up to Telegram's text length limit
+BATCH_WINDOW = 0.1
+MAX_BATCH_MESSAGES = 10
+MAX_MESSAGE_LENGTH = 4096
+
+
+# Message templates as %-format strings with the number formats built in, so callers
+# pass raw values (%(time)s is filled in by TelegramNotifier._render)
+_TEMPLATES = {
+    'trade_alert': """🎯 <b>TRADE EXECUTED%(reversal_text)s</b>
+
+📊 <b>Pair:</b> %(symbol)s
+%(reversal_emoji)s <b>Action:</b> %(action)s
+💰 <b>Entry:</b> %(entry_price).5f
+🛑 <b>Stop Loss:</b> %(sl_price).5f
+🎯 <b>Take Profit:</b> %(tp_price).5f
+📦 <b>Lot Size:</b> %(lot_size)s
+
+⏰ <b>Time:</b> %(time)s UTC""",
+
+    'system_status': """%(status_emoji)s <b>SYSTEM STATUS</b>
+
+<b>Status:</b> %(status)s
+<b>Time:</b> %(time)s UTC
+
+%(details)s""",
+
+    'signal_alert': """📡 <b>SIGNAL GENERATED</b>
+
+📊 <b>Pair:</b> %(symbol)s
+🔥 <b>Action:</b> %(signal_type)s
+%(strength_emoji)s <b>Strength:</b> %(strength)s/10
+🎯 <b>Confluences:</b> %(confluence_count)s
+
+⏰ <b>Time:</b> %(time)s UTC""",
+
+    'test_connection': """🔧 <b>TELEGRAM TEST</b>
+
+✅ Connection test successful!
+📅 %(time)s UTC
+
+Contrarian Trading System is ready to send notifications.""",
+
+    'tp_hit': """🎯 <b>TAKE PROFIT HIT%(reversal_text)s</b>
+
+📊 <b>Pair:</b> %(symbol)s
+%(reversal_emoji)s <b>Action:</b> %(action)s
+💰 <b>Entry:</b> %(entry_price).5f
+🎯 <b>Exit:</b> %(exit_price).5f
+💵 <b>Profit:</b> +%(profit_pips).1f pips
+
+⏰ <b>Time:</b> %(time)s UTC
+🎊 <b>Status:</b> TARGET ACHIEVED! 🎊""",
+
+    'sl_hit': """🛑 <b>STOP LOSS HIT%(reversal_text)s</b>
+
+📊 <b>Pair:</b> %(symbol)s
+%(reversal_emoji)s <b>Action:</b> %(action)s
+💰 <b>Entry:</b> %(entry_price).5f
+🛑 <b>Exit:</b> %(exit_price).5f
+📉 <b>Loss:</b> -%(loss_pips).1f pips
+
+⏰ <b>Time:</b> %(time)s UTC
+🔐 <b>Status:</b> RISK MANAGED""",
+
+    'priority_trade': """
+🚨 PRIORITY TRADE EXECUTED 🚨
+
+💎 Symbol: %(symbol)s
+📈 Signal: %(signal_type)s
+⭐ Strength: %(signal_strength).1f/10
+🔥 Status: %(message)s
+
+⚡ This was the STRONGEST signal available!
+💰 Risk: $5 fixed per trade
+📊 Max 2 concurrent trades allowed
+🛡️ Professional risk management active
+        """,
+
+    'reversal_close': """🚨 <b>TRADE CLOSED ON REVERSAL</b>
+
+📊 <b>Pair:</b> %(symbol)s
+🔄 <b>Action:</b> %(action)s
+💰 <b>Entry:</b> %(entry_price).5f
+🚪 <b>Exit:</b> %(exit_price).5f
+📊 <b>Result:</b> %(pips)+.1f pips
+
+🔄 <b>Reason:</b> Major reversal signal detected
+⚡ <b>Action:</b> Position closed for risk management
+
+⏰ <b>Time:</b> %(time)s UTC""",
+
+    'enhanced_trade_alert': """🎯 <b>ENHANCED TRADE EXECUTED%(reversal_text)s</b>
+
+📊 <b>Pair:</b> %(symbol)s
+%(reversal_emoji)s <b>Action:</b> %(action)s
+💰 <b>Entry:</b> %(entry_price).5f
+📦 <b>Lot Size:</b> %(lot_size)s
+⭐ <b>Signal Strength:</b> %(signal_strength).1f/10
+
+📈 <b>ENHANCED TP/SL LEVELS:</b>
+🛑 <b>Stop Loss:</b> %(sl_price).5f
+🎯 <b>TP1:</b> %(tp1_price).5f (50%%)
+🎯 <b>TP2:</b> %(tp2_price).5f (30%%)  
+🎯 <b>TP3:</b> %(tp3_price).5f (20%%)
+
+⚡ <b>Session Multiplier:</b> %(session_multiplier).2f
+💪 <b>Strength Multiplier:</b> %(strength_multiplier).2f
+🎯 <b>Final Multiplier:</b> %(final_multiplier).2f
+
+⏰ <b>Time:</b> %(time)s UTC""",
+
+    'enhanced_tp_hit': """🎯 <b>%(tp_level)s HIT!%(contrarian_text)s</b>
+
+📊 <b>Pair:</b> %(symbol)s
+🎯 <b>Action:</b> %(action)s
+💰 <b>Entry:</b> %(entry_price).5f
+💰 <b>Exit:</b> %(exit_price).5f
+💵 <b>Profit:</b> +%(profit_pips).1f pips
+📊 <b>Position Closed:</b> %(close_percent)s%%
+
+⏰ <b>Time:</b> %(time)s UTC
+🎯 <b>Status:</b> PARTIAL PROFIT TAKEN""",
+
+    'volume_trade': """🚀 <b>HIGH VOLUME TRADE EXECUTED</b>
+
+📊 <b>Pair:</b> %(symbol)s
+🎯 <b>Action:</b> %(action)s
+💰 <b>Entry:</b> %(entry_price).5f
+📈 <b>Volume Score:</b> %(volume_score).1f/10 (HIGH)
+⭐ <b>Signal Strength:</b> %(signal_strength).1f/10
+
+🛑 <b>Stop Loss:</b> %(sl).5f
+🎯 <b>TP1:</b> %(tp1).5f
+🎯 <b>TP2:</b> %(tp2).5f
+🎯 <b>TP3:</b> %(tp3).5f
+
+📊 <b>Volume Multiplier:</b> %(volume_multiplier).2fx
+
+🔗 <b>Confluences:</b>
+%(confluences_text)s
+
+⏰ <b>Time:</b> %(time)s UTC
+💡 <b>Strategy:</b> Volume-Based Direct Execution""",
+}
+
+# UTC timestamp string memoized per wall-clock second ([second, text])
+_timestamp_cache = [None, ""]
+
+
+def _now_utc_str():
+    """Current UTC time as 'YYYY-mm-dd HH:MM:SS', formatted at most once per second."""
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache[:] = [second, datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')]
+    return _timestamp_cache[1]
+
+
+def _requires_enabled(method):
+    """Skip building and sending the message when notifications are disabled."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.enabled:
+            return False
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _TokenBucket:
+    """Token bucket that hands out reservations (tokens may go negative while callers wait)."""
+    
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+    
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self, now):
+        """Take one token and return how long the caller has to wait for it."""
+        self._refill(now)
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+    
+    def hold(self, now, seconds):
+        """Make the next token available no sooner than `seconds` from now."""
+        self._refill(now)
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+
+class _RateLimiter:
+    """Paces sends against a global bucket and one bucket per chat."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._global_bucket = _TokenBucket(GLOBAL_MESSAGES_PER_SECOND, GLOBAL_MESSAGES_PER_SECOND)
+        self._chat_buckets = {}
+    
+    def _chat_bucket(self, chat_id):
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = _TokenBucket(1, CHAT_MESSAGES_PER_SECOND)
+        return bucket
+    
+    def acquire(self, chat_id):
+        """Block until a message may be sent to chat_id."""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = max(self._global_bucket.reserve(now), self._chat_bucket(chat_id).reserve(now))
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def penalize(self, chat_id, retry_after):
+        """Hold back a chat for the retry_after seconds Telegram asked for."""
+        with self._lock:
+            self._chat_bucket(chat_id).hold(time.monotonic(), retry_after)
+
 
 class TelegramNotifier:
     """
@@ -33,11 +293,31 @@ class TelegramNotifier:
     Sends trading notifications, alerts, and system status updates.
     """
     
-    def __init__(self):
-        """Initialize Telegram notifier."""
+    def __init__(self, blocking=True):
+        """
+        Initialize Telegram notifier.
+        
+        Args:
+            blocking (bool): Wait for delivery in send_message. The trading loop
+                uses False so notifications are sent in the background.
+        """
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN', '')
+        self._url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
         self.chat_ids = self._parse_chat_ids(os.getenv('TELEGRAM_CHAT_ID', ''))
         self.enabled = os.getenv('TELEGRAM_ENABLED', 'False').lower() == 'true'
+        self.blocking = blocking
+        self._limiter = _RateLimiter()
+        
+        # Blocking sends: one worker per recipient (capped) so a slow chat never delays the others
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(8, len(self.chat_ids) or 1),
+            thread_name_prefix="telegram"
+        )
+        
+        # Background sends: a bounded queue drained by a single sender thread (started on first use)
+        self._queue = queue.Queue(maxsize=MAX_QUEUED_MESSAGES)
+        self._sender = None
+        self._sender_lock = threading.Lock()
         
         if self.enabled and self.bot_token and self.chat_ids:
             print(f"📱 Telegram configured for {len(self.chat_ids)} recipient(s)")
@@ -53,33 +333,52 @@ class TelegramNotifier:
         chat_ids = [id.strip() for id in chat_id_string.split(',') if id.strip()]
         return chat_ids
     
-    def send_message(self, message, parse_mode='HTML'):
-        """Send message to all configured chat IDs."""
+    def _post_one(self, chat_id, message, parse_mode):
+        """Send message to a single chat ID. Returns True on success."""
+        try:
+            payload = {
+                'chat_id': chat_id,
+                'text': message,
+                'parse_mode': parse_mode,
+                'disable_web_page_preview': True
+            }
+            
+            # Paced sends; a 429 pushes the chat back by retry_after and is retried once
+            for attempt in range(2):
+                self._limiter.acquire(chat_id)
+                response = _SESSION.post(self._url, json=payload, timeout=REQUEST_TIMEOUT)
+                
+                if response.status_code == 200:
+                    return True
+                if response.status_code != 429 or attempt:
+                    break
+                retry_after = response.json().get('parameters', {}).get('retry_after', 1)
+                self._limiter.penalize(chat_id, retry_after)
+                
+            print(f"❌ Telegram send failed for chat {chat_id}: {response.status_code}")
+            
+        except Exception as e:
+            print(f"❌ Telegram error for chat {chat_id}: {str(e)}")
+        return False
+    
+    def send_message(self, message, parse_mode='HTML', blocking=None):
+        """
+        Send message to all configured chat IDs concurrently.
+        
+        Non-blocking sends (see send_message_async) return True once queued.
+        """
         if not self.enabled or not self.bot_token or not self.chat_ids:
             return False
         
-        success_count = 0
+        if not (self.blocking if blocking is None else blocking):
+            return self.send_message_async(message, parse_mode)
         
-        for chat_id in self.chat_ids:
-            try:
-                url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-                
-                payload = {
-                    'chat_id': chat_id,
-                    'text': message,
-                    'parse_mode': parse_mode,
-                    'disable_web_page_preview': True
-                }
-                
-                response = requests.post(url, json=payload, timeout=10)
-                
-                if response.status_code == 200:
-                    success_count += 1
-                else:
-                    print(f"❌ Telegram send failed for chat {chat_id}: {response.status_code}")
-                    
-            except Exception as e:
-                print(f"❌ Telegram error for chat {chat_id}: {str(e)}")
+        futures = [
+            self._executor.submit(self._post_one, chat_id, message, parse_mode)
+            for chat_id in self.chat_ids
+        ]
+        done, _ = wait(futures, timeout=SEND_TIMEOUT)
+        success_count = sum(1 for future in done if future.result())
         
         if success_count > 0:
             print(f"📱 Telegram message sent to {success_count}/{len(self.chat_ids)} recipients")
@@ -88,60 +387,127 @@ class TelegramNotifier:
             print("❌ Failed to send Telegram message to any recipients")
             return False
     
-    def send_trade_alert(self, symbol, action, entry_price, sl_price, tp_price, lot_size, reversed=False):
-        """Send trade execution alert."""
-        if not self.enabled:
+    def send_message_async(self, message, parse_mode='HTML'):
+        """
+        Queue message for all configured chat IDs and return immediately.
+        
+        When the queue is full (e.g. Telegram unreachable) the message is dropped
+        so the trading loop is never held up.
+        """
+        if not self.enabled or not self.bot_token or not self.chat_ids:
             return False
         
-        reversal_emoji = "🔄" if reversed else "➡️"
-        reversal_text = " (CONTRARIAN)" if reversed else ""
+        self._start_sender()
+        queued = 0
+        for chat_id in self.chat_ids:
+            try:
+                self._queue.put_nowait((chat_id, message, parse_mode))
+                queued += 1
+            except queue.Full:
+                print(f"⚠️ Telegram queue full - dropping message for chat {chat_id}")
+        return queued > 0
+    
+    def flush(self, timeout=SEND_TIMEOUT):
+        """Wait up to timeout seconds for queued messages to be sent. Returns True when drained."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+    
+    def _start_sender(self):
+        """Start the background sender thread once."""
+        if self._sender is not None:
+            return
+        with self._sender_lock:
+            if self._sender is None:
+                self._sender = threading.Thread(target=self._drain, name="telegram-sender", daemon=True)
+                self._sender.start()
+    
+    def _drain(self):
+        """Sender thread: deliver queued messages in short batches, paced by the rate limiter."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH_MESSAGES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                for chat_id, message, parse_mode, count in self._coalesce(batch):
+                    if not self._post_one(chat_id, message, parse_mode):
+                        print(f"⚠️ Telegram dropped {count} queued message(s) for chat {chat_id}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    @staticmethod
+    def _coalesce(batch):
+        """
+        Join consecutive messages per chat (same parse mode) while they fit in one Telegram message.
         
-        message = f"""🎯 <b>TRADE EXECUTED{reversal_text}</b>
-
-📊 <b>Pair:</b> {symbol}
-{reversal_emoji} <b>Action:</b> {action}
-💰 <b>Entry:</b> {entry_price:.5f}
-🛑 <b>Stop Loss:</b> {sl_price:.5f}
-🎯 <b>Take Profit:</b> {tp_price:.5f}
-📦 <b>Lot Size:</b> {lot_size}
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC"""
-
-        return self.send_message(message)
+        Returns (chat_id, text, parse_mode, number of queued messages joined) tuples.
+        """
+        merged = {}  # chat_id -> [(parse_mode, messages), ...] in arrival order
+        for chat_id, message, parse_mode in batch:
+            groups = merged.setdefault(chat_id, [])
+            if groups and groups[-1][0] == parse_mode:
+                messages = groups[-1][1]
+                if sum(len(part) + 2 for part in messages) + len(message) <= MAX_MESSAGE_LENGTH:
+                    messages.append(message)
+                    continue
+            groups.append((parse_mode, [message]))
+        return [
+            (chat_id, "\n\n".join(messages), parse_mode, len(messages))
+            for chat_id, groups in merged.items()
+            for parse_mode, messages in groups
+        ]
     
+    def _render(self, template_name, **fields):
+        """Fill a message template; the timestamp is added automatically."""
+        fields['time'] = _now_utc_str()
+        return _TEMPLATES[template_name] % fields
+    
+    @_requires_enabled
+    def send_trade_alert(self, symbol, action, entry_price, sl_price, tp_price, lot_size, reversed=False):
+        """Send trade execution alert."""
+        return self.send_message(self._render(
+            'trade_alert',
+            reversal_emoji="🔄" if reversed else "➡️",
+            reversal_text=" (CONTRARIAN)" if reversed else "",
+            symbol=symbol,
+            action=action,
+            entry_price=entry_price,
+            sl_price=sl_price,
+            tp_price=tp_price,
+            lot_size=lot_size
+        ))
+    
+    @_requires_enabled
     def send_system_status(self, status, details=""):
         """Send system status update."""
-        if not self.enabled:
-            return False
-        
         status_emoji = "🚀" if "start" in status.lower() else "🛑" if "stop" in status.lower() else "ℹ️"
         
-        message = f"""{status_emoji} <b>SYSTEM STATUS</b>
-
-<b>Status:</b> {status}
-<b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-
-{details}"""
-
-        return self.send_message(message)
+        return self.send_message(self._render(
+            'system_status', status_emoji=status_emoji, status=status, details=details
+        ))
     
+    @_requires_enabled
     def send_signal_alert(self, symbol, signal_type, strength, confluences):
         """Send signal generation alert."""
-        if not self.enabled:
-            return False
-        
-        strength_emoji = "🔥" if strength >= 8.0 else "⭐"
-        
-        message = f"""📡 <b>SIGNAL GENERATED</b>
-
-📊 <b>Pair:</b> {symbol}
-🔥 <b>Action:</b> {signal_type}
-{strength_emoji} <b>Strength:</b> {strength}/10
-🎯 <b>Confluences:</b> {len(confluences)}
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC"""
-
-        return self.send_message(message)
+        return self.send_message(self._render(
+            'signal_alert',
+            symbol=symbol,
+            signal_type=signal_type,
+            strength_emoji="🔥" if strength >= 8.0 else "⭐",
+            strength=strength,
+            confluence_count=len(confluences)
+        ))
     
     def test_connection(self):
         """Test Telegram connection."""
@@ -149,175 +515,112 @@ class TelegramNotifier:
             print("❌ Telegram not properly configured")
             return False
         
-        test_message = f"""🔧 <b>TELEGRAM TEST</b>
-
-✅ Connection test successful!
-📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-
-Contrarian Trading System is ready to send notifications."""
-
-        return self.send_message(test_message)
+        return self.send_message(self._render('test_connection'))
     
+    @_requires_enabled
     def send_tp_hit_notification(self, symbol, action, entry_price, exit_price, profit_pips, reversed=False):
         """Send take profit hit notification."""
-        if not self.enabled:
-            return False
-        
-        reversal_emoji = "🔄" if reversed else "➡️"
-        reversal_text = " (CONTRARIAN)" if reversed else ""
-        
-        message = f"""🎯 <b>TAKE PROFIT HIT{reversal_text}</b>
-
-📊 <b>Pair:</b> {symbol}
-{reversal_emoji} <b>Action:</b> {action}
-💰 <b>Entry:</b> {entry_price:.5f}
-🎯 <b>Exit:</b> {exit_price:.5f}
-💵 <b>Profit:</b> +{profit_pips:.1f} pips
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-🎊 <b>Status:</b> TARGET ACHIEVED! 🎊"""
-
-        return self.send_message(message)
+        return self.send_message(self._render(
+            'tp_hit',
+            reversal_emoji="🔄" if reversed else "➡️",
+            reversal_text=" (CONTRARIAN)" if reversed else "",
+            symbol=symbol,
+            action=action,
+            entry_price=entry_price,
+            exit_price=exit_price,
+            profit_pips=profit_pips
+        ))
     
+    @_requires_enabled
     def send_sl_hit_notification(self, symbol, action, entry_price, exit_price, loss_pips, reversed=False):
         """Send stop loss hit notification."""
-        if not self.enabled:
-            return False
-        
-        reversal_emoji = "🔄" if reversed else "➡️"
-        reversal_text = " (CONTRARIAN)" if reversed else ""
-        
-        message = f"""🛑 <b>STOP LOSS HIT{reversal_text}</b>
-
-📊 <b>Pair:</b> {symbol}
-{reversal_emoji} <b>Action:</b> {action}
-💰 <b>Entry:</b> {entry_price:.5f}
-🛑 <b>Exit:</b> {exit_price:.5f}
-📉 <b>Loss:</b> -{loss_pips:.1f} pips
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-🔐 <b>Status:</b> RISK MANAGED"""
-
-        return self.send_message(message)
-
+        return self.send_message(self._render(
+            'sl_hit',
+            reversal_emoji="🔄" if reversed else "➡️",
+            reversal_text=" (CONTRARIAN)" if reversed else "",
+            symbol=symbol,
+            action=action,
+            entry_price=entry_price,
+            exit_price=exit_price,
+            loss_pips=loss_pips
+        ))
+    
+    @_requires_enabled
     def send_priority_trade_notification(self, symbol, signal_type, signal_strength, message):
         """Send priority trade notification."""
-        priority_message = f"""
-🚨 PRIORITY TRADE EXECUTED 🚨
-
-💎 Symbol: {symbol}
-📈 Signal: {signal_type}
-⭐ Strength: {signal_strength:.1f}/10
-🔥 Status: {message}
-
-⚡ This was the STRONGEST signal available!
-💰 Risk: $5 fixed per trade
-📊 Max 2 concurrent trades allowed
-🛡️ Professional risk management active
-        """
-        
-        return self.send_message(message)
-        
+        return self.send_message(self._render(
+            'priority_trade',
+            symbol=symbol,
+            signal_type=signal_type,
+            signal_strength=signal_strength,
+            message=message
+        ))
+    
+    @_requires_enabled
     def send_reversal_close_notification(self, symbol, action, entry_price, exit_price, pips):
         """Send reversal close notification."""
-        if not self.enabled:
-            return False
-        
-        message = f"""🚨 <b>TRADE CLOSED ON REVERSAL</b>
-
-📊 <b>Pair:</b> {symbol}
-🔄 <b>Action:</b> {action}
-💰 <b>Entry:</b> {entry_price:.5f}
-🚪 <b>Exit:</b> {exit_price:.5f}
-📊 <b>Result:</b> {pips:+.1f} pips
-
-🔄 <b>Reason:</b> Major reversal signal detected
-⚡ <b>Action:</b> Position closed for risk management
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC"""
-
-        return self.send_message(message)
-        
+        return self.send_message(self._render(
+            'reversal_close',
+            symbol=symbol,
+            action=action,
+            entry_price=entry_price,
+            exit_price=exit_price,
+            pips=pips
+        ))
+    
+    @_requires_enabled
     def send_enhanced_trade_alert(self, symbol, action, entry_price, levels, lot_size, signal_strength, reversed=False):
         """Send enhanced trade entry notification with multiple TP levels."""
-        if not self.enabled:
-            return False
-            
-        reversal_emoji = "🔄" if reversed else "➡️"
-        reversal_text = " (CONTRARIAN)" if reversed else ""
-        
-        message = f"""🎯 <b>ENHANCED TRADE EXECUTED{reversal_text}</b>
-
-📊 <b>Pair:</b> {symbol}
-{reversal_emoji} <b>Action:</b> {action}
-💰 <b>Entry:</b> {entry_price:.5f}
-📦 <b>Lot Size:</b> {lot_size}
-⭐ <b>Signal Strength:</b> {signal_strength:.1f}/10
-
-📈 <b>ENHANCED TP/SL LEVELS:</b>
-🛑 <b>Stop Loss:</b> {levels['sl_price']:.5f}
-🎯 <b>TP1:</b> {levels['tp1_price']:.5f} (50%)
-🎯 <b>TP2:</b> {levels['tp2_price']:.5f} (30%)  
-🎯 <b>TP3:</b> {levels['tp3_price']:.5f} (20%)
-
-⚡ <b>Session Multiplier:</b> {levels['session_multiplier']:.2f}
-💪 <b>Strength Multiplier:</b> {levels['strength_multiplier']:.2f}
-🎯 <b>Final Multiplier:</b> {levels['final_multiplier']:.2f}
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC"""
-        
-        return self.send_message(message)
-        
+        return self.send_message(self._render(
+            'enhanced_trade_alert',
+            reversal_emoji="🔄" if reversed else "➡️",
+            reversal_text=" (CONTRARIAN)" if reversed else "",
+            symbol=symbol,
+            action=action,
+            entry_price=entry_price,
+            lot_size=lot_size,
+            signal_strength=signal_strength,
+            sl_price=levels['sl_price'],
+            tp1_price=levels['tp1_price'],
+            tp2_price=levels['tp2_price'],
+            tp3_price=levels['tp3_price'],
+            session_multiplier=levels['session_multiplier'],
+            strength_multiplier=levels['strength_multiplier'],
+            final_multiplier=levels['final_multiplier']
+        ))
+    
+    @_requires_enabled
     def send_enhanced_tp_hit_notification(self, symbol, action, entry_price, exit_price, profit_pips, tp_level, close_percent, contrarian=False):
         """Send enhanced TP hit notification."""
-        if not self.enabled:
-            return False
-            
-        contrarian_text = " (CONTRARIAN)" if contrarian else ""
-        
-        message = f"""🎯 <b>{tp_level} HIT!{contrarian_text}</b>
-
-📊 <b>Pair:</b> {symbol}
-🎯 <b>Action:</b> {action}
-💰 <b>Entry:</b> {entry_price:.5f}
-💰 <b>Exit:</b> {exit_price:.5f}
-💵 <b>Profit:</b> +{profit_pips:.1f} pips
-📊 <b>Position Closed:</b> {close_percent}%
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-🎯 <b>Status:</b> PARTIAL PROFIT TAKEN"""
-
-        return self.send_message(message)
+        return self.send_message(self._render(
+            'enhanced_tp_hit',
+            tp_level=tp_level,
+            contrarian_text=" (CONTRARIAN)" if contrarian else "",
+            symbol=symbol,
+            action=action,
+            entry_price=entry_price,
+            exit_price=exit_price,
+            profit_pips=profit_pips,
+            close_percent=close_percent
+        ))
     
+    @_requires_enabled
     def send_volume_trade_notification(self, symbol, action, entry_price, levels, signal_strength, volume_score, confluences):
         """Send volume-based trade notification."""
-        if not self.enabled:
-            return False
-        
-        confluences_text = "\n".join([f"• {conf}" for conf in confluences[:8]])  # Show top 8
-        
-        message = f"""🚀 <b>HIGH VOLUME TRADE EXECUTED</b>
-
-📊 <b>Pair:</b> {symbol}
-🎯 <b>Action:</b> {action}
-💰 <b>Entry:</b> {entry_price:.5f}
-📈 <b>Volume Score:</b> {volume_score:.1f}/10 (HIGH)
-⭐ <b>Signal Strength:</b> {signal_strength:.1f}/10
-
-🛑 <b>Stop Loss:</b> {levels['sl']:.5f}
-🎯 <b>TP1:</b> {levels['tp1']:.5f}
-🎯 <b>TP2:</b> {levels['tp2']:.5f}
-🎯 <b>TP3:</b> {levels['tp3']:.5f}
-
-📊 <b>Volume Multiplier:</b> {levels['volume_multiplier']:.2f}x
-
-🔗 <b>Confluences:</b>
-{confluences_text}
-
-⏰ <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-💡 <b>Strategy:</b> Volume-Based Direct Execution"""
-
-        return self.send_message(message)
+        return self.send_message(self._render(
+            'volume_trade',
+            symbol=symbol,
+            action=action,
+            entry_price=entry_price,
+            volume_score=volume_score,
+            signal_strength=signal_strength,
+            sl=levels['sl'],
+            tp1=levels['tp1'],
+            tp2=levels['tp2'],
+            tp3=levels['tp3'],
+            volume_multiplier=levels['volume_multiplier'],
+            confluences_text="\n".join(f"• {conf}" for conf in confluences[:8])  # Show top 8
+        ))
 
 
 def main():
@@ -0,0 +1,80 @@
+"""
+Compiled kernels for trade management simulations.
+Numba is optional - without it the kernels run as plain Python
+(see signal_kernels for the shared njit fallback).
+"""
+
+import sys
+from enum import IntEnum
+
+import numpy as np
+
+# Scripts import this module as either 'trade_kernels' or 'src.trade_kernels'. Register it under
+# both so there is one module object, and Numba's on-disk cache (which records the
+# importing module name) loads from either spelling.
+sys.modules.setdefault('trade_kernels', sys.modules[__name__])
+sys.modules.setdefault('src.trade_kernels', sys.modules[__name__])
+
+try:
+    from signal_kernels import njit
+except ImportError:
+    from src.signal_kernels import njit
+
+
+class TradeFlag(IntEnum):
+    """Bit positions of the trade state flags returned by simulate_trade_path."""
+    BREAKEVEN_SET = 0
+    TRAILING_ACTIVE = 1
+    TP1_HIT = 2
+    TP2_HIT = 3
+    TP3_HIT = 4
+
+
+@njit('Tuple((float64[::1], int64[::1]))(float64[::1], int64, float64, float64, float64, '
+      'float64, float64, float64, float64, float64)', nogil=True, cache=True)
+def simulate_trade_path(prices, side, entry_price, sl_price, breakeven_trigger, trailing_trigger,
+                        trail_distance, tp1_price, tp2_price, tp3_price):
+    """
+    Replay breakeven, trailing stop and TP checks over a price path.
+
+    Mirrors the per-tick _check_breakeven / _check_trailing_stop /
+    _update_trailing_stop / _check_tp_hits sequence of the trading system
+    (side is +1 for BUY, -1 for SELL). Returns the stop loss and the
+    TradeFlag bitmask after every price.
+    """
+    n = prices.shape[0]
+    sl_path = np.empty(n, dtype=np.float64)
+    flags_path = np.empty(n, dtype=np.int64)
+    current_sl = sl_price
+    flags = 0
+
+    for i in range(n):
+        price = prices[i]
+
+        # Breakeven: move SL to entry once the trigger is reached
+        if not flags & (1 << TradeFlag.BREAKEVEN_SET):
+            if side * price >= side * breakeven_trigger:
+                current_sl = entry_price
+                flags |= 1 << TradeFlag.BREAKEVEN_SET
+
+        # Trailing: activate at the trigger, then only ever tighten the SL
+        if not flags & (1 << TradeFlag.TRAILING_ACTIVE):
+            if side * price >= side * trailing_trigger:
+                flags |= 1 << TradeFlag.TRAILING_ACTIVE
+        else:
+            new_sl = price - side * trail_distance
+            if side * new_sl > side * current_sl:
+                current_sl = new_sl
+
+        # Take profit levels
+        if not flags & (1 << TradeFlag.TP1_HIT) and side * price >= side * tp1_price:
+            flags |= 1 << TradeFlag.TP1_HIT
+        if not flags & (1 << TradeFlag.TP2_HIT) and side * price >= side * tp2_price:
+            flags |= 1 << TradeFlag.TP2_HIT
+        if not flags & (1 << TradeFlag.TP3_HIT) and side * price >= side * tp3_price:
+            flags |= 1 << TradeFlag.TP3_HIT
+
+        sl_path[i] = current_sl
+        flags_path[i] = flags
+
+    return sl_path, flags_path
@@ -6,9 +6,177 @@ Analyzes tick volume patterns to enhance contrarian signal detection.
 In Forex, we use tick volume (number of price changes) as a proxy for activity.
 """
 
+import os
+import pickle
+import sqlite3
+import threading
+import time
 import numpy as np
-from datetime import datetime
-from colorama import Fore, Style
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+
+# Compiled score kernel (Numba optional)
+try:
+    from signal_kernels import classify_volume_patterns, score_volume
+except ImportError:
+    from src.signal_kernels import classify_volume_patterns, score_volume
+
+# Batch rates are fetched on one background thread while earlier symbols are analyzed.
+# MT5Connector serializes terminal calls, so more workers would only queue on its lock
+_RATES_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="volume-rates")
+
+
+class VolSignal(IntEnum):
+    """Divergence/exhaustion pattern types reported in volume analyses."""
+    NONE = 0
+    BULL_DIV = 1   # Price falling on declining volume - contrarian BUY
+    BEAR_DIV = 2   # Price rising on declining volume - contrarian SELL
+    BUY_EXH = 3    # Buying exhaustion - contrarian SELL
+    SELL_EXH = 4   # Selling exhaustion - contrarian BUY
+    
+    def __str__(self):
+        return _VOL_SIGNAL_LABELS[self]
+    
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+# Display labels (the pattern names used before VolSignal)
+_VOL_SIGNAL_LABELS = {
+    VolSignal.NONE: 'none',
+    VolSignal.BULL_DIV: 'bullish_divergence',
+    VolSignal.BEAR_DIV: 'bearish_divergence',
+    VolSignal.BUY_EXH: 'buying_exhaustion',
+    VolSignal.SELL_EXH: 'selling_exhaustion',
+}
+
+# Detected pattern descriptions (exhaustion ones get the climax bar appended)
+_PATTERN_DESCRIPTIONS = {
+    VolSignal.BULL_DIV: 'Price falling on declining volume - potential reversal',
+    VolSignal.BEAR_DIV: 'Price rising on declining volume - potential reversal',
+    VolSignal.BUY_EXH: 'High volume exhaustion on upward move',
+    VolSignal.SELL_EXH: 'High volume exhaustion on downward move',
+}
+
+
+def rolling_mean(values, window):
+    """Mean of every full window, in O(n) from differences of one cumulative sum."""
+    cumulative = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    return (cumulative[window:] - cumulative[:-window]) / window
+
+
+def rolling_std(values, window):
+    """Population standard deviation of every full window (np.std per window), in O(n)."""
+    # Shifting by the first value leaves the variance unchanged and keeps E[x^2] - E[x]^2 well conditioned
+    values = np.asarray(values, dtype=np.float64)
+    values = values - values[0]
+    mean = rolling_mean(values, window)
+    variance = rolling_mean(values * values, window) - mean * mean
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+class _RollingVolume:
+    """Running tick-volume sums over the closed bars of one (symbol, timeframe) window."""
+    
+    __slots__ = ('count', 'last_time', 'first_volume', 'sum_short', 'sum_all')
+    
+    def __init__(self, times, volumes, short):
+        self.reset(times, volumes, short)
+    
+    def reset(self, times, volumes, short):
+        """Recompute the sums from scratch."""
+        self.count = len(volumes)
+        self.last_time = times[-1]
+        self.first_volume = volumes[0]
+        self.sum_short = volumes[-short:-1].sum()
+        self.sum_all = volumes[:-1].sum()
+    
+    def update(self, times, volumes, short):
+        """Bring the sums up to date in O(1) when at most one new bar has opened."""
+        if self.count != len(volumes) or self.count <= short:
+            self.reset(times, volumes, short)
+        elif times[-1] == self.last_time:
+            pass  # Only the forming bar changed
+        elif times[-2] == self.last_time:
+            # The previous forming bar closed and the oldest bar left the window
+            self.sum_short += volumes[-2] - volumes[-short - 1]
+            self.sum_all += volumes[-2] - self.first_volume
+            self.first_volume = volumes[0]
+            self.last_time = times[-1]
+        else:
+            self.reset(times, volumes, short)
+
+
+class VolumeScoreCache:
+    """
+    On-disk store of volume analyses shared by every process on the machine.
+    
+    Entries are keyed by symbol, timeframe, bar count and the raw latest bar
+    record, so an analysis is only reused for exactly the same data (a tick on
+    the forming bar changes the key). SQLite in WAL mode handles concurrent
+    readers and writers; entries older than MAX_AGE are dropped on open.
+    
+    Each FORMAT_VERSION gets its own table, and tables of other versions are
+    dropped on open.
+    """
+    
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "forex_bot", "vol_scores.sqlite")
+    MAX_AGE = 86400  # Seconds
+    
+    # Bump whenever the layout of a stored analysis changes
+    FORMAT_VERSION = 1
+    TABLE = f"analyses_v{FORMAT_VERSION}"
+    
+    def __init__(self, path=DEFAULT_PATH):
+        """Open (creating if needed) the cache database."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=5.0)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        stale = self.db.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'analyses%' AND name != ?",
+            (self.TABLE,)
+        ).fetchall()
+        for (name,) in stale:
+            self.db.execute(f'DROP TABLE IF EXISTS "{name}"')
+        self.db.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+            "symbol TEXT, timeframe TEXT, periods INTEGER, bar_key BLOB, stored_at REAL, analysis BLOB, "
+            "PRIMARY KEY (symbol, timeframe, periods, bar_key))"
+        )
+        self.db.execute(f"DELETE FROM {self.TABLE} WHERE stored_at < ?", (time.time() - self.MAX_AGE,))
+    
+    @staticmethod
+    def _key_blob(bar_key):
+        """Bytes form of a VolumeAnalyzer bar key (bar count, latest bar record)."""
+        count, last_bar = bar_key
+        return count.to_bytes(4, 'little') + last_bar
+    
+    def get(self, symbol, timeframe, periods, bar_key):
+        """Stored analysis for exactly this data, or None (also when it can't be read or loaded)."""
+        try:
+            with self._lock:
+                row = self.db.execute(
+                    f"SELECT analysis FROM {self.TABLE} WHERE symbol=? AND timeframe=? AND periods=? AND bar_key=?",
+                    (symbol, timeframe, periods, self._key_blob(bar_key))
+                ).fetchone()
+            return pickle.loads(row[0]) if row else None
+        except Exception as e:
+            # Unpickling can raise almost anything (e.g. AttributeError for a renamed class)
+            print(f"⚠️ Volume score cache read error: {e}")
+            return None
+    
+    def put(self, symbol, timeframe, periods, bar_key, analysis):
+        """Store an analysis."""
+        try:
+            blob = pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self.db.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE} VALUES (?, ?, ?, ?, ?, ?)",
+                    (symbol, timeframe, periods, self._key_blob(bar_key), time.time(), blob)
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️ Volume score cache write error: {e}")
 
 
 class VolumeAnalyzer:
@@ -22,11 +190,36 @@ class VolumeAnalyzer:
     - Volume-price divergences
     """
     
-    def __init__(self, mt5_connector):
-        """Initialize volume analyzer."""
+    # Upper bound on cached per-timeframe analyses (oldest dropped first)
+    CACHE_SIZE = 512
+    
+    # Current volume vs SMA(20) thresholds for spike / dry-up flags
+    SPIKE_RATIO = 1.5
+    DRY_UP_RATIO = 0.7
+    
+    # Bars per timeframe in a multi-timeframe volume analysis
+    PROFILE_BARS = 50
+    
+    # Most recent bars read by the divergence, exhaustion and A/D checks
+    PATTERN_BARS = 20
+    
+    def __init__(self, mt5_connector, score_cache=None):
+        """
+        Initialize volume analyzer.
+        
+        Args:
+            mt5_connector: MT5Connector for rates
+            score_cache (VolumeScoreCache): Optional store that shares analyses across processes
+        """
         self.mt5 = mt5_connector
+        self.score_cache = score_cache
+        
+        # Analyses are reused until the latest bar changes
+        self._cache = {}           # (symbol, timeframe, periods) -> (bar key, analysis)
+        self._combined_cache = {}  # (symbol, timeframes) -> (per-timeframe analyses, results)
+        self._rolling = {}         # (symbol, timeframe, periods) -> _RollingVolume
         
-    def analyze_volume_profile(self, symbol, timeframe="M15", periods=50):
+    def analyze_volume_profile(self, symbol, timeframe="M15", periods=50, rates=None):
         """
         Analyze volume profile for contrarian opportunities.
         
@@ -34,40 +227,71 @@ class VolumeAnalyzer:
             symbol (str): Currency pair
             timeframe (str): Timeframe for analysis
             periods (int): Number of periods to analyze
+            rates (np.ndarray): Prefetched MT5 rates (fetched here when None)
             
         Returns:
             dict: Volume analysis results
         """
         try:
             # Get OHLCV data
-            rates = self.mt5.get_rates(symbol, timeframe, periods)
+            if rates is None:
+                rates = self.mt5.get_rates(symbol, timeframe, periods)
             if rates is None or len(rates) < 20:
                 return None
+            
+            # Same latest bar record (time, prices, ticks) as last time -> same analysis.
+            # The raw bytes compare every field at once without unboxing any of them.
+            cache_key = (symbol, timeframe, periods)
+            bar_key = (len(rates), rates[-1].tobytes())
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[0] == bar_key:
+                return cached[1]
+            
+            if self.score_cache is not None:
+                analysis = self.score_cache.get(symbol, timeframe, periods, bar_key)
+                if analysis is not None:
+                    self._remember(cache_key, bar_key, analysis)
+                    return analysis
                 
-            # FIXED: Extract volume data properly from MT5 structured array
-            # MT5 returns structured numpy array with fields: ('time', 'open', 'high', 'low', 'close', 'tick_volume', 'spread', 'real_volume')
-            volumes = np.array(rates['tick_volume'], dtype=float)  # Direct field access
-            prices = np.array(rates['close'], dtype=float)         # Direct field access  
-            highs = np.array(rates['high'], dtype=float)          # Direct field access
-            lows = np.array(rates['low'], dtype=float)            # Direct field access
+            # Unpack the MT5 structured array into contiguous float64 columns
+            # (fields: 'time', 'open', 'high', 'low', 'close', 'tick_volume', 'spread', 'real_volume').
+            # The running volume sums need every bar; the pattern and A/D checks read at most the
+            # last PATTERN_BARS, so only that tail of the price columns is converted.
+            volumes = rates['tick_volume'].astype(np.float64)
+            tail = rates[-self.PATTERN_BARS:]
+            prices = tail['close'].astype(np.float64)
+            highs = tail['high'].astype(np.float64)
+            lows = tail['low'].astype(np.float64)
+            recent_volumes = volumes[-self.PATTERN_BARS:]
             
-            # Calculate volume metrics
-            volume_sma_20 = float(np.mean(volumes[-20:]))
-            volume_sma_50 = float(np.mean(volumes) if len(volumes) >= 50 else np.mean(volumes))
-            current_volume = float(volumes[-1])
+            # Calculate volume metrics (closed-bar sums carried over between calls)
+            current_volume = volumes[-1]
+            rolling = self._rolling.get(cache_key)
+            if rolling is None:
+                rolling = self._rolling[cache_key] = _RollingVolume(rates['time'], volumes, 20)
+            else:
+                rolling.update(rates['time'], volumes, 20)
+            volume_sma_20 = (rolling.sum_short + current_volume) / 20
+            volume_sma_50 = (rolling.sum_all + current_volume) / len(volumes)  # All available bars (up to 50)
+            # The SMA includes the current bar, so a zero SMA means zero volume (ratio 1 flags nothing)
+            volume_ratio_20 = current_volume / volume_sma_20 if volume_sma_20 > 0 else 1
+            
+            divergence, exhaustion = self._detect_volume_patterns(
+                prices, recent_volumes, highs, lows, volume_sma_20)
             
             # Volume analysis
             analysis = {
                 'current_volume': current_volume,
                 'volume_sma_20': volume_sma_20,
                 'volume_sma_50': volume_sma_50,
-                'volume_ratio_20': current_volume / volume_sma_20 if volume_sma_20 > 0 else 1,
+                'volume_ratio_20': volume_ratio_20,
                 'volume_ratio_50': current_volume / volume_sma_50 if volume_sma_50 > 0 else 1,
-                'volume_spike': bool(current_volume > (volume_sma_20 * 1.5)),
-                'volume_dry_up': bool(current_volume < (volume_sma_20 * 0.7)),
-                'price_volume_divergence': self._detect_price_volume_divergence(prices[-10:], volumes[-10:]),
-                'exhaustion_signal': self._detect_exhaustion_volume(prices, volumes, highs, lows),
-                'accumulation_distribution': self._calculate_accumulation_distribution(rates[-20:]),
+                'volume_spike': volume_ratio_20 > self.SPIKE_RATIO,
+                'volume_dry_up': volume_ratio_20 < self.DRY_UP_RATIO,
+                'price_volume_divergence': divergence,
+                'exhaustion_signal': exhaustion,
+                'accumulation_distribution': self._calculate_accumulation_distribution(
+                    highs, lows, prices, recent_volumes),
                 'volume_trend': self._analyze_volume_trend(volumes[-10:]),
                 'contrarian_score': 0  # Will be calculated
             }
@@ -75,119 +299,113 @@ class VolumeAnalyzer:
             # Calculate contrarian volume score
             analysis['contrarian_score'] = self._calculate_contrarian_volume_score(analysis)
             
+            self._remember(cache_key, bar_key, analysis)
+            if self.score_cache is not None:
+                self.score_cache.put(symbol, timeframe, periods, bar_key, analysis)
+            
             return analysis
             
         except Exception as e:
             print(f"❌ Volume analysis error for {symbol}: {e}")
             return None
     
-    def _detect_price_volume_divergence(self, prices, volumes):
+    def _remember(self, cache_key, bar_key, analysis):
+        """Keep an analysis in the in-memory cache, evicting the oldest entry when full."""
+        self._cache.pop(cache_key, None)
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[cache_key] = (bar_key, analysis)
+    
+    def analyze_volume_profile_batch(self, symbols, timeframe="M15", periods=50):
         """
-        Detect price-volume divergence (contrarian signal).
+        Analyze the volume profile of several symbols.
         
+        All symbols' rates are queued up front on a background thread, so later
+        symbols are fetched while earlier ones are analyzed (or served from cache).
+        The fetches themselves are serialized by MT5Connector.
+        
+        Args:
+            symbols (list): Currency pairs
+            timeframe (str): Timeframe for analysis
+            periods (int): Number of periods to analyze
+            
         Returns:
-            dict: Divergence analysis
+            dict: symbol -> volume analysis results (None when unavailable)
+        """
+        pending = {
+            symbol: _RATES_POOL.submit(self.mt5.get_rates, symbol, timeframe, periods)
+            for symbol in symbols
+        }
+        
+        results = {}
+        for symbol, future in pending.items():
+            try:
+                rates = future.result()
+            except Exception as e:
+                print(f"❌ Volume rates error for {symbol}: {e}")
+                rates = None
+            results[symbol] = (self.analyze_volume_profile(symbol, timeframe, periods, rates=rates)
+                               if rates is not None else None)
+        return results
+    
+    def _detect_volume_patterns(self, prices, volumes, highs, lows, avg_volume):
         """
-        if len(prices) < 5 or len(volumes) < 5:
-            return {'detected': False, 'type': None, 'strength': 0}
+        Detect price-volume divergence and volume exhaustion (contrarian signals).
         
-        # Calculate price momentum
-        price_momentum = (prices[-1] - prices[0]) / prices[0]
+        Args:
+            prices, volumes, highs, lows (np.ndarray): Last PATTERN_BARS of the float64 columns
+            avg_volume (float): SMA(20) of tick volume, current bar included
         
-        # Calculate volume momentum  
-        volume_momentum = (np.mean(volumes[-3:]) - np.mean(volumes[:3])) / np.mean(volumes[:3])
+        Returns:
+            tuple: (divergence analysis, exhaustion analysis) dicts
+        """
+        div_type, div_strength, exh_type, exh_strength, exh_bar = classify_volume_patterns(
+            prices, volumes, highs, lows, avg_volume)
         
-        # Detect divergence
-        if price_momentum > 0.001 and volume_momentum < -0.2:  # Price up, volume down
-            return {
+        if div_type:
+            divergence = {
                 'detected': True,
-                'type': 'bearish_divergence',  # Contrarian SELL opportunity
-                'strength': abs(volume_momentum) * 100,
-                'description': 'Price rising on declining volume - potential reversal'
+                'type': VolSignal(div_type),
+                'strength': div_strength,
+                'description': _PATTERN_DESCRIPTIONS[div_type]
             }
-        elif price_momentum < -0.001 and volume_momentum < -0.2:  # Price down, volume down
-            return {
+        else:
+            divergence = {'detected': False, 'type': VolSignal.NONE, 'strength': 0}
+        
+        if exh_type:
+            exhaustion = {
                 'detected': True,
-                'type': 'bullish_divergence',  # Contrarian BUY opportunity  
-                'strength': abs(volume_momentum) * 100,
-                'description': 'Price falling on declining volume - potential reversal'
+                'type': VolSignal(exh_type),
+                'strength': exh_strength,
+                'description': f'{_PATTERN_DESCRIPTIONS[exh_type]} at bar {exh_bar}'
             }
+        else:
+            exhaustion = {'detected': False, 'type': VolSignal.NONE, 'strength': 0}
         
-        return {'detected': False, 'type': None, 'strength': 0}
-    
-    def _detect_exhaustion_volume(self, prices, volumes, highs, lows):
-        """
-        Detect volume exhaustion patterns (strong contrarian signals).
-        
-        Returns:
-            dict: Exhaustion analysis
-        """
-        if len(volumes) < 10:
-            return {'detected': False, 'type': None, 'strength': 0}
-        
-        # Get recent data
-        recent_volumes = volumes[-5:]
-        recent_prices = prices[-5:]
-        recent_highs = highs[-5:]
-        recent_lows = lows[-5:]
-        
-        # Check for climax volume patterns
-        max_volume_idx = np.argmax(recent_volumes)
-        max_volume = float(recent_volumes[max_volume_idx])
-        avg_volume = float(np.mean(volumes[-20:] if len(volumes) >= 20 else volumes))
-        
-        # Volume spike conditions
-        is_volume_spike = bool(max_volume > (avg_volume * 2.0))
-        
-        if is_volume_spike and max_volume_idx >= 3:  # Volume spike not on latest bar
-            # Check if price action suggests exhaustion
-            price_range = float(recent_highs[max_volume_idx] - recent_lows[max_volume_idx])
-            avg_range = float(np.mean(recent_highs - recent_lows))
-            
-            if price_range > avg_range * 1.5:  # Wide range bar
-                # Determine exhaustion type
-                if float(recent_prices[max_volume_idx]) > float(recent_prices[0]):  # Upward move
-                    return {
-                        'detected': True,
-                        'type': 'buying_exhaustion',  # Contrarian SELL signal
-                        'strength': (max_volume / avg_volume) * 10,
-                        'description': f'High volume exhaustion on upward move at bar {max_volume_idx}'
-                    }
-                else:  # Downward move
-                    return {
-                        'detected': True,
-                        'type': 'selling_exhaustion',  # Contrarian BUY signal
-                        'strength': (max_volume / avg_volume) * 10,
-                        'description': f'High volume exhaustion on downward move at bar {max_volume_idx}'
-                    }
-        
-        return {'detected': False, 'type': None, 'strength': 0}
+        return divergence, exhaustion
     
-    def _calculate_accumulation_distribution(self, rates):
+    def _calculate_accumulation_distribution(self, high, low, close, volume):
         """
         Calculate Accumulation/Distribution indicator.
         
+        Args:
+            high, low, close, volume (np.ndarray): float64 bar columns
+        
         Returns:
             dict: A/D analysis
         """
-        if len(rates) < 10:
+        if len(close) < 10:
             return {'value': 0, 'trend': 'neutral', 'signal': None}
         
-        ad_values = []
-        
-        for rate in rates:
-            # Money Flow Multiplier
-            clv = ((rate['close'] - rate['low']) - (rate['high'] - rate['close'])) / (rate['high'] - rate['low'])
-            if rate['high'] == rate['low']:  # Avoid division by zero
-                clv = 0
-            
-            # Money Flow Volume
-            mfv = clv * rate['tick_volume']
-            ad_values.append(mfv)
+        # Money Flow Volume: multiplier (0 on bars with no range) times tick volume
+        bar_range = high - low
+        ad_values = np.divide((close - low) - (high - close), bar_range,
+                              out=np.zeros(len(bar_range)), where=bar_range != 0)
+        ad_values *= volume
         
         # Calculate trend
-        ad_sma_short = np.mean(ad_values[-5:])
-        ad_sma_long = np.mean(ad_values[-10:] if len(ad_values) >= 10 else ad_values)
+        ad_sma_short = ad_values[-5:].mean()
+        ad_sma_long = ad_values[-10:].mean()
         
         if ad_sma_short > ad_sma_long * 1.1:
             trend = 'accumulation'  # Potential bearish divergence for contrarian
@@ -216,10 +434,11 @@ class VolumeAnalyzer:
         if len(volumes) < 5:
             return {'trend': 'insufficient_data', 'strength': 0}
         
-        # Linear regression on volume
-        x = np.arange(len(volumes))
-        slope = np.polyfit(x, volumes, 1)[0]
-        avg_volume = np.mean(volumes)
+        # Least-squares slope in closed form (x = 0..n-1, centred)
+        n = len(volumes)
+        avg_volume = volumes.mean()
+        x = np.arange(n) - (n - 1) / 2.0
+        slope = (x * (volumes - avg_volume)).sum() / (n * (n * n - 1) / 12.0)
         
         # Normalize slope
         trend_strength = abs(slope) / avg_volume if avg_volume > 0 else 0
@@ -238,77 +457,106 @@ class VolumeAnalyzer:
         Returns:
             float: Contrarian volume score
         """
-        score = 5.0  # Base score
-        
-        # Volume spike bonus (potential exhaustion)
-        if analysis['volume_spike']:
-            score += 2.0
-        
-        # Volume dry-up bonus (potential accumulation before reversal)
-        if analysis['volume_dry_up']:
-            score += 1.0
-        
-        # Price-volume divergence bonus
-        if analysis['price_volume_divergence']['detected']:
-            score += analysis['price_volume_divergence']['strength'] / 10
-        
-        # Exhaustion pattern bonus
-        if analysis['exhaustion_signal']['detected']:
-            score += min(3.0, analysis['exhaustion_signal']['strength'] / 10)
-        
-        # Accumulation/Distribution signal
-        if analysis['accumulation_distribution']['signal']:
-            score += 1.0
-        
-        # Volume trend consideration
+        divergence = analysis['price_volume_divergence']
+        exhaustion = analysis['exhaustion_signal']
         volume_trend = analysis['volume_trend']
-        if volume_trend['trend'] == 'decreasing' and volume_trend['strength'] > 0.2:
-            score += 1.0  # Decreasing volume can signal reversal
         
-        return min(10.0, max(0.0, score))
+        # Undetected patterns report strength 0, so strengths pass straight through
+        return score_volume(
+            analysis['volume_spike'],
+            analysis['volume_dry_up'],
+            divergence['strength'],
+            exhaustion['strength'],
+            analysis['accumulation_distribution']['signal'] is not None,
+            volume_trend['trend'] == 'decreasing',
+            volume_trend['strength']
+        )
     
-    def get_volume_contrarian_signals(self, symbol, timeframes=['M5', 'M15', 'H1']):
+    def get_volume_contrarian_signals(self, symbol, timeframes=['M5', 'M15', 'H1'], rates=None):
         """
         Get comprehensive volume-based contrarian signals.
         
         Args:
             symbol (str): Currency pair
             timeframes (list): Timeframes to analyze
+            rates (dict): Prefetched timeframe -> rates (e.g. from MT5Connector.fetch_rates_bundle);
+                only the last PROFILE_BARS of each are analyzed. Fetched here if None.
             
         Returns:
-            dict: Multi-timeframe volume analysis
+            dict: Multi-timeframe volume analysis, always with 'combined_analysis'
+                (None when no timeframe has enough bars)
         """
         results = {}
         
+        # Queue every timeframe's rates up front so later timeframes are fetched while earlier ones are analyzed
+        pending = None
+        if rates is None:
+            pending = {tf: _RATES_POOL.submit(self.mt5.get_rates, symbol, tf, self.PROFILE_BARS)
+                       for tf in timeframes}
+        
         for tf in timeframes:
-            analysis = self.analyze_volume_profile(symbol, tf)
+            if pending is None:
+                tf_rates = rates.get(tf)
+                if tf_rates is not None:
+                    tf_rates = tf_rates[-self.PROFILE_BARS:]
+            else:
+                try:
+                    tf_rates = pending[tf].result()
+                except Exception as e:
+                    print(f"❌ Volume rates error for {symbol} {tf}: {e}")
+                    continue
+            analysis = self.analyze_volume_profile(symbol, tf, rates=tf_rates) if tf_rates is not None else None
             if analysis:
                 results[tf] = analysis
         
-        # Calculate combined score
-        if results:
-            combined_score = np.mean([results[tf]['contrarian_score'] for tf in results.keys()])
-            
-            # Multi-timeframe confirmation bonus
-            volume_spikes = sum(1 for tf in results.keys() if results[tf]['volume_spike'])
-            divergences = sum(1 for tf in results.keys() if results[tf]['price_volume_divergence']['detected'])
-            exhaustions = sum(1 for tf in results.keys() if results[tf]['exhaustion_signal']['detected'])
-            
-            if volume_spikes >= 2:
-                combined_score += 1.0
-            if divergences >= 2:
-                combined_score += 1.5
-            if exhaustions >= 1:
-                combined_score += 2.0
-            
-            results['combined_analysis'] = {
-                'score': min(10.0, combined_score),
-                'volume_spikes_count': volume_spikes,
-                'divergences_count': divergences,
-                'exhaustions_count': exhaustions,
-                'recommendation': self._get_volume_recommendation(combined_score, results)
-            }
+        # No timeframe had enough bars - nothing to combine
+        if not results:
+            return None
         
+        # The combination is pure, so unchanged per-timeframe analyses give the same result
+        combined_key = (symbol, tuple(timeframes))
+        analyses = tuple(results.get(tf) for tf in timeframes)
+        cached = self._combined_cache.get(combined_key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], analyses)):
+            return cached[1]
+        
+        # Calculate combined score in a single pass over the (at most a handful of)
+        # timeframes, collecting the detected patterns as "<tf> <type>" labels on the way
+        score_total = 0.0
+        volume_spikes = divergences = exhaustions = 0
+        patterns = []
+        for tf, analysis in results.items():
+            score_total += analysis['contrarian_score']
+            volume_spikes += analysis['volume_spike']
+            divergence = analysis['price_volume_divergence']
+            exhaustion = analysis['exhaustion_signal']
+            if divergence['detected']:
+                divergences += 1
+                patterns.append(f"{tf} {divergence['type']}")
+            if exhaustion['detected']:
+                exhaustions += 1
+                patterns.append(f"{tf} {exhaustion['type']}")
+        combined_score = score_total / len(results)
+        
+        # Multi-timeframe confirmation bonus
+        
+        if volume_spikes >= 2:
+            combined_score += 1.0
+        if divergences >= 2:
+            combined_score += 1.5
+        if exhaustions >= 1:
+            combined_score += 2.0
+        
+        results['combined_analysis'] = {
+            'score': min(10.0, combined_score),
+            'volume_spikes_count': volume_spikes,
+            'divergences_count': divergences,
+            'exhaustions_count': exhaustions,
+            'patterns': patterns,
+            'recommendation': self._get_volume_recommendation(combined_score, results)
+        }
+        
+        self._combined_cache[combined_key] = (analyses, results)
         return results
     
     def _get_volume_recommendation(self, score, results):
@@ -341,6 +589,8 @@ class VolumeAnalyzer:
 
 def main():
     """Test volume analyzer."""
+    from colorama import Fore, Style
+    
     print(f"{Fore.CYAN}🔊 Volume Analyzer Test{Style.RESET_ALL}")
     print("Volume analysis module ready for integration!")
 
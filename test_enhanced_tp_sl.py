@@ -7,22 +7,53 @@ Test the new multiple TP levels, dynamic multipliers, and risk management featur
 
 import sys
 import os
+import functools
+import numpy as np
 from datetime import datetime
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.config import TradingConfig
-from automated_trading_system import ContriarianTradingSystem
+from src.trade_kernels import TradeFlag, simulate_trade_path
+from script_output import batched_stdout
+
+# Price difference -> displayed pips (5-digit quotes)
+PIP_SCALE = 100_000.0
+
+# Section separators
+SEPARATOR = "=" * 50
+SUB_SEPARATOR = "-" * 30
+
+
+@functools.lru_cache(maxsize=1)
+def _system():
+    """Trading system shared by the tests below (constructed once)."""
+    # Imported here so the system and its ML stack only load once a test needs them
+    from automated_trading_system import ContriarianTradingSystem
+    return ContriarianTradingSystem()
+
+
+def _add_triggers(system, symbol, levels, side, entry_price):
+    """
+    Add explicit breakeven/trailing trigger prices to levels (+1 BUY, -1 SELL).
+    
+    The level calculators don't return them, while the breakeven and trailing
+    checks read them from the levels dict.
+    """
+    pip_value = system._get_pip_value(symbol)
+    levels['breakeven_trigger'] = entry_price + side * system.config.BREAKEVEN_TRIGGER_PIPS * pip_value
+    levels['trailing_trigger'] = entry_price + side * system.config.TRAILING_STOP_TRIGGER * pip_value
+    return levels
 
 
 def test_enhanced_tp_sl():
     """Test the enhanced TP/SL calculation system."""
     print("🧪 Testing Enhanced TP/SL System...")
-    print("=" * 50)
+    print(SEPARATOR)
     
     # Create system instance
-    system = ContriarianTradingSystem()
+    system = _system()
     
     # Test parameters
     symbol = "EURUSDm"
@@ -32,7 +63,7 @@ def test_enhanced_tp_sl():
     print(f"📊 Test Parameters:")
     print(f"Symbol: {symbol}")
     print(f"Entry Price: {entry_price}")
-    print(f"ATR Value: {atr_value} ({atr_value * 100000:.1f} pips)")
+    print(f"ATR Value: {atr_value} ({atr_value * PIP_SCALE:.1f} pips)")
     print()
     
     # Test different signal strengths and sessions
@@ -43,35 +74,48 @@ def test_enhanced_tp_sl():
         {"signal_strength": 9.8, "description": "Ultra Signal (9.8/10)"},
     ]
     
-    for case in test_cases:
+    # All strength x side combinations in one vectorized call (column 0 = BUY, 1 = SELL)
+    strengths = np.array([case['signal_strength'] for case in test_cases])
+    sides = np.array([1, -1])
+    grid = system._calculate_contrarian_levels_batch(
+        symbol, sides[None, :], entry_price, atr_value, strengths[:, None]
+    )
+    _add_triggers(system, symbol, grid, sides, entry_price)
+    grid = {key: np.broadcast_to(value, (len(strengths), len(sides))) for key, value in grid.items()}
+    
+    # Pip distances for every case in one pass (SL measured against, TPs with the trade)
+    pips = {
+        'sl_price': (entry_price - grid['sl_price']) * sides * PIP_SCALE,
+        'tp1_price': (grid['tp1_price'] - entry_price) * sides * PIP_SCALE,
+        'tp2_price': (grid['tp2_price'] - entry_price) * sides * PIP_SCALE,
+        'tp3_price': (grid['tp3_price'] - entry_price) * sides * PIP_SCALE,
+    }
+    
+    for i, case in enumerate(test_cases):
         print(f"🎯 {case['description']}")
-        print("-" * 30)
+        print(SUB_SEPARATOR)
         
         # Test BUY trade
-        levels_buy = system._calculate_contrarian_levels(
-            symbol, "BUY", entry_price, atr_value, case['signal_strength']
-        )
+        levels_buy = {key: value[i, 0] for key, value in grid.items()}
         
         print("📈 BUY Trade Levels:")
         print(f"  Entry: {entry_price:.5f}")
-        print(f"  SL:    {levels_buy['sl_price']:.5f} ({(entry_price - levels_buy['sl_price']) * 100000:.1f} pips)")
-        print(f"  TP1:   {levels_buy['tp1_price']:.5f} ({(levels_buy['tp1_price'] - entry_price) * 100000:.1f} pips) - 50%")
-        print(f"  TP2:   {levels_buy['tp2_price']:.5f} ({(levels_buy['tp2_price'] - entry_price) * 100000:.1f} pips) - 30%")
-        print(f"  TP3:   {levels_buy['tp3_price']:.5f} ({(levels_buy['tp3_price'] - entry_price) * 100000:.1f} pips) - 20%")
+        print(f"  SL:    {levels_buy['sl_price']:.5f} ({pips['sl_price'][i, 0]:.1f} pips)")
+        print(f"  TP1:   {levels_buy['tp1_price']:.5f} ({pips['tp1_price'][i, 0]:.1f} pips) - 50%")
+        print(f"  TP2:   {levels_buy['tp2_price']:.5f} ({pips['tp2_price'][i, 0]:.1f} pips) - 30%")
+        print(f"  TP3:   {levels_buy['tp3_price']:.5f} ({pips['tp3_price'][i, 0]:.1f} pips) - 20%")
         print(f"  Breakeven Trigger: {levels_buy['breakeven_trigger']:.5f}")
         print(f"  Trailing Trigger:  {levels_buy['trailing_trigger']:.5f}")
         
         # Test SELL trade
-        levels_sell = system._calculate_contrarian_levels(
-            symbol, "SELL", entry_price, atr_value, case['signal_strength']
-        )
+        levels_sell = {key: value[i, 1] for key, value in grid.items()}
         
         print("\n📉 SELL Trade Levels:")
         print(f"  Entry: {entry_price:.5f}")
-        print(f"  SL:    {levels_sell['sl_price']:.5f} ({(levels_sell['sl_price'] - entry_price) * 100000:.1f} pips)")
-        print(f"  TP1:   {levels_sell['tp1_price']:.5f} ({(entry_price - levels_sell['tp1_price']) * 100000:.1f} pips) - 50%")
-        print(f"  TP2:   {levels_sell['tp2_price']:.5f} ({(entry_price - levels_sell['tp2_price']) * 100000:.1f} pips) - 30%")
-        print(f"  TP3:   {levels_sell['tp3_price']:.5f} ({(entry_price - levels_sell['tp3_price']) * 100000:.1f} pips) - 20%")
+        print(f"  SL:    {levels_sell['sl_price']:.5f} ({pips['sl_price'][i, 1]:.1f} pips)")
+        print(f"  TP1:   {levels_sell['tp1_price']:.5f} ({pips['tp1_price'][i, 1]:.1f} pips) - 50%")
+        print(f"  TP2:   {levels_sell['tp2_price']:.5f} ({pips['tp2_price'][i, 1]:.1f} pips) - 30%")
+        print(f"  TP3:   {levels_sell['tp3_price']:.5f} ({pips['tp3_price'][i, 1]:.1f} pips) - 20%")
         print(f"  Breakeven Trigger: {levels_sell['breakeven_trigger']:.5f}")
         print(f"  Trailing Trigger:  {levels_sell['trailing_trigger']:.5f}")
         
@@ -79,14 +123,11 @@ def test_enhanced_tp_sl():
         print(f"  Session: {levels_buy['session_multiplier']:.2f}")
         print(f"  Strength: {levels_buy['strength_multiplier']:.2f}")
         print(f"  Final: {levels_buy['final_multiplier']:.2f}")
-        print("\n" + "="*50 + "\n")
+        print(f"\n{SEPARATOR}\n")
     
     # Test session multipliers
     print("⏰ Session Multiplier Testing:")
-    print("-" * 30)
-    
-    # Mock different sessions by temporarily changing the method
-    original_method = system._get_session_multiplier
+    print(SUB_SEPARATOR)
     
     sessions = [
         ("ASIAN_SESSION", 0.7),
@@ -96,18 +137,12 @@ def test_enhanced_tp_sl():
         ("QUIET_HOURS", 0.7)
     ]
     
-    for session_name, expected_multiplier in sessions:
-        # Mock the session
-        system._get_session_multiplier = lambda: expected_multiplier
-        
+    for session_name, session_multiplier in sessions:
         levels = system._calculate_contrarian_levels(
-            symbol, "BUY", entry_price, atr_value, 7.5
+            symbol, "BUY", entry_price, atr_value, 7.5, session_multiplier=session_multiplier
         )
         
-        print(f"{session_name}: {levels['session_multiplier']:.2f} - TP1: {(levels['tp1_price'] - entry_price) * 100000:.1f} pips")
-    
-    # Restore original method
-    system._get_session_multiplier = original_method
+        print(f"{session_name}: {levels['session_multiplier']:.2f} - TP1: {(levels['tp1_price'] - entry_price) * PIP_SCALE:.1f} pips")
     
     print("\n✅ Enhanced TP/SL system test completed!")
 
@@ -115,18 +150,19 @@ def test_enhanced_tp_sl():
 def test_risk_management_features():
     """Test breakeven and trailing stop features."""
     print("\n🛡️ Testing Risk Management Features...")
-    print("=" * 50)
+    print(SEPARATOR)
     
     # Simulate trade monitoring
-    system = ContriarianTradingSystem()
+    system = _system()
     
     # Create mock trade
     symbol = "GBPUSDm"
     entry_price = 1.25000
     atr_value = 0.00200
     
-    levels = system._calculate_contrarian_levels(
-        symbol, "BUY", entry_price, atr_value, 8.0
+    levels = _add_triggers(
+        system, symbol, system._calculate_contrarian_levels(symbol, "BUY", entry_price, atr_value, 8.0),
+        1, entry_price
     )
     
     # Mock active trade
@@ -163,7 +199,7 @@ def test_risk_management_features():
     
     print(f"\n📈 Testing Price Movements:")
     for i, price in enumerate(test_prices, 1):
-        print(f"\nStep {i}: Price = {price:.5f} (+{(price - entry_price) * 100000:.1f} pips)")
+        print(f"\nStep {i}: Price = {price:.5f} (+{(price - entry_price) * PIP_SCALE:.1f} pips)")
         
         # Test breakeven
         if not trade_info['breakeven_set']:
@@ -189,13 +225,35 @@ def test_risk_management_features():
                 if hit:
                     print(f"  🎯 {tp_level.upper()} HIT!")
     
+    # Replay the same path with the compiled simulator and compare the final state
+    trail_distance = ((levels['tp1_price'] - entry_price) / system.config.TP1_ATR_MULTIPLIER
+                      * system.config.TRAILING_STOP_DISTANCE)
+    sl_path, flags_path = simulate_trade_path(
+        np.array(test_prices, dtype=np.float64), 1, entry_price, levels['sl_price'],
+        levels['breakeven_trigger'], levels['trailing_trigger'], trail_distance,
+        levels['tp1_price'], levels['tp2_price'], levels['tp3_price']
+    )
+    flags = int(flags_path[-1])
+    expected = (
+        trade_info['breakeven_set'],
+        trade_info['trailing_active'],
+        trade_info['tp_hits']['tp1'],
+        trade_info['tp_hits']['tp2'],
+        trade_info['tp_hits']['tp3'],
+    )
+    simulated = tuple(bool(flags & (1 << flag)) for flag in TradeFlag)
+    if simulated == expected and abs(sl_path[-1] - trade_info['current_sl']) < 1e-9:
+        print(f"\n✅ Compiled path simulation matches (final SL {sl_path[-1]:.5f})")
+    else:
+        print(f"\n❌ Compiled path simulation differs: {simulated} SL {sl_path[-1]:.5f}")
+    
     print("\n✅ Risk management features test completed!")
 
 
 def display_config_summary():
     """Display enhanced configuration summary."""
     print("\n📋 Enhanced TP/SL Configuration Summary:")
-    print("=" * 50)
+    print(SEPARATOR)
     
     config = TradingConfig()
     
@@ -218,10 +276,10 @@ def display_config_summary():
     
     print(f"\nRisk Management:")
     print(f"  Breakeven: {'✅ Enabled' if config.BREAKEVEN_ENABLED else '❌ Disabled'}")
-    print(f"  Breakeven Trigger: {config.BREAKEVEN_TRIGGER_ATR}x ATR")
+    print(f"  Breakeven Trigger: {config.BREAKEVEN_TRIGGER_PIPS} pips")
     print(f"  Trailing Stop: {'✅ Enabled' if config.TRAILING_STOP_ENABLED else '❌ Disabled'}")
     print(f"  Trailing Distance: {config.TRAILING_STOP_DISTANCE}x ATR")
-    print(f"  Trailing Trigger: {config.TRAILING_STOP_TRIGGER}x ATR")
+    print(f"  Trailing Trigger: {config.TRAILING_STOP_TRIGGER} pips")
     
     print(f"\nSession Multipliers:")
     print(f"  Asian: {config.ASIAN_SESSION_MULTIPLIER}x")
@@ -231,23 +289,24 @@ def display_config_summary():
 
 
 if __name__ == "__main__":
-    print("🚀 Enhanced TP/SL System Test Suite")
-    print("=" * 50)
-    
-    try:
-        display_config_summary()
-        test_enhanced_tp_sl()
-        test_risk_management_features()
-        
-        print("\n🎉 All tests completed successfully!")
-        print("\n🎯 Enhanced Features Summary:")
-        print("✅ Multiple TP levels (TP1, TP2, TP3)")
-        print("✅ Dynamic multipliers based on signal strength")
-        print("✅ Session-based adjustments")
-        print("✅ Breakeven management")
-        print("✅ Trailing stop loss")
-        print("✅ Partial profit taking")
-        print("✅ Enhanced Telegram notifications")
+    with batched_stdout():
+        print("🚀 Enhanced TP/SL System Test Suite")
+        print(SEPARATOR)
         
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
+        try:
+            display_config_summary()
+            test_enhanced_tp_sl()
+            test_risk_management_features()
+            
+            print("\n🎉 All tests completed successfully!")
+            print("\n🎯 Enhanced Features Summary:")
+            print("✅ Multiple TP levels (TP1, TP2, TP3)")
+            print("✅ Dynamic multipliers based on signal strength")
+            print("✅ Session-based adjustments")
+            print("✅ Breakeven management")
+            print("✅ Trailing stop loss")
+            print("✅ Partial profit taking")
+            print("✅ Enhanced Telegram notifications")
+            
+        except Exception as e:
+            print(f"❌ Test failed: {e}")
@@ -5,9 +5,7 @@ MT5 Volume Data Test
 Tests how to properly extract volume data from MetaTrader 5.
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import time
 
 import MetaTrader5 as mt5
 import numpy as np
@@ -45,24 +43,26 @@ def test_mt5_volume_data():
         print(f"📊 Data type: {type(rates)}")
         print(f"📊 Single bar type: {type(rates[0])}")
         print(f"📊 Available fields: {rates.dtype.names if hasattr(rates, 'dtype') else 'No dtype'}")
+        names = frozenset(getattr(getattr(rates, 'dtype', None), 'names', None) or ())
         
         # Show first bar details
         if len(rates) > 0:
             first_bar = rates[0]
             print(f"\n{Fore.GREEN}📈 First Bar Analysis:{Style.RESET_ALL}")
-            print(f"  📅 Time: {first_bar['time'] if 'time' in first_bar.dtype.names else 'N/A'}")
-            print(f"  💰 Open: {first_bar['open'] if 'open' in first_bar.dtype.names else 'N/A'}")
-            print(f"  📈 High: {first_bar['high'] if 'high' in first_bar.dtype.names else 'N/A'}")
-            print(f"  📉 Low: {first_bar['low'] if 'low' in first_bar.dtype.names else 'N/A'}")
-            print(f"  💰 Close: {first_bar['close'] if 'close' in first_bar.dtype.names else 'N/A'}")
+            print(f"  📅 Time: {first_bar['time'] if 'time' in names else 'N/A'}")
+            print(f"  💰 Open: {first_bar['open'] if 'open' in names else 'N/A'}")
+            print(f"  📈 High: {first_bar['high'] if 'high' in names else 'N/A'}")
+            print(f"  📉 Low: {first_bar['low'] if 'low' in names else 'N/A'}")
+            print(f"  💰 Close: {first_bar['close'] if 'close' in names else 'N/A'}")
             
-            # Volume analysis
-            if 'tick_volume' in first_bar.dtype.names:
-                print(f"  🔊 Tick Volume: {first_bar['tick_volume']}")
-            if 'real_volume' in first_bar.dtype.names:
-                print(f"  🔊 Real Volume: {first_bar['real_volume']}")
-            if 'spread' in first_bar.dtype.names:
-                print(f"  📏 Spread: {first_bar['spread']}")
+            # Volume analysis (only the optional columns this terminal provides)
+            if names & {'tick_volume', 'real_volume', 'spread'}:
+                if 'tick_volume' in names:
+                    print(f"  🔊 Tick Volume: {first_bar['tick_volume']}")
+                if 'real_volume' in names:
+                    print(f"  🔊 Real Volume: {first_bar['real_volume']}")
+                if 'spread' in names:
+                    print(f"  📏 Spread: {first_bar['spread']}")
         
         # Test volume extraction methods
         print(f"\n{Fore.YELLOW}🔊 Volume Extraction Tests:{Style.RESET_ALL}")
@@ -77,27 +77,17 @@ def test_mt5_volume_data():
         except Exception as e:
             print(f"❌ Method 1 failed: {e}")
         
-        # Method 2: List comprehension (current problematic method)
+        # Method 2: float64 column for calculations (no per-row Python iteration)
         try:
-            volumes_method2 = [rate['tick_volume'] for rate in rates]
-            print(f"✅ Method 2 (List comprehension): {len(volumes_method2)} volumes")
+            volumes_method2 = rates['tick_volume'].astype(np.float64, copy=False)
+            print(f"✅ Method 2 (float64 column): {len(volumes_method2)} volumes")
             print(f"   📊 Type: {type(volumes_method2)}")
             print(f"   📊 Sample: {volumes_method2[:5]}")
             print(f"   📊 Latest: {volumes_method2[-1]}")
-        except Exception as e:
-            print(f"❌ Method 2 failed: {e}")
-        
-        # Method 3: NumPy array conversion
-        try:
-            volumes_method3 = np.array(rates['tick_volume'])
-            print(f"✅ Method 3 (NumPy conversion): {len(volumes_method3)} volumes")
-            print(f"   📊 Type: {type(volumes_method3)}")
-            print(f"   📊 Sample: {volumes_method3[:5]}")
-            print(f"   📊 Latest: {volumes_method3[-1]}")
             
             # Test calculations
-            avg_volume = np.mean(volumes_method3)
-            current_volume = volumes_method3[-1]
+            avg_volume = volumes_method2.mean()
+            current_volume = volumes_method2[-1]
             volume_ratio = current_volume / avg_volume
             
             print(f"   📊 Average Volume: {avg_volume:.0f}")
@@ -109,7 +99,20 @@ def test_mt5_volume_data():
             print(f"   🔥 Volume Spike: {'✅ YES' if volume_spike else '❌ NO'}")
             
         except Exception as e:
-            print(f"❌ Method 3 failed: {e}")
+            print(f"❌ Method 2 failed: {e}")
+        
+        # Extraction cost: per-row iteration (reference only) vs column access
+        print(f"\n{Fore.YELLOW}⏱️ Extraction Timing ({len(rates)} bars):{Style.RESET_ALL}")
+        extractions = (
+            ("List comprehension (reference)", lambda: [rate['tick_volume'] for rate in rates]),
+            ("Field view (zero-copy)", lambda: rates['tick_volume']),
+            ("float64 column", lambda: rates['tick_volume'].astype(np.float64, copy=False)),
+        )
+        for name, extract in extractions:
+            start = time.perf_counter_ns()
+            extract()
+            elapsed_us = (time.perf_counter_ns() - start) / 1000
+            print(f"   ⏱️ {name}: {elapsed_us:.1f} µs")
     
     else:
         print(f"❌ No data received")
@@ -143,21 +146,22 @@ def create_fixed_volume_analyzer():
                 return None
                 
             # FIXED: Extract volume data properly from MT5 structured array
-            volumes = rates['tick_volume']  # Direct field access (no list comprehension)
-            prices = rates['close']         # Direct field access
-            highs = rates['high']          # Direct field access
-            lows = rates['low']            # Direct field access
+            # (all OHLCV columns converted to one float64 matrix in a single pass)
+            from numpy.lib import recfunctions as rfn
+            ohlcv = rfn.structured_to_unstructured(
+                rates[['open', 'high', 'low', 'close', 'tick_volume']], dtype=np.float64
+            )
+            opens, highs, lows, prices, volumes = ohlcv.T
             
-            # Convert to float for calculations
-            volumes = np.array(volumes, dtype=float)
-            prices = np.array(prices, dtype=float)
-            highs = np.array(highs, dtype=float)
-            lows = np.array(lows, dtype=float)
+            # Calculate volume metrics from one cumulative pass
+            cumulative = np.cumsum(volumes, dtype=np.float64)
+            total = cumulative[-1]
+            volume_sma_20 = (total - (cumulative[-21] if len(volumes) > 20 else 0.0)) / 20
+            volume_sma_50 = total / len(volumes)  # All available bars (up to 50)
+            current_volume = volumes[-1]
             
-            # Calculate volume metrics
-            volume_sma_20 = float(np.mean(volumes[-20:]))
-            volume_sma_50 = float(np.mean(volumes) if len(volumes) >= 50 else np.mean(volumes))
-            current_volume = float(volumes[-1])
+            # Spike (> 1.5x SMA20) and dry-up (< 0.7x) in one comparison, dry-up side sign-flipped
+            volume_spike, volume_dry_up = np.array([1.0, -1.0]) * current_volume > np.array([1.5, -0.7]) * volume_sma_20
             
             # Volume analysis
             analysis = {
@@ -166,8 +170,8 @@ def create_fixed_volume_analyzer():
                 'volume_sma_50': volume_sma_50,
                 'volume_ratio_20': current_volume / volume_sma_20 if volume_sma_20 > 0 else 1,
                 'volume_ratio_50': current_volume / volume_sma_50 if volume_sma_50 > 0 else 1,
-                'volume_spike': bool(current_volume > (volume_sma_20 * 1.5)),
-                'volume_dry_up': bool(current_volume < (volume_sma_20 * 0.7)),
+                'volume_spike': volume_spike,
+                'volume_dry_up': volume_dry_up,
                 'contrarian_score': 0
             }
             
@@ -184,7 +188,7 @@ def create_fixed_volume_analyzer():
     print("🔧 Fixed volume extraction method:")
     print("   ✅ Use direct field access: rates['tick_volume']")
     print("   ✅ Avoid list comprehension with structured arrays")
-    print("   ✅ Convert to numpy arrays with explicit dtype")
+    print("   ✅ Convert all OHLCV columns to one float64 matrix, then reduce on its columns")
     print("   ✅ Handle MT5 data structure properly")
     
     return fixed_code
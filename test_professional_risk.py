@@ -13,22 +13,86 @@ Tests $10 fixed risk, one trade at a     print("🎉 Professional Risk Managemen
     print("   🔄 Signal prioritization queue")rity signals
 """
 
-import sys
+import cProfile
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pstats
 
-from src.config import Config
-from automated_trading_system import ContriarianTradingSystem
+from script_output import batched_stdout
+from src.config import get_config
 from datetime import datetime
+import functools
+import random
 import time
 
+import numpy as np
+
+# FAST_TESTS=1 runs the cheaper checks only part of the time (full runs stay exhaustive)
+FAST_TESTS = os.getenv('FAST_TESTS', '') == '1'
+
+# Function-call budget for building the trading system (about 800 today); catches
+# refactors that add hidden config reloads or MT5 round-trips to __init__
+MAX_INIT_CALLS = 5000
+
+# Professional risk settings checked by this script and test_updated_config
+PRO_RISK_SETTINGS = {
+    'FIXED_RISK_AMOUNT': 5.0,
+    'MAX_CONCURRENT_TRADES': 2,
+    'MAX_DAILY_DRAWDOWN': 20.0,
+    'MIN_SIGNAL_STRENGTH': 8.0,
+    'PRIORITY_SIGNAL_THRESHOLD': 9.0,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _system_class():
+    """Trading system class, imported on first use so the system and its ML stack
+    only load once a test needs them."""
+    from automated_trading_system import ContriarianTradingSystem
+    return ContriarianTradingSystem
+
+
+@functools.lru_cache(maxsize=1)
+def _system():
+    """Trading system shared by the tests below (constructed once)."""
+    return _system_class()()
+
+
+def _maybe(probability):
+    """Run the decorated test with the given probability in FAST_TESTS mode, always otherwise."""
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(*args, **kwargs):
+            if FAST_TESTS and random.random() >= probability:
+                print(f"\n⏭️ Skipped {test.__name__} (FAST_TESTS)")
+                return True
+            return test(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _assert_pro_config(config, expected):
+    """Check each expected setting, reporting every mismatch at once."""
+    mismatches = {name: getattr(config, name) for name, value in expected.items()
+                  if getattr(config, name) != value}
+    assert not mismatches, f"Unexpected settings {mismatches}, expected {expected}"
+
+
+def _reset_system(system):
+    """Clear the mutable trading state so each test starts fresh."""
+    system.signal_queue.clear()
+    system.active_trades.clear()
+    system.daily_pnl = 0.0
+    system.daily_trades_count = 0
+    return system
+
+
 def test_professional_risk_management():
     """Test the professional risk management features."""
     print("🧪 Testing Professional Risk Management System")
     print("=" * 60)
     
     # Load configuration
-    config = Config()
+    config = get_config()
     
     # Test 1: Configuration validation
     print("\n1️⃣ Configuration Validation:")
@@ -40,11 +104,7 @@ def test_professional_risk_management():
     
     # Test 2: Professional risk parameters
     print("\n2️⃣ Professional Risk Parameters:")
-    assert config.FIXED_RISK_AMOUNT == 5.0, "Fixed risk should be $5"
-    assert config.MAX_CONCURRENT_TRADES == 2, "Should allow 2 concurrent trades"
-    assert config.MAX_DAILY_DRAWDOWN == 20.0, "Max daily drawdown should be $20"
-    assert config.MIN_SIGNAL_STRENGTH == 8.0, "Min signal strength should be 8.0"
-    assert config.PRIORITY_SIGNAL_THRESHOLD == 9.0, "Priority threshold should be 9.0"
+    _assert_pro_config(config, PRO_RISK_SETTINGS)
     print("   ✅ All professional risk parameters validated!")
     
     # Test 3: Enhanced TP/SL levels
@@ -68,8 +128,15 @@ def test_professional_risk_management():
     # Test 5: Create system instance
     print("\n5️⃣ System Initialization:")
     try:
-        system = ContriarianTradingSystem()
+        _system_class()  # Module import stays outside the call budget
+        profiler = cProfile.Profile()
+        profiler.enable()
+        system = _reset_system(_system())
+        profiler.disable()
+        init_calls = pstats.Stats(profiler).total_calls
         print("   ✅ Trading system initialized successfully")
+        print(f"   📊 Init Function Calls: {init_calls:,} (budget {MAX_INIT_CALLS:,})")
+        assert init_calls < MAX_INIT_CALLS, f"init call-count regression: {init_calls}"
         print(f"   📊 Daily P&L: ${system.daily_pnl:.2f}")
         print(f"   📊 Daily Trades: {system.daily_trades_count}")
         print(f"   📊 Signal Queue: {len(system.signal_queue)} signals")
@@ -114,15 +181,14 @@ def test_professional_risk_management():
     ]
     
     # Add signals to queue
-    for signal in test_signals:
-        system._add_signal_to_queue(signal["symbol"], signal)
+    system._add_signals_bulk(test_signals)
     
     print(f"   📊 Added {len(test_signals)} test signals to queue")
     print(f"   📊 Queue size: {len(system.signal_queue)}")
     
     # Find best signal
     if system.signal_queue:
-        best_signal = max(system.signal_queue, key=lambda x: x['strength'])
+        best_signal = system.peek_best()
         print(f"   🏆 Best Signal: {best_signal['symbol']} (Strength: {best_signal['strength']:.1f})")
         print("   ✅ Signal prioritization working!")
     
@@ -139,6 +205,7 @@ def test_professional_risk_management():
     
     return True
 
+@_maybe(0.25)
 def test_signal_strength_scenarios():
     """Test different signal strength scenarios."""
     print("\n🧪 Testing Signal Strength Scenarios")
@@ -151,22 +218,22 @@ def test_signal_strength_scenarios():
         {"strength": 9.8, "should_trade": True, "reason": "Highest priority"},
     ]
     
-    config = Config()
+    config = get_config()
+    
+    # Evaluate every scenario in one vector compare
+    strengths = np.fromiter((s["strength"] for s in scenarios), dtype=np.float64, count=len(scenarios))
+    expected = np.fromiter((s["should_trade"] for s in scenarios), dtype=bool, count=len(scenarios))
+    meets_min = strengths >= config.MIN_SIGNAL_STRENGTH
+    is_priority = strengths >= config.PRIORITY_SIGNAL_THRESHOLD
     
     for i, scenario in enumerate(scenarios, 1):
-        strength = scenario["strength"]
-        should_trade = scenario["should_trade"]
-        reason = scenario["reason"]
-        
-        meets_min = strength >= config.MIN_SIGNAL_STRENGTH
-        is_priority = strength >= config.PRIORITY_SIGNAL_THRESHOLD
-        
-        print(f"{i}️⃣ Strength: {strength:.1f}/10")
-        print(f"   📊 Meets minimum ({config.MIN_SIGNAL_STRENGTH}): {meets_min}")
-        print(f"   🏆 Priority signal ({config.PRIORITY_SIGNAL_THRESHOLD}+): {is_priority}")
-        print(f"   ✅ Expected: {should_trade} - {reason}")
-        
-        assert meets_min == should_trade, f"Scenario {i} failed: expected {should_trade}"
+        print(f"{i}️⃣ Strength: {scenario['strength']:.1f}/10")
+        print(f"   📊 Meets minimum ({config.MIN_SIGNAL_STRENGTH}): {meets_min[i - 1]}")
+        print(f"   🏆 Priority signal ({config.PRIORITY_SIGNAL_THRESHOLD}+): {is_priority[i - 1]}")
+        print(f"   ✅ Expected: {scenario['should_trade']} - {scenario['reason']}")
+    
+    failed = np.flatnonzero(meets_min != expected)
+    assert failed.size == 0, f"Scenarios {(failed + 1).tolist()} failed: expected {expected[failed].tolist()}"
     
     print("✅ All signal strength scenarios validated!")
 
@@ -175,17 +242,18 @@ if __name__ == "__main__":
     print("=" * 70)
     
     try:
-        # Run main test
-        success = test_professional_risk_management()
-        
-        if success:
-            # Run signal strength tests
-            test_signal_strength_scenarios()
+        with batched_stdout():
+            # Run main test
+            success = test_professional_risk_management()
             
-            print("\n🎉 ALL TESTS PASSED! 🎉")
-            print("Professional risk management system is ready for live trading!")
-        else:
-            print("\n❌ TESTS FAILED!")
+            if success:
+                # Run signal strength tests
+                test_signal_strength_scenarios()
+                
+                print("\n🎉 ALL TESTS PASSED! 🎉")
+                print("Professional risk management system is ready for live trading!")
+            else:
+                print("\n❌ TESTS FAILED!")
             
     except Exception as e:
         print(f"\n❌ Test error: {e}")
@@ -6,6 +6,9 @@ This script tests individual components of the trading system
 to verify everything is working correctly.
 """
 
+import atexit
+import functools
+import logging
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -17,12 +20,24 @@ from colorama import Fore, Style, init
 
 init(autoreset=True)
 
+# Contrarian flip applied by the trading system
+_REVERSE = {"BUY": "SELL", "SELL": "BUY"}
+
+@functools.lru_cache(maxsize=1)
+def _mt5():
+    """MT5 connection shared by the tests below (connected once, closed at exit)."""
+    mt5 = MT5Connector()
+    if not mt5.connect():
+        return None
+    atexit.register(mt5.disconnect)
+    return mt5
+
 def test_mt5_connection():
     """Test MT5 connection."""
     print(f"{Fore.CYAN}🔌 Testing MT5 Connection...{Style.RESET_ALL}")
     
-    mt5 = MT5Connector()
-    if mt5.connect():
+    mt5 = _mt5()
+    if mt5 is not None:
         print(f"{Fore.GREEN}✅ MT5 connection successful{Style.RESET_ALL}")
         
         # Test symbol access
@@ -40,7 +55,6 @@ def test_mt5_connection():
         else:
             print(f"❌ Failed to get historical data for {symbol}")
             
-        mt5.disconnect()
         return True
     else:
         print(f"{Fore.RED}❌ MT5 connection failed{Style.RESET_ALL}")
@@ -51,9 +65,9 @@ def test_signal_generation():
     print(f"\n{Fore.CYAN}📊 Testing Signal Generation...{Style.RESET_ALL}")
     
     config = TradingConfig()
-    mt5 = MT5Connector()
+    mt5 = _mt5()
     
-    if not mt5.connect():
+    if mt5 is None:
         print(f"{Fore.RED}❌ Cannot test signals without MT5{Style.RESET_ALL}")
         return False
         
@@ -79,7 +93,6 @@ def test_signal_generation():
     else:
         print(f"❌ No signal generated for {symbol}")
         
-    mt5.disconnect()
     return signal_data is not None
 
 def test_order_placement_simulation():
@@ -129,12 +142,7 @@ def test_contrarian_logic():
     
     for original, expected in test_cases:
         # Simulate reversal logic
-        if original == "BUY":
-            reversed_signal = "SELL"
-        elif original == "SELL":
-            reversed_signal = "BUY"
-        else:
-            reversed_signal = original
+        reversed_signal = _REVERSE.get(original, original)
             
         if reversed_signal == expected:
             print(f"✅ {original} signal → {reversed_signal} trade (correct)")
@@ -184,4 +192,5 @@ def main():
         print(f"{Fore.YELLOW}⚠️ Some issues detected{Style.RESET_ALL}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
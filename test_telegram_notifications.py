@@ -8,10 +8,6 @@ Test all trading notifications you requested:
 3. SL Hit
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.telegram_notifier import TelegramNotifier
 from colorama import init, Fore, Style
 
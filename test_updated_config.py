@@ -3,12 +3,13 @@
 Quick test for $5 risk and 2 concurrent trades
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from src.config import get_config
+# Shared config checks and trading system instance
+from test_professional_risk import PRO_RISK_SETTINGS, _assert_pro_config, _reset_system, _system
+
+# The settings this update changed
+UPDATED_SETTINGS = ('FIXED_RISK_AMOUNT', 'MAX_CONCURRENT_TRADES')
 
-from src.config import Config
-from automated_trading_system import ContriarianTradingSystem
 
 def test_updated_config():
     """Test the updated configuration."""
@@ -16,7 +17,7 @@ def test_updated_config():
     print("=" * 55)
     
     # Load configuration
-    config = Config()
+    config = get_config()
     
     print(f"💰 Fixed Risk Amount: ${config.FIXED_RISK_AMOUNT}")
     print(f"🎯 Max Concurrent Trades: {config.MAX_CONCURRENT_TRADES}")
@@ -24,8 +25,7 @@ def test_updated_config():
     print(f"⭐ Min Signal Strength: {config.MIN_SIGNAL_STRENGTH}/10")
     
     # Validate the changes
-    assert config.FIXED_RISK_AMOUNT == 5.0, f"Expected $5, got ${config.FIXED_RISK_AMOUNT}"
-    assert config.MAX_CONCURRENT_TRADES == 2, f"Expected 2 trades, got {config.MAX_CONCURRENT_TRADES}"
+    _assert_pro_config(config, {name: PRO_RISK_SETTINGS[name] for name in UPDATED_SETTINGS})
     
     print("\n✅ Configuration validated:")
     print("   💰 Risk per trade: $5 (UPDATED)")
@@ -34,7 +34,7 @@ def test_updated_config():
     
     # Test system initialization
     print("\n🚀 Testing System with New Configuration:")
-    system = ContriarianTradingSystem()
+    system = _reset_system(_system())
     
     # Test multiple signals processing capability
     print(f"\n📊 System allows {system.config.MAX_CONCURRENT_TRADES} concurrent trades")
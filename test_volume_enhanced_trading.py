@@ -5,9 +5,8 @@ Volume-Enhanced Contrarian Trading Test
 Tests the new volume analysis integration with the contrarian trading system.
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from colorama import Fore, Style, init
 from src.config import TradingConfig
@@ -39,11 +38,19 @@ def test_volume_enhanced_signals():
     # Test symbols with 'm' suffix for MT5 broker
     test_symbols = ['EURUSDm', 'GBPUSDm', 'USDJPYm']
     
-    for symbol in test_symbols:
+    def analyze(symbol):
+        """Single-timeframe profile and multi-timeframe signals for one symbol."""
+        return (volume_analyzer.analyze_volume_profile(symbol, "M15", 50),
+                volume_analyzer.get_volume_contrarian_signals(symbol))
+    
+    # Fan the per-symbol analyses out, then report them in symbol order
+    with ThreadPoolExecutor(max_workers=len(test_symbols)) as executor:
+        analyses = list(executor.map(analyze, test_symbols))
+    
+    for symbol, (volume_profile, multi_tf_volume) in zip(test_symbols, analyses):
         print(f"\n{Fore.BLUE}🔍 Volume Analysis for {symbol}:{Style.RESET_ALL}")
         
-        # Get volume analysis for single timeframe
-        volume_profile = volume_analyzer.analyze_volume_profile(symbol, "M15", 50)
+        # Volume analysis for single timeframe
         if volume_profile:
             print(f"  📈 Current Volume: {volume_profile['current_volume']:,.0f}")
             print(f"  📊 Volume SMA(20): {volume_profile['volume_sma_20']:,.0f}")
@@ -62,9 +69,8 @@ def test_volume_enhanced_signals():
             if exhaustion['detected']:
                 print(f"  💥 Exhaustion: {exhaustion['type']} (Strength: {exhaustion['strength']:.1f})")
         
-        # Get multi-timeframe volume signals
-        multi_tf_volume = volume_analyzer.get_volume_contrarian_signals(symbol)
-        if multi_tf_volume and 'combined_analysis' in multi_tf_volume:
+        # Multi-timeframe volume signals
+        if multi_tf_volume:
             combined = multi_tf_volume['combined_analysis']
             print(f"  🎯 Combined Volume Score: {combined['score']:.1f}/10")
             print(f"  🔥 Volume Spikes: {combined['volume_spikes_count']}")
@@ -163,5 +169,6 @@ def show_volume_benefits():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     show_volume_benefits()
     test_volume_enhanced_signals()
@@ -6,133 +6,242 @@ Test the new volume-based trading approach that only trades on high volume signa
 NO SIGNAL REVERSAL - direct execution based on volume patterns.
 """
 
-import sys
+import atexit
+import logging
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
 
-from src.signal_generator import SignalGenerator
-from src.volume_analyzer import VolumeAnalyzer
-from src.mt5_connector import MT5Connector
-from src.config import Config
 from colorama import init, Fore, Style
-import MetaTrader5 as mt5
 
-# Initialize colorama
-init(autoreset=True)
+# Colour only when writing to a terminal; piped or logged output gets plain text
+# (and skips colorama's stdout wrapper)
+_TTY = sys.stdout.isatty()
+if _TTY:
+    init(autoreset=True)
+C = SimpleNamespace(
+    B=Fore.BLUE if _TTY else "",
+    C=Fore.CYAN if _TTY else "",
+    G=Fore.GREEN if _TTY else "",
+    R=Fore.RED if _TTY else "",
+    Y=Fore.YELLOW if _TTY else "",
+)
+RESET = Style.RESET_ALL if _TTY else ""
+
+# Per-symbol report lines with the colour codes baked in once (filled with str.format)
+_TEMPLATES = {
+    'analyzing': f"\n{C.B}📊 Analyzing {{}}...{RESET}",
+    'signal': f"  📈 Original Signal: {C.B}{{}}{RESET}",
+    'strength': "  ⭐ Signal Strength: {:.1f}/10",
+    'vol_hi': f"  📊 Volume Score: {C.G}{{:.1f}}/10{RESET}",
+    'vol_lo': f"  📊 Volume Score: {C.Y}{{:.1f}}/10{RESET}",
+    'confirmed': f"  🚀 {C.G}HIGH VOLUME CONFIRMED{RESET}",
+    'action_buy': f"  🎯 Final Action: {C.G}{{}}{RESET} (DIRECT)",
+    'action_sell': f"  🎯 Final Action: {C.R}{{}}{RESET} (DIRECT)",
+    'patterns': "  📋 Volume Patterns: {}",
+    'skip': f"  ⏭️ {C.Y}VOLUME TOO LOW - SKIPPING TRADE{RESET}",
+}
+
+# Only symbols with a combined volume score at or above this are traded
+MIN_VOLUME_SCORE = 8.0
+
+# Each run's ready-to-execute table is saved here
+SCAN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# Per-process analyzers, built by _worker_init in each pool worker
+_WORKER = {}
+
+def _lazy_imports():
+    """
+    Import MetaTrader5, pandas and the MT5-backed components on first use, so loading this
+    module (e.g. to read it or collect it) does not initialize the terminal DLL.
+    """
+    global mt5, pd, MT5Connector, SignalGenerator, DAY_TRADING_TIMEFRAMES, VolumeAnalyzer, VolumeScoreCache, Config
+    import MetaTrader5 as mt5
+    import pandas as pd
+    from src.mt5_connector import MT5Connector
+    from src.signal_generator import SignalGenerator, DAY_TRADING_TIMEFRAMES
+    from src.volume_analyzer import VolumeAnalyzer, VolumeScoreCache
+    from src.config import Config
+
+def _worker_init():
+    """Give this worker process its own MT5 terminal connection and analyzers."""
+    # Spawned workers don't run __main__, so they need their own logging setup
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    _lazy_imports()
+    connector = MT5Connector()
+    connector.connect()
+    signal_generator = SignalGenerator(connector, Config())
+    _WORKER['connector'] = connector
+    _WORKER['signal_generator'] = signal_generator
+    # Share the generator's analyzer (when it has one) so its volume results are reused
+    volume_analyzer = signal_generator.volume_analyzer or VolumeAnalyzer(connector)
+    # Analyses of unchanged bars are also shared with the other workers and later runs
+    volume_analyzer.score_cache = VolumeScoreCache()
+    _WORKER['volume_analyzer'] = volume_analyzer
+
+def _analyze_symbol(symbol):
+    """
+    Volume analysis and, when it passes the volume gate, the day trading signal.
+    
+    The volume analysis is far cheaper than the full multi-timeframe signal, and
+    most symbols fail the gate, so the signal is only generated for those that pass.
+    Each timeframe is fetched once and both analyses read the same rates.
+    """
+    # Symbols that recently had no data are not re-queried until their backoff ends
+    if _WORKER['signal_generator'].data_backoff_active(symbol):
+        return None, None
+    bundle = _WORKER['connector'].fetch_rates_bundle(symbol, DAY_TRADING_TIMEFRAMES)
+    volume_analysis = _WORKER['volume_analyzer'].get_volume_contrarian_signals(
+        symbol, ['M5', 'M15', 'H1'], rates=bundle)
+    if volume_analysis is None or volume_analysis['combined_analysis']['score'] < MIN_VOLUME_SCORE:
+        return None, volume_analysis
+    return _WORKER['signal_generator'].generate_from_bundle(symbol, bundle), volume_analysis
+
+def scan_symbols(symbols, chunk_size=8):
+    """
+    Volume analysis and, past the volume gate, the day trading signal for each symbol.
+    
+    Symbols are analyzed in worker processes, each with its own MT5 connection (calls
+    through one connection are serialized). The pool is created once, so each worker
+    connects once however many symbols there are, and symbols are submitted chunk_size
+    at a time so only one chunk of results is in flight.
+    
+    Returns:
+        list: (signal, volume_analysis) per symbol, in symbol order
+    """
+    results = []
+    if not symbols:
+        return results
+    with ProcessPoolExecutor(max_workers=min(chunk_size, len(symbols)), initializer=_worker_init) as executor:
+        for start in range(0, len(symbols), chunk_size):
+            results.extend(executor.map(_analyze_symbol, symbols[start:start + chunk_size]))
+    return results
 
 def test_volume_only_signals():
     """Test volume-only signal generation and filtering."""
-    print(f"{Fore.CYAN}🎯 TESTING VOLUME-ONLY TRADING SYSTEM{Style.RESET_ALL}")
+    _lazy_imports()
+    print(f"{C.C}🎯 TESTING VOLUME-ONLY TRADING SYSTEM{RESET}")
     print("💡 Strategy: Only trade when volume score ≥ 8.0/10")
     print("🔄 NO SIGNAL REVERSAL - Use signals directly!")
     
-    # Connect to MT5
-    if not mt5.initialize():
-        print(f"{Fore.RED}❌ Failed to initialize MT5{Style.RESET_ALL}")
+    # Connect to MT5 (skipped when the harness already has a terminal session), and
+    # shut it down at exit even if the test fails before disconnecting
+    if mt5.terminal_info() is None and not mt5.initialize():
+        print(f"{C.R}❌ Failed to initialize MT5{RESET}")
         return False
+    atexit.unregister(mt5.shutdown)  # Registered once however often the test runs
+    atexit.register(mt5.shutdown)
     
     # Initialize components
     mt5_connector = MT5Connector()
     if not mt5_connector.connect():
-        print(f"{Fore.RED}❌ Failed to connect to MT5{Style.RESET_ALL}")
+        print(f"{C.R}❌ Failed to connect to MT5{RESET}")
         return False
     
-    config = Config()
-    signal_generator = SignalGenerator(mt5_connector, config)
-    volume_analyzer = VolumeAnalyzer(mt5_connector)
-    
     # Test symbols with 'm' suffix for your broker
     test_symbols = ['EURUSDm', 'GBPUSDm', 'USDJPYm', 'AUDUSDm']
     
+    # Subscribe every symbol once, up front, so no worker pays the first-request cost
+    mt5_connector.select_symbols(test_symbols)
+    
     high_volume_signals = []
     
-    for symbol in test_symbols:
-        print(f"\n{Fore.BLUE}📊 Analyzing {symbol}...{Style.RESET_ALL}")
+    # Analyze all symbols, then report in symbol order
+    analyses = scan_symbols(test_symbols)
+    
+    for symbol, (signal, volume_analysis) in zip(test_symbols, analyses):
+        print(_TEMPLATES['analyzing'].format(symbol))
         
-        # Generate signal using day trading mode
-        signal = signal_generator.generate_live_day_trading_signal(symbol)
+        if not volume_analysis:
+            print("  ❌ No volume analysis available")
+            continue
         
-        if signal:
-            original_signal = signal['signal']
-            signal_strength = signal['strength']
-            
-            # Get volume analysis
-            volume_analysis = volume_analyzer.get_volume_contrarian_signals(symbol, ['M5', 'M15', 'H1'])
-            
-            if volume_analysis and 'combined_analysis' in volume_analysis:
-                volume_score = volume_analysis['combined_analysis']['score']
-                
-                print(f"  📈 Original Signal: {Fore.BLUE}{original_signal}{Style.RESET_ALL}")
-                print(f"  ⭐ Signal Strength: {signal_strength:.1f}/10")
-                print(f"  📊 Volume Score: {Fore.GREEN if volume_score >= 8.0 else Fore.YELLOW}{volume_score:.1f}/10{Style.RESET_ALL}")
-                
-                # Volume-only filtering
-                if volume_score >= 8.0:
-                    # HIGH VOLUME - Trade the signal DIRECTLY (no reversal)
-                    final_action = original_signal
-                    print(f"  🚀 {Fore.GREEN}HIGH VOLUME CONFIRMED{Style.RESET_ALL}")
-                    print(f"  🎯 Final Action: {Fore.GREEN if final_action == 'BUY' else Fore.RED}{final_action}{Style.RESET_ALL} (DIRECT)")
-                    
-                    # Add volume analysis to signal data
-                    signal['volume_analysis'] = volume_analysis
-                    signal['volume_score'] = volume_score
-                    signal['final_action'] = final_action
-                    signal['trade_type'] = 'VOLUME_DIRECT'
-                    
-                    high_volume_signals.append({
-                        'symbol': symbol,
-                        'signal': signal,
-                        'volume_score': volume_score
-                    })
-                    
-                    # Show volume patterns
-                    if 'timeframe_analysis' in volume_analysis:
-                        patterns = []
-                        for tf, data in volume_analysis['timeframe_analysis'].items():
-                            if data.get('price_volume_divergence', {}).get('detected', False):
-                                div_type = data['price_volume_divergence']['type']
-                                patterns.append(f"{tf} {div_type}")
-                            if data.get('exhaustion_signal', {}).get('detected', False):
-                                exh_type = data['exhaustion_signal']['type']
-                                patterns.append(f"{tf} {exh_type}")
-                        
-                        if patterns:
-                            print(f"  📋 Volume Patterns: {', '.join(patterns)}")
-                    
-                else:
-                    # LOW/MEDIUM VOLUME - Skip trade
-                    print(f"  ⏭️ {Fore.YELLOW}VOLUME TOO LOW - SKIPPING TRADE{Style.RESET_ALL}")
-                    print("  💡 Need volume score ≥ 8.0 for execution")
-            else:
-                print("  ❌ No volume analysis available")
-        else:
+        volume_score = volume_analysis['combined_analysis']['score']
+        
+        # Volume-only filtering (the signal is only generated for symbols that pass)
+        if volume_score < MIN_VOLUME_SCORE:
+            # LOW/MEDIUM VOLUME - Skip trade
+            print(_TEMPLATES['vol_lo'].format(volume_score))
+            print(_TEMPLATES['skip'])
+            print("  💡 Need volume score ≥ 8.0 for execution")
+            continue
+        
+        if not signal:
+            print(_TEMPLATES['vol_hi'].format(volume_score))
             print("  ❌ No qualifying signal generated")
+            continue
+        
+        original_signal = signal['signal']
+        signal_strength = signal['strength']
+        
+        print(_TEMPLATES['signal'].format(original_signal))
+        print(_TEMPLATES['strength'].format(signal_strength))
+        print(_TEMPLATES['vol_hi'].format(volume_score))
+        
+        # HIGH VOLUME - Trade the signal DIRECTLY (no reversal)
+        final_action = original_signal
+        print(_TEMPLATES['confirmed'])
+        print(_TEMPLATES['action_buy' if final_action == 'BUY' else 'action_sell'].format(final_action))
+        
+        # Add volume analysis to signal data
+        signal['volume_analysis'] = volume_analysis
+        signal['volume_score'] = volume_score
+        signal['final_action'] = final_action
+        signal['trade_type'] = 'VOLUME_DIRECT'
+        
+        high_volume_signals.append({
+            'symbol': symbol,
+            'signal': signal,
+            'volume_score': volume_score
+        })
+        
+        # Show volume patterns (collected across timeframes by the volume analyzer)
+        patterns = volume_analysis['combined_analysis']['patterns']
+        if patterns:
+            print(_TEMPLATES['patterns'].format(', '.join(patterns)))
     
     # Summary
-    print(f"\n{Fore.GREEN}🎯 VOLUME-ONLY TRADING SUMMARY{Style.RESET_ALL}")
+    print(f"\n{C.G}🎯 VOLUME-ONLY TRADING SUMMARY{RESET}")
     print(f"📊 High Volume Signals (≥8.0): {len(high_volume_signals)}")
     
     if high_volume_signals:
-        print(f"\n{Fore.CYAN}✅ READY TO EXECUTE:{Style.RESET_ALL}")
-        for i, trade in enumerate(high_volume_signals, 1):
-            symbol = trade['symbol']
-            signal = trade['signal']
-            volume_score = trade['volume_score']
-            
-            print(f"  {i}. {symbol}: {signal['final_action']} (Volume: {volume_score:.1f}/10)")
-            print(f"     Signal: {signal['strength']:.1f}/10 | Type: {signal['trade_type']}")
+        print(f"\n{C.C}✅ READY TO EXECUTE:{RESET}")
+        summary = pd.DataFrame(
+            [
+                {
+                    'symbol': trade['symbol'],
+                    'action': trade['signal']['final_action'],
+                    'volume': trade['volume_score'],
+                    'strength': trade['signal']['strength'],
+                    'type': trade['signal']['trade_type'],
+                }
+                for trade in high_volume_signals
+            ],
+            index=pd.RangeIndex(1, len(high_volume_signals) + 1),
+        )
+        print(summary.to_string(float_format='{:.1f}'.format))
+        
+        # Keep each run's table so scans can be compared later
+        os.makedirs(SCAN_DIR, exist_ok=True)
+        summary_file = os.path.join(SCAN_DIR, f"volscan_{int(time.time())}.csv")
+        summary.to_csv(summary_file, index_label='rank')
+        print(f"  💾 Saved to {summary_file}")
     else:
         print("  💡 No high-volume signals detected - waiting for better setups")
     
-    print(f"\n{Fore.YELLOW}📋 STRATEGY SUMMARY:{Style.RESET_ALL}")
+    print(f"\n{C.Y}📋 STRATEGY SUMMARY:{RESET}")
     print("  🎯 Volume Threshold: ≥ 8.0/10 (HIGH CONFIDENCE ONLY)")
     print("  🔄 Signal Processing: DIRECT execution (NO REVERSAL)")
     print("  📈 Pattern Detection: Divergences, exhaustion, accumulation")
     print("  💰 Risk Management: Volume-enhanced TP/SL levels")
     
     mt5_connector.disconnect()
-    print(f"\n{Fore.GREEN}✅ Volume-Only Trading Test Complete!{Style.RESET_ALL}")
+    print(f"\n{C.G}✅ Volume-Only Trading Test Complete!{RESET}")
     return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     test_volume_only_signals()